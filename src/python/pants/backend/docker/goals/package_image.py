@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 import os
 import re
-from collections.abc import Iterator
-from dataclasses import asdict, dataclass
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, replace
 from functools import partial
 from itertools import chain
 from typing import Literal, cast
@@ -69,12 +70,13 @@ from pants.engine.intrinsics import (
     digest_to_snapshot,
     execute_process,
 )
-from pants.engine.process import Process, ProcessExecutionFailure
+from pants.engine.process import Process, ProcessConcurrency, ProcessExecutionFailure
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import Field, InvalidFieldException, Target, WrappedTargetRequest
 from pants.engine.unions import UnionMembership, UnionRule
 from pants.option.global_options import GlobalOptions, KeepSandboxes
 from pants.util.frozendict import FrozenDict
+from pants.util.persistent_cache import PersistentCache, fingerprint_strings
 from pants.util.strutil import bullet_list, softwrap
 from pants.util.value_interpolation import InterpolationContext, InterpolationError
 
@@ -736,7 +738,43 @@ async def build_docker_image(
                 )
 
     build_process = await get_docker_image_build_process(field_set, **implicitly())
-    result = await execute_process(build_process.process, **implicitly())
+
+    build_context_cache: PersistentCache | None = None
+    build_context_key = ""
+    if (
+        options.build_context_cache
+        and not options.build_no_cache
+        and not _always_pulls(build_process.process.argv)
+        and not build_process.captured_outputs
+        and not field_set.pushes_on_package()
+    ):
+        build_context_cache = PersistentCache(
+            global_options.pants_workdir,
+            "docker_build_contexts",
+            version=_BUILD_CONTEXT_CACHE_VERSION,
+        )
+        build_context_key = _build_context_cache_key(build_process.process)
+        cached_image_id = build_context_cache.load_bytes(build_context_key)
+        if cached_image_id is not None and await _is_image_present(
+            docker, build_process, cached_image_id.decode()
+        ):
+            logger.debug(
+                f"Reusing Docker image {cached_image_id.decode()} for {field_set.address}, "
+                "as its build context is unchanged."
+            )
+            return await _built_docker_image_package(
+                field_set, build_process, cached_image_id.decode()
+            )
+
+    build_concurrency = _build_concurrency(
+        options.build_parallelism, global_options.process_execution_local_parallelism
+    )
+    result = await execute_process(
+        replace(build_process.process, concurrency=build_concurrency)
+        if build_concurrency
+        else build_process.process,
+        **implicitly(),
+    )
 
     if result.exit_code != 0:
         msg = f"Docker build failed for `docker_image` {field_set.address}."
@@ -798,6 +836,67 @@ async def build_docker_image(
         )
 
     image_id = parse_image_id_from_docker_build_output(docker, result.stdout, result.stderr)
+    if build_context_cache is not None and image_id != "<unknown>":
+        build_context_cache.store_bytes(build_context_key, image_id.encode())
+    return await _built_docker_image_package(field_set, build_process, image_id)
+
+
+_BUILD_CONTEXT_CACHE_VERSION = 1
+
+
+def _build_context_cache_key(process: Process) -> str:
+    # The build command line holds the Dockerfile, build args, tags and build options, while the
+    # input digest is the build context itself.
+    return fingerprint_strings(
+        (
+            *process.argv,
+            *(f"{name}={value}" for name, value in sorted(process.env.items())),
+            process.input_digest.fingerprint,
+        )
+    )
+
+
+def _build_concurrency(
+    build_parallelism: int | None, local_parallelism: int
+) -> ProcessConcurrency | None:
+    """The share of the engine's local process slots to reserve for each `docker build`, so that
+    at most `build_parallelism` builds run at once."""
+    if not build_parallelism:
+        return None
+    return ProcessConcurrency.exactly(max(1, math.ceil(local_parallelism / build_parallelism)))
+
+
+def _always_pulls(argv: Iterable[str]) -> bool:
+    """Whether the build pulls newer versions of its base images, e.g. due to the `pull` field or
+    `--pull=always` in the extra build options, in which case an unchanged build context does not
+    mean an unchanged image."""
+    for arg in argv:
+        if arg == "--pull":
+            return True
+        if arg.startswith("--pull="):
+            value = arg[len("--pull=") :].lower()
+            if value not in ("false", "0", "never", "missing"):
+                return True
+    return False
+
+
+async def _is_image_present(
+    docker: DockerBinary, build_process: DockerImageBuildProcess, image_id: str
+) -> bool:
+    """Check that the image is still in the local image store, and that all of the tags of the
+    image to build still refer to it."""
+    result = await execute_process(
+        docker.inspect_image_ids(
+            (image_id, *build_process.tags), env=build_process.context.build_env.environment
+        ),
+        **implicitly(),
+    )
+    return result.exit_code == 0 and len(set(result.stdout.decode().split())) == 1
+
+
+async def _built_docker_image_package(
+    field_set: DockerPackageFieldSet, build_process: DockerImageBuildProcess, image_id: str
+) -> BuiltPackage:
     metadata_filename = field_set.output_path.value_or_default(file_ending="docker-info.json")
     metadata = DockerInfoV1.serialize(build_process.image_refs, image_id=image_id)
     digest = await create_digest(CreateDigest([FileContent(metadata_filename, metadata)]))
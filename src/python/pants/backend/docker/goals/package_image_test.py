@@ -25,6 +25,7 @@ from pants.backend.docker.goals.package_image import (
     GetImageRefsRequest,
     ImageRefRegistry,
     ImageRefTag,
+    _always_pulls,
     _docker_build_captured_output_path,
     build_docker_image,
     get_docker_image_build_process,
@@ -33,6 +34,7 @@ from pants.backend.docker.goals.package_image import (
     rules,
 )
 from pants.backend.docker.package_types import (
+    BuiltDockerImage,
     DockerPushOnPackageBehavior,
     DockerPushOnPackageException,
 )
@@ -78,6 +80,7 @@ from pants.engine.platform import Platform
 from pants.engine.process import (
     FallibleProcessResult,
     Process,
+    ProcessConcurrency,
     ProcessExecutionEnvironment,
     ProcessExecutionFailure,
     ProcessResultMetadata,
@@ -161,6 +164,8 @@ def _setup_docker_options(rule_runner: RuleRunner, options: dict | None) -> Dock
         opts.setdefault("env_vars", [])
         opts.setdefault("suggest_renames", True)
         opts.setdefault("push_on_package", DockerPushOnPackageBehavior.WARN)
+        opts.setdefault("build_context_cache", False)
+        opts.setdefault("build_parallelism", None)
         return create_subsystem(DockerOptions, **opts)
     else:
         return rule_runner.request(DockerOptions, [])
@@ -1013,6 +1018,134 @@ def test_build_docker_image(rule_runner: RuleRunner) -> None:
     assert metadata["registries"][0]["tags"][0]["tag"] == "1.2.3"
 
 
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (("docker", "build", "--tag", "img1:1.2.3", "."), False),
+        (("docker", "build", "--pull=True", "."), True),
+        (("docker", "build", "--pull=always", "."), True),
+        (("docker", "build", "--pull", "."), True),
+        (("docker", "build", "--pull=False", "."), False),
+        (("podman", "build", "--pull=missing", "."), False),
+    ],
+)
+def test_always_pulls(argv: tuple[str, ...], expected: bool) -> None:
+    # Builds which pull newer base images are never served from the build context cache.
+    assert _always_pulls(argv) is expected
+
+
+@pytest.mark.parametrize(
+    "build_parallelism, expected_concurrency",
+    [(None, None), (2, ProcessConcurrency.exactly(4)), (16, ProcessConcurrency.exactly(1))],
+)
+def test_build_docker_image_reuses_unchanged_build_context(
+    rule_runner: RuleRunner,
+    build_parallelism: int | None,
+    expected_concurrency: ProcessConcurrency | None,
+) -> None:
+    rule_runner.set_options(["--process-execution-local-parallelism=8"])
+    rule_runner.write_files(
+        {"docker/test/BUILD": 'docker_image(name="img1", image_tags=["1.2.3"])'}
+    )
+    tgt = rule_runner.get_target(Address("docker/test", target_name="img1"))
+    under_test_fs = DockerPackageFieldSet.create(tgt)
+
+    build_process = DockerImageBuildProcess(
+        process=Process(
+            argv=("/dummy/docker", "build", "--tag", "img1:1.2.3", "--file", "Dockerfile", "."),
+            description="docker build",
+            input_digest=EMPTY_DIGEST,
+        ),
+        context=DockerBuildContext.create(
+            snapshot=EMPTY_SNAPSHOT,
+            upstream_image_ids=[],
+            dockerfile_info=DockerfileInfo(tgt.address, digest=EMPTY_DIGEST, source="Dockerfile"),
+            build_args=DockerBuildArgs(()),
+            build_env=DockerBuildEnvironment.create({}),
+        ),
+        context_root=".",
+        image_refs=DockerImageRefs([]),
+        tags=("img1:1.2.3",),
+    )
+    executed: list[tuple[str, ...]] = []
+    build_concurrencies: list[ProcessConcurrency | None] = []
+    image_present = True
+
+    def mock_execute_process(process: Process) -> FallibleProcessResult:
+        executed.append(process.argv)
+        if process.argv[1] == "build":
+            build_concurrencies.append(process.concurrency)
+        if process.argv[1] != "image":
+            exit_code, stdout = 0, b"Successfully built abc123\n"
+        elif image_present:
+            exit_code, stdout = 0, b"sha256:abc123\nsha256:abc123\n"
+        else:
+            exit_code, stdout = 1, b""
+        return FallibleProcessResult(
+            exit_code=exit_code,
+            stdout=stdout,
+            stderr=b"",
+            stdout_digest=EMPTY_FILE_DIGEST,
+            stderr_digest=EMPTY_FILE_DIGEST,
+            output_digest=EMPTY_DIGEST,
+            metadata=ProcessResultMetadata(
+                0,
+                ProcessExecutionEnvironment(
+                    environment_name=None,
+                    platform=Platform.create_for_localhost().value,
+                    docker_image=None,
+                    remote_execution=False,
+                    remote_execution_extra_platform_properties=[],
+                    execute_in_workspace=False,
+                    keep_sandboxes="never",
+                ),
+                "ran_locally",
+                0,
+            ),
+        )
+
+    def build() -> BuiltPackage:
+        return run_rule_with_mocks(
+            build_docker_image,
+            rule_args=[
+                under_test_fs,
+                _setup_docker_options(
+                    rule_runner,
+                    dict(build_context_cache=True, build_parallelism=build_parallelism),
+                ),
+                rule_runner.request(GlobalOptions, []),
+                DockerBinary("/dummy/docker"),
+                KeepSandboxes.never,
+            ],
+            mock_calls={
+                "pants.backend.docker.goals.package_image.get_docker_image_build_process": lambda _: build_process,
+                "pants.engine.intrinsics.execute_process": mock_execute_process,
+                "pants.engine.intrinsics.create_digest": lambda _: EMPTY_DIGEST,
+            },
+            show_warnings=False,
+        )
+
+    def image_id(built: BuiltPackage) -> str | None:
+        artifact = built.artifacts[0]
+        assert isinstance(artifact, BuiltDockerImage)
+        return artifact.image_id
+
+    assert image_id(build()) == "abc123"
+    assert [argv[1] for argv in executed] == ["build"]
+    # Each build reserves a share of the engine's process slots, to bound concurrent builds.
+    assert build_concurrencies == [expected_concurrency]
+
+    executed.clear()
+    assert image_id(build()) == "abc123"
+    assert [argv[1] for argv in executed] == ["image"]
+    assert executed[0][-2:] == ("abc123", "img1:1.2.3")
+
+    executed.clear()
+    image_present = False
+    assert image_id(build()) == "abc123"
+    assert [argv[1] for argv in executed] == ["image", "build"]
+
+
 def test_build_docker_image_packages_local_output_digest(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
@@ -13,6 +13,7 @@ from pants.option.option_types import (
     BoolOption,
     DictOption,
     EnumOption,
+    IntOption,
     ShellStrListOption,
     StrListOption,
     StrOption,
@@ -229,6 +230,37 @@ class DockerOptions(Subsystem):
         default=False,
         help="Whether to log the Docker output to the console. If false, only the image ID is logged.",
     )
+    build_context_cache = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, remember the ID of the image built from each Docker build context, and skip
+            `docker build` when the context digest, Dockerfile, build arguments and build options
+            are unchanged and the image is still present with all its tags in the local image
+            store.
+
+            Images that capture build outputs, push on package, pull newer base images (with the
+            `pull` field or `--pull=always` in the extra build options) or are built with
+            `[docker].build_no_cache` are always built.
+            """
+        ),
+        advanced=True,
+    )
+    build_parallelism = IntOption(
+        default=None,
+        help=softwrap(
+            """
+            The maximum number of `docker build` processes to run at once.
+
+            Each build reserves an equal share of the `[GLOBAL].process_execution_local_parallelism`
+            slots of the engine's process scheduler, so the limit applies across all of the images
+            built by a run. Images are still built in dependency order, each as soon as its base
+            images are built and a slot is free. When unset, a build reserves one slot, like any
+            other process.
+            """
+        ),
+        advanced=True,
+    )
     run_args = ShellStrListOption(
         default=["--interactive", "--tty"] if sys.stdout.isatty() else [],
         help=softwrap(
@@ -120,6 +120,17 @@ class DockerBinary(BinaryPath):
             immutable_input_digests=self.extra_input_digests,
         )
 
+    def inspect_image_ids(
+        self, image_refs: tuple[str, ...], env: Mapping[str, str] | None = None
+    ) -> Process:
+        return Process(
+            argv=(self.path, "image", "inspect", "--format", "{{.Id}}", *image_refs),
+            cache_scope=ProcessCacheScope.PER_SESSION,
+            description=f"Inspecting docker image {image_refs[0]}",
+            env=self._get_process_environment(env or {}),
+            immutable_input_digests=self.extra_input_digests,
+        )
+
     def run_image(
         self,
         tag: str,
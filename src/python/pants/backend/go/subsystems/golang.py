@@ -239,6 +239,20 @@ class GolangSubsystem(Subsystem):
         ),
         advanced=True,
     )
+    batch_package_analysis = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, analyze the sources of all first-party `go_package` targets of a `go_mod`
+            with one run of the package analyzer, rather than one run per package.
+
+            This saves thousands of short-lived processes in large modules, but the analysis of
+            every package in the module is redone whenever the sources of any package in it
+            change.
+            """
+        ),
+        advanced=True,
+    )
     tailor_go_mod_targets = BoolOption(
         default=True,
         help=softwrap(
@@ -9,6 +9,7 @@ from collections import deque
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import PurePath
+from typing import Any
 
 from pants.backend.go.subsystems.golang import GolangSubsystem
 from pants.backend.go.util_rules import cgo, coverage, import_analysis, stdlib_archives
@@ -57,6 +58,7 @@ from pants.engine.fs import (
     MergeDigests,
     PathGlobs,
 )
+from pants.engine.internals.session import RunId
 from pants.engine.intrinsics import (
     add_prefix,
     create_digest,
@@ -250,12 +252,20 @@ class FallibleBuildGoPackageRequest(EngineAwareParameter, EngineAwareReturnType)
     exit_code: int = 0
     stderr: str | None = None
     dependency_failed: bool = False
+    # Where the result of the compile process came from (e.g. `ran` or `hit_locally`), if the
+    # package was compiled.
+    compile_source: str | None = dataclasses.field(default=None, compare=False)
 
     def level(self) -> LogLevel:
         return (
             LogLevel.ERROR if self.exit_code != 0 and not self.dependency_failed else LogLevel.DEBUG
         )
 
+    def metadata(self) -> dict[str, Any] | None:
+        if self.compile_source is None:
+            return None
+        return {"go_compile_source": self.compile_source}
+
     def message(self) -> str:
         message = self.import_path
         message += (
@@ -624,7 +634,7 @@ async def _gather_transitive_prebuilt_object_files(
 # (triggered by `FallibleBuiltGoPackage` subclassing `EngineAwareReturnType`).
 @rule(desc="Compile with Go", level=LogLevel.DEBUG)
 async def build_go_package(
-    request: BuildGoPackageRequest, go_root: GoRoot, golang: GolangSubsystem
+    request: BuildGoPackageRequest, go_root: GoRoot, golang: GolangSubsystem, run_id: RunId
 ) -> FallibleBuiltGoPackage:
     # Standard library packages on compatible build configurations short-circuit to the
     # pre-compiled archives from the one-shot `go install std` harvest, skipping
@@ -1103,7 +1113,11 @@ async def build_go_package(
         transitive_pkg_archives=FrozenDict(transitive_pkg_archives),
         coverage_metadata=coverage_metadata,
     )
-    return FallibleBuiltGoPackage(output, request.import_path)
+    return FallibleBuiltGoPackage(
+        output,
+        request.import_path,
+        compile_source=compile_result.metadata.source(run_id).value,
+    )
 
 
 @rule
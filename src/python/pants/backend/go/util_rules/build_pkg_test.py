@@ -270,6 +270,49 @@ def test_build_invalid_pkg(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_build_pkg_compile_source(rule_runner: RuleRunner) -> None:
+    digest = rule_runner.make_snapshot(
+        {
+            "f.go": dedent(
+                """\
+                package pkg
+
+                func Quote(s string) string {
+                    return ">>" + s + "<<"
+                }
+                """
+            )
+        }
+    ).digest
+
+    def make_request(assembler_flags: tuple[str, ...]) -> BuildGoPackageRequest:
+        # Assembler flags do not affect the compile of a pure Go package, so varying them produces
+        # a distinct request with the same compile process.
+        return BuildGoPackageRequest(
+            import_path="example.com/foo/pkg",
+            pkg_name="pkg",
+            dir_path="",
+            build_opts=GoBuildOptions(),
+            go_files=("f.go",),
+            digest=digest,
+            s_files=(),
+            direct_dependencies=(),
+            minimum_go_version=None,
+            pkg_specific_assembler_flags=assembler_flags,
+        )
+
+    first = rule_runner.request(FallibleBuiltGoPackage, [make_request(())])
+    assert first.output is not None
+    assert first.metadata() == {"go_compile_source": "ran"}
+
+    rule_runner.new_session("second")
+    rule_runner.set_options([], env_inherit={"PATH"})
+    second = rule_runner.request(FallibleBuiltGoPackage, [make_request(("-trimpath",))])
+    assert second.output is not None
+    assert second.metadata() != {"go_compile_source": "ran"}
+    assert second.output.archive_digest == first.output.archive_digest
+
+
 def test_build_pkg_deep_chain(rule_runner: RuleRunner) -> None:
     """A 4-level dependency chain compiles with direct-deps-only compile inputs.
 
@@ -7,9 +7,13 @@ import json
 import logging
 import os
 from dataclasses import dataclass
+from typing import Any
+
+import ijson.backends.python as ijson
 
 from pants.backend.go.go_sources import load_go_binary
 from pants.backend.go.go_sources.load_go_binary import LoadedGoBinaryRequest, setup_go_binary
+from pants.backend.go.subsystems.golang import GolangSubsystem
 from pants.backend.go.target_types import GoPackageSourcesField
 from pants.backend.go.util_rules import pkg_analyzer
 from pants.backend.go.util_rules.build_opts import GoBuildOptions
@@ -33,6 +37,7 @@ from pants.engine.intrinsics import add_prefix, create_digest, execute_process,
 from pants.engine.process import FallibleProcessResult, Process
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import (
+    AllTargets,
     Dependencies,
     DependenciesRequest,
     HydrateSourcesRequest,
@@ -40,7 +45,9 @@ from pants.engine.target import (
     WrappedTargetRequest,
 )
 from pants.util.dirutil import fast_relpath
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
+from pants.util.strutil import pluralize
 
 logger = logging.getLogger(__name__)
 
@@ -147,7 +154,22 @@ class FallibleFirstPartyPkgAnalysis:
                 exit_code=1,
                 stderr=f"Failed to decode JSON document from analysis: {ex}",
             )
+        return cls.from_metadata(
+            metadata,
+            dir_path=dir_path,
+            import_path=import_path,
+            minimum_go_version=minimum_go_version,
+        )
 
+    @classmethod
+    def from_metadata(
+        cls,
+        metadata: dict[str, Any],
+        *,
+        dir_path: str,
+        import_path: str,
+        minimum_go_version: str,
+    ) -> FallibleFirstPartyPkgAnalysis:
         if "Error" in metadata or "InvalidGoFiles" in metadata:
             error = metadata.get("Error", "")
             if error:
@@ -204,6 +226,23 @@ class FirstPartyPkgAnalysisRequest(EngineAwareParameter):
         return self.address.spec
 
 
+@dataclass(frozen=True)
+class FirstPartyPkgAnalysesRequest(EngineAwareParameter):
+    """Analyze all the first-party packages owned by a `go_mod` with one analyzer run."""
+
+    go_mod_address: Address
+    cgo_enabled: bool
+    extra_build_tags: tuple[str, ...] = ()
+
+    def debug_hint(self) -> str:
+        return self.go_mod_address.spec
+
+
+@dataclass(frozen=True)
+class FirstPartyPkgAnalyses:
+    analyses: FrozenDict[Address, FallibleFirstPartyPkgAnalysis]
+
+
 @dataclass(frozen=True)
 class FirstPartyPkgDigest:
     """The source files needed to build the package."""
@@ -251,11 +290,118 @@ async def compute_first_party_package_import_path(
     return FirstPartyPkgImportPath(import_path, dir_path_rel_to_gomod)
 
 
+def _analyzer_env(cgo_enabled: bool, extra_build_tags: tuple[str, ...]) -> dict[str, str]:
+    extra_build_tags_env = {}
+    if extra_build_tags:
+        extra_build_tags_env = {"EXTRA_BUILD_TAGS": ",".join(extra_build_tags)}
+    return {"CGO_ENABLED": "1" if cgo_enabled else "0", **extra_build_tags_env}
+
+
+@rule(desc="Analyze first-party Go packages", level=LogLevel.DEBUG)
+async def analyze_first_party_packages_in_go_mod(
+    request: FirstPartyPkgAnalysesRequest,
+    analyzer: PackageAnalyzerSetup,
+    all_targets: AllTargets,
+) -> FirstPartyPkgAnalyses:
+    go_mod_dir = request.go_mod_address.spec_path
+    candidate_targets = [
+        tgt
+        for tgt in all_targets
+        if tgt.has_field(GoPackageSourcesField)
+        and (not go_mod_dir or f"{tgt.address.spec_path}/".startswith(f"{go_mod_dir}/"))
+    ]
+    owning_go_mods = await concurrently(
+        find_owning_go_mod(OwningGoModRequest(tgt.address), **implicitly())
+        for tgt in candidate_targets
+    )
+    pkg_targets = sorted(
+        (
+            tgt
+            for tgt, owning_go_mod in zip(candidate_targets, owning_go_mods)
+            if owning_go_mod.address == request.go_mod_address
+        ),
+        key=lambda tgt: tgt.address,
+    )
+    if not pkg_targets:
+        return FirstPartyPkgAnalyses(FrozenDict())
+
+    go_mod_info = await determine_go_mod_info(GoModInfoRequest(request.go_mod_address))
+    import_path_infos = await concurrently(
+        compute_first_party_package_import_path(FirstPartyPkgImportPathRequest(tgt.address))
+        for tgt in pkg_targets
+    )
+    all_pkg_sources = await concurrently(
+        hydrate_sources(HydrateSourcesRequest(tgt[GoPackageSourcesField]), **implicitly())
+        for tgt in pkg_targets
+    )
+    input_digest = await merge_digests(
+        MergeDigests(
+            [*(pkg_sources.snapshot.digest for pkg_sources in all_pkg_sources), analyzer.digest]
+        )
+    )
+    result = await execute_process(
+        Process(
+            (analyzer.path, *(tgt.address.spec_path or "." for tgt in pkg_targets)),
+            input_digest=input_digest,
+            description=(
+                f"Determine metadata for {pluralize(len(pkg_targets), 'package')} of "
+                f"{request.go_mod_address}"
+            ),
+            level=LogLevel.DEBUG,
+            env=_analyzer_env(request.cgo_enabled, request.extra_build_tags),
+        ),
+        **implicitly(),
+    )
+
+    analyses: dict[Address, FallibleFirstPartyPkgAnalysis] = {}
+    if result.exit_code != 0:
+        for tgt, import_path_info in zip(pkg_targets, import_path_infos):
+            analyses[tgt.address] = FallibleFirstPartyPkgAnalysis.from_process_result(
+                result,
+                dir_path=tgt.address.spec_path,
+                import_path=import_path_info.import_path,
+                minimum_go_version="",
+                description_of_source=f"first-party Go package `{tgt.address}`",
+            )
+        return FirstPartyPkgAnalyses(FrozenDict(analyses))
+
+    minimum_go_version = go_mod_info.minimum_go_version or ""
+    # The analyzer writes one JSON document per package, in the order of its arguments.
+    for tgt, import_path_info, metadata in zip(
+        pkg_targets,
+        import_path_infos,
+        ijson.items(result.stdout, "", multiple_values=True),
+    ):
+        analyses[tgt.address] = FallibleFirstPartyPkgAnalysis.from_metadata(
+            metadata,
+            dir_path=tgt.address.spec_path,
+            import_path=import_path_info.import_path,
+            minimum_go_version=minimum_go_version,
+        )
+    return FirstPartyPkgAnalyses(FrozenDict(analyses))
+
+
 @rule
 async def analyze_first_party_package(
     request: FirstPartyPkgAnalysisRequest,
     analyzer: PackageAnalyzerSetup,
+    golang: GolangSubsystem,
 ) -> FallibleFirstPartyPkgAnalysis:
+    if golang.batch_package_analysis:
+        owning_go_mod = await find_owning_go_mod(
+            OwningGoModRequest(request.address), **implicitly()
+        )
+        batch = await analyze_first_party_packages_in_go_mod(
+            FirstPartyPkgAnalysesRequest(
+                owning_go_mod.address,
+                cgo_enabled=request.build_opts.cgo_enabled,
+                extra_build_tags=request.extra_build_tags,
+            ),
+            **implicitly(),
+        )
+        if request.address in batch.analyses:
+            return batch.analyses[request.address]
+
     wrapped_target, import_path_info, owning_go_mod = await concurrently(
         resolve_target(
             WrappedTargetRequest(
@@ -272,10 +418,6 @@ async def analyze_first_party_package(
         HydrateSourcesRequest(wrapped_target.target[GoPackageSourcesField]), **implicitly()
     )
 
-    extra_build_tags_env = {}
-    if request.extra_build_tags:
-        extra_build_tags_env = {"EXTRA_BUILD_TAGS": ",".join(request.extra_build_tags)}
-
     input_digest = await merge_digests(MergeDigests([pkg_sources.snapshot.digest, analyzer.digest]))
     result = await execute_process(
         Process(
@@ -283,10 +425,7 @@ async def analyze_first_party_package(
             input_digest=input_digest,
             description=f"Determine metadata for {request.address}",
             level=LogLevel.DEBUG,
-            env={
-                "CGO_ENABLED": "1" if request.build_opts.cgo_enabled else "0",
-                **extra_build_tags_env,
-            },
+            env=_analyzer_env(request.build_opts.cgo_enabled, request.extra_build_tags),
         ),
         **implicitly(),
     )
@@ -88,7 +88,10 @@ def test_import_path(rule_runner: RuleRunner, mod_dir: str) -> None:
     assert info.dir_path_rel_to_gomod == "dir"
 
 
-def test_package_analysis(rule_runner: RuleRunner) -> None:
+@pytest.mark.parametrize("batch", (False, True))
+def test_package_analysis(rule_runner: RuleRunner, batch: bool) -> None:
+    if batch:
+        rule_runner.set_options(["--golang-batch-package-analysis"], env_inherit={"PATH"})
     rule_runner.write_files(
         {
             "foo/BUILD": "go_mod()\n",
@@ -216,7 +219,10 @@ def test_package_analysis(rule_runner: RuleRunner) -> None:
     )
 
 
-def test_invalid_package(rule_runner) -> None:
+@pytest.mark.parametrize("batch", (False, True))
+def test_invalid_package(rule_runner: RuleRunner, batch: bool) -> None:
+    if batch:
+        rule_runner.set_options(["--golang-batch-package-analysis"], env_inherit={"PATH"})
     rule_runner.write_files(
         {
             "BUILD": "go_mod(name='mod')\ngo_package(name='pkg')",
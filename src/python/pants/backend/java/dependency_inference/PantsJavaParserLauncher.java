@@ -115,9 +115,17 @@ public class PantsJavaParserLauncher {
     return new ArrayList<>();
   }
 
+  /**
+   * Analyzes each of the given sources, and writes its analysis as JSON to the given output path.
+   *
+   * <p>Arguments are pairs of `<analysis output path> <source to analyze>`, so that many sources
+   * can be analyzed in one process. All sources are analyzed even if some fail to parse.
+   */
   public static void main(String[] args) throws Exception {
-    String analysisOutputPath = args[0];
-    String sourceToAnalyze = args[1];
+    if (args.length == 0 || args.length % 2 != 0) {
+      throw new IllegalArgumentException(
+          "Expected pairs of `<analysis output path> <source to analyze>` arguments.");
+    }
 
     // NB: We hardcode the most permissive language level in order to capture all potential
     // sources of symbols. If certain syntax ends up deprecated in future versions, we may need to
@@ -125,7 +133,28 @@ public class PantsJavaParserLauncher {
     StaticJavaParser.setConfiguration(
         new ParserConfiguration()
             .setLanguageLevel(ParserConfiguration.LanguageLevel.JAVA_17_PREVIEW));
-    CompilationUnit cu = StaticJavaParser.parse(new File(sourceToAnalyze));
+    ObjectMapper mapper = new ObjectMapper();
+    mapper.registerModule(new Jdk8Module());
+
+    List<String> failedSources = new ArrayList<>();
+    for (int i = 0; i < args.length; i += 2) {
+      String analysisOutputPath = args[i];
+      String sourceToAnalyze = args[i + 1];
+      try {
+        mapper.writeValue(new File(analysisOutputPath), analyze(new File(sourceToAnalyze)));
+      } catch (Exception e) {
+        System.err.println("Failed to analyze " + sourceToAnalyze + ":");
+        e.printStackTrace();
+        failedSources.add(sourceToAnalyze);
+      }
+    }
+    if (!failedSources.isEmpty()) {
+      throw new RuntimeException("Failed to analyze: " + String.join(", ", failedSources));
+    }
+  }
+
+  private static CompilationUnitAnalysis analyze(File sourceToAnalyze) throws Exception {
+    CompilationUnit cu = StaticJavaParser.parse(sourceToAnalyze);
 
     // Get the source's declare package.
     Optional<String> declaredPackage =
@@ -227,11 +256,7 @@ public class PantsJavaParserLauncher {
 
     ArrayList<String> consumedTypes = new ArrayList<>(consumedIdentifiers);
     ArrayList<String> exportTypes = new ArrayList<>(exportIdentifiers);
-    CompilationUnitAnalysis analysis =
-        new CompilationUnitAnalysis(
-            declaredPackage, imports, topLevelTypes, consumedTypes, exportTypes);
-    ObjectMapper mapper = new ObjectMapper();
-    mapper.registerModule(new Jdk8Module());
-    mapper.writeValue(new File(analysisOutputPath), analysis);
+    return new CompilationUnitAnalysis(
+        declaredPackage, imports, topLevelTypes, consumedTypes, exportTypes);
   }
 }
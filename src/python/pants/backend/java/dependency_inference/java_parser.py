@@ -30,10 +30,17 @@ from pants.engine.process import (
 )
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.unions import UnionRule
+from pants.jvm.dependency_inference.batched_source_analysis import (
+    JvmSourceParser,
+    analyze_sources_in_batches,
+)
 from pants.jvm.jdk_rules import InternalJdk, JvmProcess
 from pants.jvm.resolve.coursier_fetch import ToolClasspathRequest, materialize_classpath_for_tool
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, JvmToolBase
+from pants.option.option_types import IntOption
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
+from pants.util.strutil import softwrap
 
 logger = logging.getLogger(__name__)
 
@@ -55,12 +62,38 @@ class JavaParser(JvmToolBase):
         "java_parser.lock",
     )
 
+    batch_size = IntOption(
+        default=0,
+        advanced=True,
+        help=softwrap(
+            """
+            If positive, analyze the Java sources of a repository for dependency inference with
+            one parser process per batch of up to this many files, rather than with one process
+            per file.
+
+            Files are assigned to batches stably, so that after a change to a few files, only the
+            batches containing them are analyzed again.
+            """
+        ),
+    )
+
 
 @dataclass(frozen=True)
 class JavaSourceDependencyAnalysisRequest:
     source_files: SourceFiles
 
 
+@dataclass(frozen=True)
+class JavaSourceDependencyAnalysisBatchRequest:
+    """A request to analyze any number of Java source files, in batches."""
+
+    source_files: SourceFiles
+
+
+class JavaSourceDependencyAnalysisBatch(FrozenDict[str, JavaSourceDependencyAnalysis]):
+    """The analysis of each file of a `JavaSourceDependencyAnalysisBatchRequest`, by path."""
+
+
 @dataclass(frozen=True)
 class FallibleJavaSourceDependencyAnalysisResult:
     process_result: FallibleProcessResult
@@ -154,6 +187,44 @@ async def analyze_java_source_dependencies(
     return FallibleJavaSourceDependencyAnalysisResult(process_result=process_result)
 
 
+@rule(desc="Analyze Java sources for dependencies", level=LogLevel.DEBUG)
+async def analyze_java_source_dependencies_batch(
+    request: JavaSourceDependencyAnalysisBatchRequest,
+    processor_classfiles: JavaParserCompiledClassfiles,
+    jdk: InternalJdk,
+    tool: JavaParser,
+) -> JavaSourceDependencyAnalysisBatch:
+    processorcp_relpath = "__processorcp"
+    toolcp_relpath = "__toolcp"
+    tool_classpath = await materialize_classpath_for_tool(
+        ToolClasspathRequest(lockfile=(GenerateJvmLockfileFromTool.create(tool)))
+    )
+    parser = JvmSourceParser(
+        name="java_parser",
+        jdk=jdk,
+        classpath_entries=(
+            *tool_classpath.classpath_entries(toolcp_relpath),
+            processorcp_relpath,
+        ),
+        extra_immutable_input_digests=FrozenDict(
+            {
+                toolcp_relpath: tool_classpath.digest,
+                processorcp_relpath: processor_classfiles.digest,
+            }
+        ),
+        main_class="org.pantsbuild.javaparser.PantsJavaParserLauncher",
+    )
+    analyses = await analyze_sources_in_batches(
+        request.source_files,
+        parser,
+        batch_size=tool.batch_size,
+    )
+    return JavaSourceDependencyAnalysisBatch(
+        (path, JavaSourceDependencyAnalysis.from_json_dict(analysis))
+        for path, analysis in analyses.items()
+    )
+
+
 def _load_javaparser_launcher_source() -> bytes:
     parent_module = ".".join(__name__.split(".")[:-1])
     return importlib.resources.files(parent_module).joinpath(_LAUNCHER_BASENAME).read_bytes()
@@ -9,6 +9,8 @@ import pytest
 
 from pants.backend.java.dependency_inference.java_parser import (
     FallibleJavaSourceDependencyAnalysisResult,
+    JavaSourceDependencyAnalysisBatch,
+    JavaSourceDependencyAnalysisBatchRequest,
 )
 from pants.backend.java.dependency_inference.java_parser import rules as java_parser_rules
 from pants.backend.java.dependency_inference.types import JavaImport, JavaSourceDependencyAnalysis
@@ -38,6 +40,9 @@ def rule_runner() -> RuleRunner:
             *jdk_rules.rules(),
             QueryRule(FallibleJavaSourceDependencyAnalysisResult, (SourceFiles,)),
             QueryRule(JavaSourceDependencyAnalysis, (SourceFiles,)),
+            QueryRule(
+                JavaSourceDependencyAnalysisBatch, (JavaSourceDependencyAnalysisBatchRequest,)
+            ),
             QueryRule(SourceFiles, (SourceFilesRequest,)),
         ],
         target_types=[JavaSourceTarget],
@@ -191,6 +196,67 @@ def test_java_parser_fallible_error(rule_runner: RuleRunner) -> None:
     assert isinstance(exc_info.value.wrapped_exceptions[0], ProcessExecutionFailure)
 
 
+@maybe_skip_jdk_test
+def test_batched_analysis(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(["--java-parser-batch-size=2"], env_inherit=PYTHON_BOOTSTRAP_ENV)
+    files = {
+        f"Source{i}.java": dedent(
+            f"""\
+            package org.pantsbuild.example;
+
+            import java.util.List{i};
+
+            public class Source{i} {{}}
+            """
+        )
+        for i in range(3)
+    }
+    build_file = "\n".join(f"java_source(name='s{i}', source='Source{i}.java')" for i in range(3))
+    rule_runner.write_files({"BUILD": build_file, **files})
+
+    def analyze() -> dict[str, JavaSourceDependencyAnalysis]:
+        targets = [rule_runner.get_target(Address("", target_name=f"s{i}")) for i in range(3)]
+        source_files = rule_runner.request(
+            SourceFiles, [SourceFilesRequest(tgt[JavaSourceField] for tgt in targets)]
+        )
+        batch = rule_runner.request(
+            JavaSourceDependencyAnalysisBatch,
+            [JavaSourceDependencyAnalysisBatchRequest(source_files)],
+        )
+        # Each file of the batch is analyzed exactly as it is when analyzed on its own.
+        for tgt in targets:
+            single_file = rule_runner.request(
+                SourceFiles, [SourceFilesRequest([tgt[JavaSourceField]])]
+            )
+            assert batch[single_file.files[0]] == rule_runner.request(
+                JavaSourceDependencyAnalysis, [single_file]
+            )
+        return dict(batch)
+
+    analyses = analyze()
+    assert sorted(analyses) == sorted(files)
+    for i in range(3):
+        analysis = analyses[f"Source{i}.java"]
+        assert analysis.top_level_types == (f"org.pantsbuild.example.Source{i}",)
+        assert analysis.imports == (JavaImport(name=f"java.util.List{i}"),)
+
+    # A changed file is analyzed again, and the other analyses are unchanged.
+    rule_runner.write_files(
+        {
+            "Source0.java": dedent(
+                """\
+                package org.pantsbuild.example;
+
+                public class Source0 {}
+                """
+            )
+        }
+    )
+    analyses = analyze()
+    assert analyses["Source0.java"].imports == ()
+    assert analyses["Source1.java"].imports == (JavaImport(name="java.util.List1"),)
+
+
 @maybe_skip_jdk_test
 def test_java_parser_unnamed_package(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
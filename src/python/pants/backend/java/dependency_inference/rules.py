@@ -6,11 +6,9 @@ from collections import defaultdict
 from dataclasses import dataclass
 
 from pants.backend.java.dependency_inference import symbol_mapper
-from pants.backend.java.dependency_inference.java_parser import (
-    JavaSourceDependencyAnalysisRequest,
-    resolve_fallible_result_to_analysis,
-)
+from pants.backend.java.dependency_inference.java_parser import JavaParser
 from pants.backend.java.dependency_inference.java_parser import rules as java_parser_rules
+from pants.backend.java.dependency_inference.symbol_mapper import analyze_java_sources
 from pants.backend.java.dependency_inference.types import JavaImport
 from pants.backend.java.subsystems.java_infer import JavaInferSubsystem
 from pants.backend.java.target_types import JavaSourceField
@@ -64,6 +62,7 @@ async def infer_java_dependencies_and_exports_via_source_analysis(
     java_infer_subsystem: JavaInferSubsystem,
     jvm: JvmSubsystem,
     symbol_mapping: SymbolMapping,
+    parser_tool: JavaParser,
 ) -> JavaInferredDependencies:
     if not java_infer_subsystem.imports and not java_infer_subsystem.consumed_types:
         return JavaInferredDependencies(FrozenOrderedSet([]), FrozenOrderedSet([]))
@@ -76,13 +75,11 @@ async def infer_java_dependencies_and_exports_via_source_analysis(
     tgt = wrapped_tgt.target
     source_files = await determine_source_files(SourceFilesRequest([tgt[JavaSourceField]]))
 
-    explicitly_provided_deps, analysis = await concurrently(
+    explicitly_provided_deps, (analysis,) = await concurrently(
         determine_explicitly_provided_dependencies(
             **implicitly(DependenciesRequest(tgt[Dependencies]))
         ),
-        resolve_fallible_result_to_analysis(
-            **implicitly(JavaSourceDependencyAnalysisRequest(source_files=source_files))
-        ),
+        analyze_java_sources([source_files], parser_tool),
     )
 
     types: OrderedSet[str] = OrderedSet()
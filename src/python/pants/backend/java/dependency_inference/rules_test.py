@@ -752,3 +752,58 @@ def test_infer_imported_outer_class_inner_ref(rule_runner: RuleRunner) -> None:
         [InferJavaSourceDependencies(JavaSourceDependenciesInferenceFieldSet.create(a))],
     )
     assert inferred == InferredDependencies([b.address])
+
+
+@maybe_skip_jdk_test
+def test_batched_analysis_is_shared_with_symbol_map(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(["--java-parser-batch-size=2"], env_inherit=PYTHON_BOOTSTRAP_ENV)
+    rule_runner.write_files(
+        {
+            "BUILD": "java_sources(name='t')",
+            "A.java": dedent(
+                """\
+                package org.pantsbuild.a;
+
+                import org.pantsbuild.b.B;
+
+                public class A {}
+                """
+            ),
+            "B.java": "package org.pantsbuild.b;\n\npublic class B {}\n",
+            "C.java": dedent(
+                """\
+                package org.pantsbuild.c;
+
+                import org.pantsbuild.b.B;
+
+                public class C {}
+                """
+            ),
+            "D.java": "package org.pantsbuild.d;\n\npublic class D {}\n",
+        }
+    )
+
+    def infer(filename: str) -> InferredDependencies:
+        target = rule_runner.get_target(
+            Address("", target_name="t", relative_file_path=filename)
+        )
+        return rule_runner.request(
+            InferredDependencies,
+            [InferJavaSourceDependencies(JavaSourceDependenciesInferenceFieldSet.create(target))],
+        )
+
+    def process_count() -> int:
+        return rule_runner.scheduler.get_metrics().get("local_execution_requests", 0)
+
+    # Inferring the dependencies of the first target builds the symbol map, which analyzes all of
+    # the sources in batches.
+    b = Address("", target_name="t", relative_file_path="B.java")
+    assert infer("A.java") == InferredDependencies([b])
+    processes_for_first_target = process_count()
+
+    # The other targets look up their analyses in those batches, rather than running any more
+    # analysis processes.
+    assert infer("B.java") == InferredDependencies([])
+    assert infer("C.java") == InferredDependencies([b])
+    assert infer("D.java") == InferredDependencies([])
+    assert process_count() == processes_for_first_target
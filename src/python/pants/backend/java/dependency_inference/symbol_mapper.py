@@ -5,11 +5,24 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from collections.abc import Mapping
-
-from pants.backend.java.dependency_inference.java_parser import resolve_fallible_result_to_analysis
+from collections.abc import Mapping, Sequence
+
+from pants.backend.java.dependency_inference.java_parser import (
+    JavaParser,
+    JavaSourceDependencyAnalysisBatchRequest,
+    JavaSourceDependencyAnalysisRequest,
+    analyze_java_source_dependencies_batch,
+    resolve_fallible_result_to_analysis,
+)
+from pants.backend.java.dependency_inference.types import JavaSourceDependencyAnalysis
 from pants.backend.java.target_types import JavaSourceField
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.core.util_rules.source_files import (
+    SourceFiles,
+    SourceFilesRequest,
+    determine_source_files,
+)
+from pants.engine.fs import MergeDigests
+from pants.engine.intrinsics import digest_to_snapshot
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import AllTargets, Targets
 from pants.engine.unions import UnionRule
@@ -18,6 +31,7 @@ from pants.jvm.dependency_inference.artifact_mapper import MutableTrieNode
 from pants.jvm.dependency_inference.symbol_mapper import FirstPartyMappingRequest, SymbolMap
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -32,6 +46,63 @@ async def find_all_java_targets(tgts: AllTargets) -> AllJavaTargets:
     return AllJavaTargets(tgt for tgt in tgts if tgt.has_field(JavaSourceField))
 
 
+class AllJavaSourceAnalyses(FrozenDict[str, JavaSourceDependencyAnalysis]):
+    """The analysis of the source of every Java target, by path."""
+
+
+@rule(desc="Analyze all Java sources for dependencies", level=LogLevel.DEBUG)
+async def analyze_all_java_sources(java_targets: AllJavaTargets) -> AllJavaSourceAnalyses:
+    all_source_files = await concurrently(
+        determine_source_files(SourceFilesRequest([target[JavaSourceField]]))
+        for target in java_targets
+    )
+    merged_snapshot = await digest_to_snapshot(
+        **implicitly(
+            MergeDigests(source_files.snapshot.digest for source_files in all_source_files)
+        )
+    )
+    batch = await analyze_java_source_dependencies_batch(
+        JavaSourceDependencyAnalysisBatchRequest(SourceFiles(merged_snapshot, ())),
+        **implicitly(),
+    )
+    return AllJavaSourceAnalyses(batch)
+
+
+async def analyze_java_sources(
+    all_source_files: Sequence[SourceFiles], tool: JavaParser
+) -> tuple[JavaSourceDependencyAnalysis, ...]:
+    """Analyze each of the given single-file `SourceFiles`.
+
+    If `[java-parser].batch_size` is set, the analyses are looked up in `AllJavaSourceAnalyses`,
+    which analyzes the sources of all Java targets together in batches once, for both the symbol
+    map and the inference of each target. Otherwise (or for a file which is not the source of a
+    Java target), each file is analyzed by its own process.
+    """
+    all_analyses = (
+        await analyze_all_java_sources(**implicitly())
+        if tool.batch_size > 0
+        else AllJavaSourceAnalyses()
+    )
+    unanalyzed = [
+        source_files
+        for source_files in all_source_files
+        if source_files.files[0] not in all_analyses
+    ]
+    analyses = await concurrently(
+        resolve_fallible_result_to_analysis(
+            **implicitly(JavaSourceDependencyAnalysisRequest(source_files=source_files))
+        )
+        for source_files in unanalyzed
+    )
+    analyzed = {
+        source_files.files[0]: analysis for source_files, analysis in zip(unanalyzed, analyses)
+    }
+    return tuple(
+        all_analyses[path] if path in all_analyses else analyzed[path]
+        for path in (source_files.files[0] for source_files in all_source_files)
+    )
+
+
 class FirstPartyJavaTargetsMappingRequest(FirstPartyMappingRequest):
     pass
 
@@ -41,13 +112,13 @@ async def map_first_party_java_targets_to_symbols(
     _: FirstPartyJavaTargetsMappingRequest,
     java_targets: AllJavaTargets,
     jvm: JvmSubsystem,
+    parser_tool: JavaParser,
 ) -> SymbolMap:
-    source_analysis = await concurrently(
-        resolve_fallible_result_to_analysis(
-            **implicitly(SourceFilesRequest([target[JavaSourceField]]))
-        )
+    all_source_files = await concurrently(
+        determine_source_files(SourceFilesRequest([target[JavaSourceField]]))
         for target in java_targets
     )
+    source_analysis = await analyze_java_sources(all_source_files, parser_tool)
     address_and_analysis = zip(
         [(tgt.address, tgt[JvmResolveField].normalized_value(jvm)) for tgt in java_targets],
         source_analysis,
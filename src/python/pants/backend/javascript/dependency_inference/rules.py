@@ -120,7 +120,7 @@ class RequestNodePackagesCandidateMap:
 async def map_candidate_node_packages(
     req: RequestNodePackagesCandidateMap, first_party: FirstPartyNodePackageTargets
 ) -> NodePackageCandidateMap:
-    owning_pkg = await find_owning_package(OwningNodePackageRequest(req.address))
+    owning_pkg = await find_owning_package(OwningNodePackageRequest(req.address), **implicitly())
     candidate_tgts = itertools.chain(
         first_party, owning_pkg.third_party if owning_pkg != OwningNodePackage.no_owner() else ()
     )
@@ -142,7 +142,7 @@ def _create_inference_metadata(
 
 async def _prepare_inference_metadata(address: Address, file_path: str) -> InferenceMetadata:
     owning_pkg, maybe_config = await concurrently(
-        find_owning_package(OwningNodePackageRequest(address)),
+        find_owning_package(OwningNodePackageRequest(address), **implicitly()),
         find_parent_ts_config(ParentTSConfigRequest(file_path), **implicitly()),
     )
     if not owning_pkg.target:
@@ -117,7 +117,7 @@ async def partition_nodejs_tests(
     partitions = []
     compatible_tests = defaultdict(list)
     owning_packages = await concurrently(
-        find_owning_package(OwningNodePackageRequest(field_set.address))
+        find_owning_package(OwningNodePackageRequest(field_set.address), **implicitly())
         for field_set in request.field_sets
     )
     for field_set, owning_package in zip(request.field_sets, owning_packages):
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 
 from pants.backend.javascript import nodejs_project_environment
 from pants.backend.javascript.dependency_inference.rules import rules as dependency_inference_rules
+from pants.backend.javascript.nodejs_project import NodeJSProject
 from pants.backend.javascript.nodejs_project_environment import (
     NodeJsProjectEnvironment,
     NodeJsProjectEnvironmentProcess,
@@ -15,6 +16,8 @@ from pants.backend.javascript.nodejs_project_environment import (
     get_nodejs_environment,
 )
 from pants.backend.javascript.package_json import (
+    FirstPartyNodePackageTargets,
+    NodePackageExtraEnvVarsField,
     NodePackageNameField,
     NodePackageVersionField,
     PackageJsonSourceField,
@@ -24,18 +27,22 @@ from pants.backend.javascript.subsystems import nodejs
 from pants.backend.javascript.target_types import JSRuntimeSourceField
 from pants.build_graph.address import Address
 from pants.core.target_types import FileSourceField, ResourceSourceField
+from pants.core.util_rules.env_vars import environment_vars_subset
 from pants.core.util_rules.source_files import (
     SourceFiles,
     SourceFilesRequest,
     determine_source_files,
 )
+from pants.engine.env_vars import EnvironmentVarsRequest
+from pants.engine.fs import PathGlobs
 from pants.engine.internals.graph import transitive_targets
-from pants.engine.internals.native_engine import AddPrefix, Digest, MergeDigests
-from pants.engine.intrinsics import add_prefix, merge_digests
+from pants.engine.internals.native_engine import AddPrefix, Digest, DigestSubset, MergeDigests
+from pants.engine.intrinsics import add_prefix, digest_subset_to_digest, merge_digests
 from pants.engine.process import fallible_to_exec_result_or_raise
-from pants.engine.rules import Rule, collect_rules, implicitly, rule
+from pants.engine.rules import Rule, collect_rules, concurrently, implicitly, rule
 from pants.engine.target import SourcesField, Target, TransitiveTargetsRequest
 from pants.engine.unions import UnionMembership, UnionRule
+from pants.util.frozendict import FrozenDict
 
 
 @dataclass(frozen=True)
@@ -69,6 +76,19 @@ class InstalledNodePackageWithSource(InstalledNodePackage):
     pass
 
 
+@dataclass(frozen=True)
+class InstalledNodeProjectRequest:
+    project: NodeJSProject
+
+
+@dataclass(frozen=True)
+class InstalledNodeProject:
+    """The `node_modules` directories of a whole Node.js workspace, installed in one process."""
+
+    project_env: NodeJsProjectEnvironment
+    node_modules: Digest
+
+
 async def _get_relevant_source_files(
     sources: Iterable[SourcesField], with_js: bool = False
 ) -> SourceFiles:
@@ -82,6 +102,82 @@ async def _get_relevant_source_files(
     )
 
 
+@rule
+async def install_node_project(
+    req: InstalledNodeProjectRequest, all_first_party: FirstPartyNodePackageTargets
+) -> InstalledNodeProject:
+    project_env = NodeJsProjectEnvironment.from_root(req.project)
+    workspace_dirs = {workspace.root_dir for workspace in req.project.workspaces}
+    workspace_tgts = sorted(
+        (tgt for tgt in all_first_party if tgt.residence_dir in workspace_dirs),
+        key=lambda tgt: tgt.address,
+    )
+    # The install runs scripts (e.g. `postinstall`) for every package, so it needs the
+    # `extra_env_vars` of all of them.
+    transitive_tgts, env_vars = await concurrently(
+        transitive_targets(
+            TransitiveTargetsRequest(tgt.address for tgt in workspace_tgts), **implicitly()
+        ),
+        environment_vars_subset(
+            EnvironmentVarsRequest(
+                tuple(
+                    env_var
+                    for tgt in workspace_tgts
+                    for env_var in tgt.get(NodePackageExtraEnvVarsField).value or ()
+                )
+            ),
+            **implicitly(),
+        ),
+    )
+
+    source_files = await _get_relevant_source_files(
+        (tgt[SourcesField] for tgt in transitive_tgts.closure if tgt.has_field(SourcesField)),
+        with_js=False,
+    )
+
+    install_result = await fallible_to_exec_result_or_raise(
+        **implicitly(
+            NodeJsProjectEnvironmentProcess(
+                project_env,
+                req.project.immutable_install_args,
+                description=f"Installing Node.js project {req.project.default_resolve_name}.",
+                input_digest=source_files.snapshot.digest,
+                output_directories=tuple(project_env.node_modules_directories),
+                extra_env=FrozenDict(env_vars),
+            )
+        )
+    )
+    node_modules = await add_prefix(AddPrefix(install_result.output_digest, project_env.root_dir))
+    return InstalledNodeProject(project_env, node_modules)
+
+
+async def _node_modules_for_package(
+    installed_project: InstalledNodeProject, closure: Iterable[Target]
+) -> Digest:
+    """Select the `node_modules` directories of the project root and of the workspaces that the
+    package transitively depends on."""
+    root_dir = installed_project.project_env.root_dir
+    package_dirs = {os.path.normpath(root_dir)} | {
+        os.path.normpath(tgt.residence_dir)
+        for tgt in closure
+        if tgt.has_fields((PackageJsonSourceField, NodePackageNameField))
+    }
+    all_directories = tuple(installed_project.project_env.node_modules_directories)
+    directories = [
+        directory
+        for directory in all_directories
+        if os.path.normpath(os.path.join(root_dir, os.path.dirname(directory))) in package_dirs
+    ]
+    if len(directories) == len(all_directories):
+        return installed_project.node_modules
+    return await digest_subset_to_digest(
+        DigestSubset(
+            installed_project.node_modules,
+            PathGlobs(os.path.join(root_dir, directory, "**") for directory in directories),
+        )
+    )
+
+
 @rule
 async def install_node_packages_for_address(
     req: InstalledNodePackageRequest,
@@ -100,18 +196,26 @@ async def install_node_packages_for_address(
     )
     package_digest = source_files.snapshot.digest
 
-    install_result = await fallible_to_exec_result_or_raise(
-        **implicitly(
-            NodeJsProjectEnvironmentProcess(
-                project_env,
-                project_env.project.immutable_install_args,
-                description=f"Installing {target[NodePackageNameField].value}@{target[NodePackageVersionField].value}.",
-                input_digest=package_digest,
-                output_directories=tuple(project_env.node_modules_directories),
+    if nodejs.project_install:
+        installed_project = await install_node_project(
+            InstalledNodeProjectRequest(project_env.project), **implicitly()
+        )
+        node_modules = await _node_modules_for_package(installed_project, transitive_tgts.closure)
+    else:
+        install_result = await fallible_to_exec_result_or_raise(
+            **implicitly(
+                NodeJsProjectEnvironmentProcess(
+                    project_env,
+                    project_env.project.immutable_install_args,
+                    description=f"Installing {target[NodePackageNameField].value}@{target[NodePackageVersionField].value}.",
+                    input_digest=package_digest,
+                    output_directories=tuple(project_env.node_modules_directories),
+                )
             )
         )
-    )
-    node_modules = await add_prefix(AddPrefix(install_result.output_digest, project_env.root_dir))
+        node_modules = await add_prefix(
+            AddPrefix(install_result.output_digest, project_env.root_dir)
+        )
 
     return InstalledNodePackage(
         project_env,
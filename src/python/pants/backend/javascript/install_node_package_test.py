@@ -88,3 +88,85 @@ def test_install_node_package_with_extra_env_vars(rule_runner: RuleRunner) -> No
 
     assert "GLOBAL_VAR" in actual_env_vars
     assert actual_env_vars["GLOBAL_VAR"] == "global_value"
+
+
+def test_project_install_with_extra_env_vars(rule_runner: RuleRunner) -> None:
+    # The shared install runs the scripts of every package, with the env vars of all packages.
+    rule_runner.set_options(
+        [
+            "--nodejs-project-install",
+            "--nodejs-extra-env-vars=['GLOBAL_VAR=global_value']",
+            "--nodejs-tools=['env']",
+        ],
+        env_inherit={"PATH"},
+    )
+    rule_runner.write_files(
+        {
+            "src/js/BUILD": "package_json()",
+            "src/js/package.json": json.dumps(
+                {
+                    "name": "root",
+                    "version": "1.0.0",
+                    "private": True,
+                    "packageManager": "yarn@1.22.22",
+                    "workspaces": ["a"],
+                }
+            ),
+            "src/js/a/BUILD": "package_json(extra_env_vars=['TARGET_VAR=target_value'])",
+            "src/js/a/package.json": json.dumps(
+                {
+                    "name": "a",
+                    "version": "1.0.0",
+                    "scripts": {"postinstall": "env > ../node_modules/env-vars.txt"},
+                }
+            ),
+        }
+    )
+
+    for address in (Address("src/js"), Address("src/js/a")):
+        installed_package = rule_runner.request(
+            InstalledNodePackage, [InstalledNodePackageRequest(address)]
+        )
+        digest = rule_runner.request(DigestContents, [installed_package.digest])
+        env_vars_file = next(f for f in digest if f.path == "src/js/node_modules/env-vars.txt")
+        env_vars = {}
+        for line in env_vars_file.content.decode().splitlines():
+            if "=" in line:
+                key, value = line.split("=", 1)
+                env_vars[key] = value
+        assert env_vars["TARGET_VAR"] == "target_value"
+        assert env_vars["GLOBAL_VAR"] == "global_value"
+
+
+def test_project_install_is_shared_between_workspaces(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(
+        ["--nodejs-project-install", "--nodejs-tools=['date']"], env_inherit={"PATH"}
+    )
+    rule_runner.write_files(
+        {
+            "src/js/BUILD": "package_json()",
+            "src/js/package.json": json.dumps(
+                {
+                    "name": "root",
+                    "version": "1.0.0",
+                    "private": True,
+                    "packageManager": "yarn@1.22.22",
+                    "workspaces": ["a", "b"],
+                    "scripts": {"postinstall": "date +%s%N > node_modules/installed-at.txt"},
+                }
+            ),
+            "src/js/a/BUILD": "package_json()",
+            "src/js/a/package.json": json.dumps({"name": "a", "version": "1.0.0"}),
+            "src/js/b/BUILD": "package_json()",
+            "src/js/b/package.json": json.dumps({"name": "b", "version": "1.0.0"}),
+        }
+    )
+
+    def installed_at(address: Address) -> bytes:
+        installed_package = rule_runner.request(
+            InstalledNodePackage, [InstalledNodePackageRequest(address)]
+        )
+        digest = rule_runner.request(DigestContents, [installed_package.digest])
+        return next(f.content for f in digest if f.path == "src/js/node_modules/installed-at.txt")
+
+    assert installed_at(Address("src/js/a")) == installed_at(Address("src/js/b"))
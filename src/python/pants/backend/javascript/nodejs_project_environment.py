@@ -68,7 +68,7 @@ class NodeJsProjectEnvironment:
         too so the sandbox match what the package manager actually installs.
         """
         yield "node_modules"
-        if self.package and not self.project.single_workspace:
+        if not self.project.single_workspace:
             for workspace in self.project.workspaces:
                 if workspace.root_dir != self.project.root_dir:
                     rel_dir = fast_relpath(workspace.root_dir, self.project.root_dir)
@@ -132,7 +132,7 @@ class NodeJsProjectEnvironmentProcess:
 async def get_nodejs_environment(req: NodeJSProjectEnvironmentRequest) -> NodeJsProjectEnvironment:
     node_resolve, owning_tgt = await concurrently(
         resolve_for_package(RequestNodeResolve(req.address), **implicitly()),
-        find_owning_package(OwningNodePackageRequest(req.address)),
+        find_owning_package(OwningNodePackageRequest(req.address), **implicitly()),
     )
     assert owning_tgt.target, f"Already ensured to exist by {ChosenNodeResolve.__name__}."
 
@@ -15,7 +15,6 @@ import yaml
 
 from pants.backend.project_info import dependencies
 from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
-from pants.base.specs import AncestorGlobSpec, RawSpecs
 from pants.build_graph.address import Address
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.core.goals.package import OutputPathField
@@ -722,6 +721,30 @@ async def all_first_party_node_package_targets(targets: AllTargets) -> FirstPart
     )
 
 
+class NodePackageOwners(FrozenDict[str, Target]):
+    """The first-party node package targets, keyed by the directory of their BUILD file."""
+
+    def owner_of(self, address: Address) -> Target | None:
+        """Find the node package declared closest to the address, in its directory or an
+        ancestor."""
+        directory = address.spec_path
+        while True:
+            owner = self.get(directory)
+            if owner is not None or not directory:
+                return owner
+            directory = os.path.dirname(directory)
+
+
+@rule
+async def index_node_package_owners(
+    all_first_party: FirstPartyNodePackageTargets,
+) -> NodePackageOwners:
+    owners: dict[str, Target] = {}
+    for tgt in sorted(all_first_party, key=lambda tgt: tgt.address):
+        owners.setdefault(tgt.address.spec_path, tgt)
+    return NodePackageOwners(owners)
+
+
 @dataclass(frozen=True)
 class OwningNodePackageRequest:
     address: Address
@@ -744,25 +767,10 @@ class OwningNodePackage:
 
 
 @rule
-async def find_owning_package(request: OwningNodePackageRequest) -> OwningNodePackage:
-    candidate_targets = await resolve_targets(
-        **implicitly(
-            RawSpecs(
-                ancestor_globs=(AncestorGlobSpec(request.address.spec_path),),
-                description_of_origin=f"the `{OwningNodePackage.__name__}` rule",
-            )
-        )
-    )
-    package_json_tgts = sorted(
-        (
-            tgt
-            for tgt in candidate_targets
-            if tgt.has_field(PackageJsonSourceField) and tgt.has_field(NodePackageNameField)
-        ),
-        key=lambda tgt: tgt.address.spec_path,
-        reverse=True,
-    )
-    tgt = package_json_tgts[0] if package_json_tgts else None
+async def find_owning_package(
+    request: OwningNodePackageRequest, owners: NodePackageOwners
+) -> OwningNodePackage:
+    tgt = owners.owner_of(request.address)
     if tgt:
         deps = await resolve_targets(**implicitly(DependenciesRequest(tgt[Dependencies])))
         return OwningNodePackage(
@@ -14,6 +14,8 @@ from pants.backend.javascript.package_json import (
     NodePackageTestScriptField,
     NodeTestScript,
     NodeThirdPartyPackageTarget,
+    OwningNodePackage,
+    OwningNodePackageRequest,
     PackageJson,
     PackageJsonImports,
     PackageJsonSourceField,
@@ -38,6 +40,7 @@ def rule_runner() -> RuleRunner:
             *package_json.rules(),
             QueryRule(AllPackageJson, ()),
             QueryRule(Owners, (OwnersRequest,)),
+            QueryRule(OwningNodePackage, (OwningNodePackageRequest,)),
             QueryRule(PackageJsonImports, (PackageJsonSourceField,)),
         ],
         target_types=[
@@ -155,6 +158,34 @@ def test_does_not_consider_package_json_without_a_target(
     assert all_packages[0].name == "ham"
 
 
+def test_finds_closest_owning_package(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/js/a/BUILD": "package_json()",
+            "src/js/a/package.json": json.dumps(
+                {"name": "ham", "version": "0.0.1", "dependencies": {"chalk": "^5.2.0"}}
+            ),
+            "src/js/a/nested/BUILD": "package_json()",
+            "src/js/a/nested/package.json": given_package("spam", "0.0.1"),
+        }
+    )
+
+    def owner(address: Address) -> OwningNodePackage:
+        return rule_runner.request(OwningNodePackage, [OwningNodePackageRequest(address)])
+
+    ham = owner(Address("src/js/a/lib", relative_file_path="index.js"))
+    assert ham.ensure_owner().address == Address("src/js/a", generated_name="ham")
+    assert [tgt.address for tgt in ham.third_party] == [
+        Address("src/js/a", generated_name="chalk")
+    ]
+
+    spam = owner(Address("src/js/a/nested/deeper", relative_file_path="index.js"))
+    assert spam.ensure_owner().address == Address("src/js/a/nested", generated_name="spam")
+    assert spam.third_party == ()
+
+    assert owner(Address("src/js", relative_file_path="index.js")) == OwningNodePackage.no_owner()
+
+
 def test_generates_build_script_targets(
     rule_runner: RuleRunner,
 ) -> None:
@@ -10,17 +10,15 @@ from pants.backend.javascript import nodejs_project
 from pants.backend.javascript.nodejs_project import AllNodeJSProjects, NodeJSProject
 from pants.backend.javascript.package_json import (
     FirstPartyNodePackageTargets,
-    NodePackageNameField,
-    OwningNodePackageRequest,
+    NodePackageOwners,
+    OwningNodePackage,
     PackageJsonSourceField,
-    find_owning_package,
 )
 from pants.backend.javascript.subsystems.nodejs import UserChosenNodeJSResolveAliases
 from pants.build_graph.address import Address
 from pants.engine.fs import PathGlobs
-from pants.engine.internals.graph import resolve_target
-from pants.engine.rules import Rule, collect_rules, implicitly, rule
-from pants.engine.target import Target, WrappedTargetRequest
+from pants.engine.rules import Rule, collect_rules, rule
+from pants.engine.target import Target
 from pants.engine.unions import UnionRule
 from pants.util.frozendict import FrozenDict
 
@@ -46,27 +44,12 @@ class ChosenNodeResolve:
         return PathGlobs([self.file_path])
 
 
-async def _get_node_package_json_directory(req: RequestNodeResolve) -> str:
-    wrapped = await resolve_target(
-        WrappedTargetRequest(req.address, description_of_origin="the `ChosenNodeResolve` rule"),
-        **implicitly(),
-    )
-    target: Target | None
-    if wrapped.target.has_field(PackageJsonSourceField) and wrapped.target.has_field(
-        NodePackageNameField
-    ):
-        target = wrapped.target
-    else:
-        owning_pkg = await find_owning_package(OwningNodePackageRequest(wrapped.target.address))
-        target = owning_pkg.ensure_owner()
-    return os.path.dirname(target[PackageJsonSourceField].file_path)
-
-
 @rule
 async def resolve_for_package(
-    req: RequestNodeResolve, all_projects: AllNodeJSProjects
+    req: RequestNodeResolve, all_projects: AllNodeJSProjects, owners: NodePackageOwners
 ) -> ChosenNodeResolve:
-    directory = await _get_node_package_json_directory(req)
+    target = OwningNodePackage(owners.owner_of(req.address)).ensure_owner()
+    directory = os.path.dirname(target[PackageJsonSourceField].file_path)
     project = all_projects.project_for_directory(directory)
     return ChosenNodeResolve(project)
 
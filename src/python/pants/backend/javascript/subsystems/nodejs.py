@@ -53,7 +53,13 @@ from pants.engine.platform import Platform
 from pants.engine.process import Process, fallible_to_exec_result_or_raise
 from pants.engine.rules import Rule, collect_rules, implicitly, rule
 from pants.engine.unions import UnionRule
-from pants.option.option_types import DictOption, ShellStrListOption, StrListOption, StrOption
+from pants.option.option_types import (
+    BoolOption,
+    DictOption,
+    ShellStrListOption,
+    StrListOption,
+    StrOption,
+)
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import bin_name
 from pants.util.frozendict import FrozenDict
@@ -170,6 +176,26 @@ class NodeJS(Subsystem, TemplatedExternalToolOptionsMixin):
         advanced=True,
     )
 
+    project_install = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, install the dependencies of a Node.js project once for the whole workspace,
+            and give each package a subset of the resulting `node_modules` directories.
+
+            By default, every package runs its own package manager install, which resolves the
+            same lockfile again for each package of a multi-package workspace. The shared install
+            is invalidated when the `package.json` or install-time files of any package in the
+            project change.
+
+            The shared install runs with the `extra_env_vars` of all packages in the project. If
+            several packages set the same variable, the value of the last package by address
+            is used.
+            """
+        ),
+        advanced=True,
+    )
+
     @property
     def default_package_manager(self) -> str | None:
         if self.package_manager in self.package_managers:
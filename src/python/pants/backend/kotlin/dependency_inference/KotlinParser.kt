@@ -159,16 +159,31 @@ fun analyze(file: KtFile): KotlinAnalysis {
     )
 }
 
+// Arguments are pairs of `<analysis output path> <source path>`, so that many sources can be
+// analyzed in one process. All sources are analyzed even if some fail to parse.
 fun main(args: Array<String>) {
-    val analysisOutputPath = args[0]
-    val sourcePath = args[1]
-
-    val sourceContentBytes = Files.readAllBytes(Paths.get(sourcePath))
-    val sourceContent = String(sourceContentBytes, StandardCharsets.UTF_8)
-    val parsed = parse(sourceContent)
-    val analysis = analyze(parsed)
+    require(args.isNotEmpty() && args.size % 2 == 0) {
+        "Expected pairs of `<analysis output path> <source path>` arguments."
+    }
 
     val gson = Gson()
-    val analysisOutput = gson.toJson(analysis)
-    Files.write(Paths.get(analysisOutputPath), analysisOutput.toByteArray(StandardCharsets.UTF_8))
+    val failedSources = mutableListOf<String>()
+    for ((analysisOutputPath, sourcePath) in args.toList().chunked(2).map { it[0] to it[1] }) {
+        try {
+            val sourceContentBytes = Files.readAllBytes(Paths.get(sourcePath))
+            val sourceContent = String(sourceContentBytes, StandardCharsets.UTF_8)
+            val parsed = parse(sourceContent)
+            val analysis = analyze(parsed)
+
+            val analysisOutput = gson.toJson(analysis)
+            Files.write(Paths.get(analysisOutputPath), analysisOutput.toByteArray(StandardCharsets.UTF_8))
+        } catch (e: Exception) {
+            System.err.println("Failed to analyze $sourcePath:")
+            e.printStackTrace()
+            failedSources.add(sourcePath)
+        }
+    }
+    if (failedSources.isNotEmpty()) {
+        throw RuntimeException("Failed to analyze: ${failedSources.joinToString(", ")}")
+    }
 }
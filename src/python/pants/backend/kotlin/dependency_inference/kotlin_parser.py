@@ -29,14 +29,20 @@ from pants.engine.process import (
 from pants.engine.rules import collect_rules, implicitly, rule
 from pants.engine.unions import UnionRule
 from pants.jvm.compile import ClasspathEntry
+from pants.jvm.dependency_inference.batched_source_analysis import (
+    JvmSourceParser,
+    analyze_sources_in_batches,
+)
 from pants.jvm.jdk_rules import InternalJdk, JdkRequest, JvmProcess, prepare_jdk_environment
 from pants.jvm.resolve.common import ArtifactRequirements
 from pants.jvm.resolve.coordinate import Coordinate
 from pants.jvm.resolve.coursier_fetch import ToolClasspathRequest, materialize_classpath_for_tool
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, JvmToolBase
+from pants.option.option_types import IntOption
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.resources import read_resource
+from pants.util.strutil import softwrap
 
 _PARSER_KOTLIN_VERSION = "1.6.20"
 
@@ -56,6 +62,20 @@ class KotlinParser(JvmToolBase):
         "kotlin_parser.lock",
     )
 
+    batch_size = IntOption(
+        default=0,
+        advanced=True,
+        help=softwrap(
+            """
+            If positive, analyze Kotlin sources for dependency inference with one parser process
+            per batch of up to this many files, rather than with one process per file.
+
+            Files are assigned to batches stably, so that after a change to a few files, only the
+            batches containing them are analyzed again.
+            """
+        ),
+    )
+
 
 @dataclass(frozen=True)
 class KotlinImport:
@@ -162,15 +182,28 @@ class KotlinParserCompiledClassfiles(ClasspathEntry):
     pass
 
 
+@dataclass(frozen=True)
+class KotlinSourceDependencyAnalysisBatchRequest:
+    """A request to analyze any number of Kotlin source files, in batches."""
+
+    source_files: SourceFiles
+
+
+class KotlinSourceDependencyAnalysisBatch(FrozenDict[str, KotlinSourceDependencyAnalysis]):
+    """The analysis of each file of a `KotlinSourceDependencyAnalysisBatchRequest`, by path."""
+
+
+# Use JDK 8 due to https://youtrack.jetbrains.com/issue/KTIJ-17192 and https://youtrack.jetbrains.com/issue/KT-37446.
+_PARSER_JDK = JdkRequest("zulu:8.0.392")
+
+
 @rule(level=LogLevel.DEBUG)
 async def analyze_kotlin_source_dependencies(
     processor_classfiles: KotlinParserCompiledClassfiles,
     source_files: SourceFiles,
     tool: KotlinParser,
 ) -> FallibleKotlinSourceDependencyAnalysisResult:
-    # Use JDK 8 due to https://youtrack.jetbrains.com/issue/KTIJ-17192 and https://youtrack.jetbrains.com/issue/KT-37446.
-    request = JdkRequest("zulu:8.0.392")
-    env = await prepare_jdk_environment(**implicitly({request: JdkRequest}))
+    env = await prepare_jdk_environment(**implicitly({_PARSER_JDK: JdkRequest}))
     jdk = InternalJdk.from_jdk_environment(env)
 
     if len(source_files.files) > 1:
@@ -244,6 +277,46 @@ async def resolve_fallible_result_to_analysis(
     return KotlinSourceDependencyAnalysis.from_json_dict(analysis)
 
 
+@rule(desc="Analyze Kotlin sources for dependencies", level=LogLevel.DEBUG)
+async def analyze_kotlin_source_dependencies_batch(
+    request: KotlinSourceDependencyAnalysisBatchRequest,
+    processor_classfiles: KotlinParserCompiledClassfiles,
+    tool: KotlinParser,
+) -> KotlinSourceDependencyAnalysisBatch:
+    processorcp_relpath = "__processorcp"
+    toolcp_relpath = "__toolcp"
+    env, tool_classpath = await concurrently(
+        prepare_jdk_environment(**implicitly({_PARSER_JDK: JdkRequest})),
+        materialize_classpath_for_tool(
+            ToolClasspathRequest(lockfile=(GenerateJvmLockfileFromTool.create(tool)))
+        ),
+    )
+    parser = JvmSourceParser(
+        name="kotlin_parser",
+        jdk=InternalJdk.from_jdk_environment(env),
+        classpath_entries=(
+            *tool_classpath.classpath_entries(toolcp_relpath),
+            processorcp_relpath,
+        ),
+        extra_immutable_input_digests=FrozenDict(
+            {
+                toolcp_relpath: tool_classpath.digest,
+                processorcp_relpath: processor_classfiles.digest,
+            }
+        ),
+        main_class="org.pantsbuild.backend.kotlin.dependency_inference.KotlinParserKt",
+    )
+    analyses = await analyze_sources_in_batches(
+        request.source_files,
+        parser,
+        batch_size=tool.batch_size,
+    )
+    return KotlinSourceDependencyAnalysisBatch(
+        (path, KotlinSourceDependencyAnalysis.from_json_dict(analysis))
+        for path, analysis in analyses.items()
+    )
+
+
 @rule
 async def setup_kotlin_parser_classfiles(
     jdk: InternalJdk, tool: KotlinParser
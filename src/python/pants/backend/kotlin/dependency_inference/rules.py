@@ -5,14 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from pants.backend.kotlin.dependency_inference import kotlin_parser, symbol_mapper
-from pants.backend.kotlin.dependency_inference.kotlin_parser import (
-    resolve_fallible_result_to_analysis,
-)
+from pants.backend.kotlin.dependency_inference.kotlin_parser import KotlinParser
+from pants.backend.kotlin.dependency_inference.symbol_mapper import analyze_kotlin_sources
 from pants.backend.kotlin.subsystems.kotlin import KotlinSubsystem
 from pants.backend.kotlin.subsystems.kotlin_infer import KotlinInferSubsystem
 from pants.backend.kotlin.target_types import KotlinDependenciesField, KotlinSourceField
 from pants.build_graph.address import Address
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.core.util_rules.source_files import SourceFilesRequest, determine_source_files
 from pants.engine.internals.graph import determine_explicitly_provided_dependencies
 from pants.engine.internals.selectors import concurrently
 from pants.engine.rules import collect_rules, implicitly, rule
@@ -55,18 +54,18 @@ async def infer_kotlin_dependencies_via_source_analysis(
     kotlin_infer_subsystem: KotlinInferSubsystem,
     jvm: JvmSubsystem,
     symbol_mapping: SymbolMapping,
+    parser_tool: KotlinParser,
 ) -> InferredDependencies:
     if not kotlin_infer_subsystem.imports:
         return InferredDependencies([])
 
     address = request.field_set.address
-    explicitly_provided_deps, analysis = await concurrently(
+    source_files = await determine_source_files(SourceFilesRequest([request.field_set.source]))
+    explicitly_provided_deps, (analysis,) = await concurrently(
         determine_explicitly_provided_dependencies(
             **implicitly(DependenciesRequest(request.field_set.dependencies))
         ),
-        resolve_fallible_result_to_analysis(
-            **implicitly(SourceFilesRequest([request.field_set.source]))
-        ),
+        analyze_kotlin_sources([source_files], parser_tool),
     )
 
     symbols: OrderedSet[str] = OrderedSet()
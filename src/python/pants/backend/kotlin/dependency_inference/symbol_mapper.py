@@ -2,14 +2,24 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 
 from pants.backend.kotlin.dependency_inference.kotlin_parser import (
+    KotlinParser,
+    KotlinSourceDependencyAnalysis,
+    KotlinSourceDependencyAnalysisBatchRequest,
+    analyze_kotlin_source_dependencies_batch,
     resolve_fallible_result_to_analysis,
 )
 from pants.backend.kotlin.target_types import KotlinSourceField
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.core.util_rules.source_files import (
+    SourceFiles,
+    SourceFilesRequest,
+    determine_source_files,
+)
+from pants.engine.fs import MergeDigests
 from pants.engine.internals.selectors import concurrently
+from pants.engine.intrinsics import digest_to_snapshot
 from pants.engine.rules import collect_rules, implicitly, rule
 from pants.engine.target import AllTargets, Targets
 from pants.engine.unions import UnionRule
@@ -17,6 +27,7 @@ from pants.jvm.dependency_inference.artifact_mapper import MutableTrieNode
 from pants.jvm.dependency_inference.symbol_mapper import FirstPartyMappingRequest, SymbolMap
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 
@@ -35,18 +46,73 @@ async def find_all_kotlin_targets(targets: AllTargets) -> AllKotlinTargets:
     return AllKotlinTargets(tgt for tgt in targets if tgt.has_field(KotlinSourceField))
 
 
+class AllKotlinSourceAnalyses(FrozenDict[str, KotlinSourceDependencyAnalysis]):
+    """The analysis of the source of every Kotlin target, by path."""
+
+
+@rule(desc="Analyze all Kotlin sources for dependencies", level=LogLevel.DEBUG)
+async def analyze_all_kotlin_sources(kotlin_targets: AllKotlinTargets) -> AllKotlinSourceAnalyses:
+    all_source_files = await concurrently(
+        determine_source_files(SourceFilesRequest([target[KotlinSourceField]]))
+        for target in kotlin_targets
+    )
+    merged_snapshot = await digest_to_snapshot(
+        **implicitly(
+            MergeDigests(source_files.snapshot.digest for source_files in all_source_files)
+        )
+    )
+    batch = await analyze_kotlin_source_dependencies_batch(
+        KotlinSourceDependencyAnalysisBatchRequest(SourceFiles(merged_snapshot, ())),
+        **implicitly(),
+    )
+    return AllKotlinSourceAnalyses(batch)
+
+
+async def analyze_kotlin_sources(
+    all_source_files: Sequence[SourceFiles], tool: KotlinParser
+) -> tuple[KotlinSourceDependencyAnalysis, ...]:
+    """Analyze each of the given single-file `SourceFiles`.
+
+    If `[kotlin-parser].batch_size` is set, the analyses are looked up in
+    `AllKotlinSourceAnalyses`, which analyzes the sources of all Kotlin targets together in
+    batches once, for both the symbol map and the inference of each target. Otherwise (or for a
+    file which is not the source of a Kotlin target), each file is analyzed by its own process.
+    """
+    all_analyses = (
+        await analyze_all_kotlin_sources(**implicitly())
+        if tool.batch_size > 0
+        else AllKotlinSourceAnalyses()
+    )
+    unanalyzed = [
+        source_files
+        for source_files in all_source_files
+        if source_files.files[0] not in all_analyses
+    ]
+    analyses = await concurrently(
+        resolve_fallible_result_to_analysis(**implicitly({source_files: SourceFiles}))
+        for source_files in unanalyzed
+    )
+    analyzed = {
+        source_files.files[0]: analysis for source_files, analysis in zip(unanalyzed, analyses)
+    }
+    return tuple(
+        all_analyses[path] if path in all_analyses else analyzed[path]
+        for path in (source_files.files[0] for source_files in all_source_files)
+    )
+
+
 @rule(desc="Map all first party Kotlin targets to their symbols", level=LogLevel.DEBUG)
 async def map_first_party_kotlin_targets_to_symbols(
     _: FirstPartyKotlinTargetsMappingRequest,
     kotlin_targets: AllKotlinTargets,
     jvm: JvmSubsystem,
+    parser_tool: KotlinParser,
 ) -> SymbolMap:
-    source_analysis = await concurrently(
-        resolve_fallible_result_to_analysis(
-            **implicitly(SourceFilesRequest([target[KotlinSourceField]]))
-        )
+    all_source_files = await concurrently(
+        determine_source_files(SourceFilesRequest([target[KotlinSourceField]]))
         for target in kotlin_targets
     )
+    source_analysis = await analyze_kotlin_sources(all_source_files, parser_tool)
     address_and_analysis = zip(
         [(tgt.address, tgt[JvmResolveField].normalized_value(jvm)) for tgt in kotlin_targets],
         source_analysis,
@@ -1,18 +1,34 @@
 # Copyright 2019 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
 from pants.core.goals.resolves import ExportableTool
-from pants.core.util_rules.external_tool import TemplatedExternalTool, download_external_tool
+from pants.core.util_rules.external_tool import (
+    DownloadedExternalTool,
+    TemplatedExternalTool,
+    download_external_tool,
+)
 from pants.engine.console import Console
-from pants.engine.fs import MergeDigests, PathGlobs, SpecsPaths
+from pants.engine.fs import CreateDigest, Digest, FileEntry, MergeDigests, PathGlobs, SpecsPaths
 from pants.engine.goal import Goal, GoalSubsystem
-from pants.engine.intrinsics import merge_digests, path_globs_to_digest
+from pants.engine.intrinsics import (
+    create_digest,
+    get_digest_entries,
+    merge_digests,
+    path_globs_to_digest,
+)
 from pants.engine.platform import Platform
 from pants.engine.process import Process, execute_process_or_raise
 from pants.engine.rules import collect_rules, concurrently, goal_rule, implicitly
 from pants.engine.unions import UnionRule
-from pants.option.option_types import ArgsListOption
+from pants.option.option_types import ArgsListOption, IntOption
+from pants.util.collections import partition_sequentially
 from pants.util.logging import LogLevel
-from pants.util.strutil import pluralize
+from pants.util.strutil import pluralize, softwrap
 
 
 class SuccinctCodeCounter(TemplatedExternalTool):
@@ -51,15 +67,136 @@ class CountLinesOfCodeSubsystem(GoalSubsystem):
     name = "count-loc"
     help = "Count lines of code."
 
+    batch_size = IntOption(
+        default=0,
+        advanced=True,
+        help=softwrap(
+            f"""
+            If positive, run `{SuccinctCodeCounter.options_scope}` on batches of up to this many
+            files, and sum the counts of the batches.
+
+            Files are assigned to batches stably, and each batch is counted by its own process, so
+            after a change to a few files, only the batches containing them are counted again.
+            The summed counts are printed as a table of the lines of each language, so
+            `[{SuccinctCodeCounter.options_scope}].args` which change the output format of
+            `{SuccinctCodeCounter.options_scope}` have no effect.
+            """
+        ),
+    )
+
 
 class CountLinesOfCode(Goal):
     subsystem_cls = CountLinesOfCodeSubsystem
     environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
 
 
+@dataclass(frozen=True)
+class _LanguageCounts:
+    files: int = 0
+    lines: int = 0
+    blanks: int = 0
+    comments: int = 0
+    code: int = 0
+    complexity: int = 0
+
+    def __add__(self, other: _LanguageCounts) -> _LanguageCounts:
+        return _LanguageCounts(
+            self.files + other.files,
+            self.lines + other.lines,
+            self.blanks + other.blanks,
+            self.comments + other.comments,
+            self.code + other.code,
+            self.complexity + other.complexity,
+        )
+
+
+def _parse_scc_json(stdout: bytes) -> dict[str, _LanguageCounts]:
+    return {
+        language["Name"]: _LanguageCounts(
+            files=language["Count"],
+            lines=language["Lines"],
+            blanks=language["Blank"],
+            comments=language["Comment"],
+            code=language["Code"],
+            complexity=language["Complexity"],
+        )
+        for language in json.loads(stdout) or ()
+    }
+
+
+def _format_counts(counts: Mapping[str, _LanguageCounts]) -> str:
+    """Format the counts of each language as a table, sorted by number of files."""
+
+    def row(name: str, c: _LanguageCounts) -> str:
+        return (
+            f"{name:<20}{c.files:>10}{c.lines:>10}{c.blanks:>10}{c.comments:>10}{c.code:>10}"
+            f"{c.complexity:>12}"
+        )
+
+    separator = "─" * 82
+    lines = [
+        separator,
+        f"{'Language':<20}{'Files':>10}{'Lines':>10}{'Blanks':>10}{'Comments':>10}{'Code':>10}"
+        f"{'Complexity':>12}",
+        separator,
+        *(
+            row(name, counts[name])
+            for name in sorted(counts, key=lambda name: (-counts[name].files, name))
+        ),
+        separator,
+        row("Total", sum(counts.values(), _LanguageCounts())),
+        separator,
+    ]
+    return "\n".join(lines) + "\n"
+
+
+async def _count_lines_in_batches(
+    specs_digest: Digest,
+    scc_program: DownloadedExternalTool,
+    args: Iterable[str],
+    batch_size: int,
+) -> dict[str, _LanguageCounts]:
+    entries = [
+        entry for entry in await get_digest_entries(specs_digest) if isinstance(entry, FileEntry)
+    ]
+    batches = list(
+        partition_sequentially(
+            entries,
+            key=lambda entry: entry.path,
+            size_target=max(1, batch_size // 2),
+            size_max=batch_size,
+        )
+    )
+    batch_digests = await concurrently(create_digest(CreateDigest(batch)) for batch in batches)
+    input_digests = await concurrently(
+        merge_digests(MergeDigests((scc_program.digest, batch_digest)))
+        for batch_digest in batch_digests
+    )
+    results = await concurrently(
+        execute_process_or_raise(
+            **implicitly(
+                Process(
+                    # The last `--format` wins, so this overrides any format in the args.
+                    argv=(scc_program.exe, *args, "--format=json"),
+                    input_digest=input_digest,
+                    description=f"Count lines of code for {pluralize(len(batch), 'file')}",
+                    level=LogLevel.DEBUG,
+                )
+            )
+        )
+        for batch, input_digest in zip(batches, input_digests)
+    )
+    totals: dict[str, _LanguageCounts] = {}
+    for result in results:
+        for name, counts in _parse_scc_json(result.stdout).items():
+            totals[name] = totals.get(name, _LanguageCounts()) + counts
+    return totals
+
+
 @goal_rule
 async def count_loc(
     console: Console,
+    count_loc_subsystem: CountLinesOfCodeSubsystem,
     succinct_code_counter: SuccinctCodeCounter,
     specs_paths: SpecsPaths,
     platform: Platform,
@@ -71,6 +208,16 @@ async def count_loc(
         path_globs_to_digest(PathGlobs(globs=specs_paths.files)),
         download_external_tool(succinct_code_counter.get_request(platform)),
     )
+    if count_loc_subsystem.batch_size > 0:
+        counts = await _count_lines_in_batches(
+            specs_digest,
+            scc_program,
+            succinct_code_counter.args,
+            count_loc_subsystem.batch_size,
+        )
+        console.print_stdout(_format_counts(counts))
+        return CountLinesOfCode(exit_code=0)
+
     input_digest = await merge_digests(MergeDigests((scc_program.digest, specs_digest)))
     result = await execute_process_or_raise(
         **implicitly(
@@ -53,7 +53,8 @@ def assert_counts(
 
 
 @pytest.mark.platform_specific_behavior
-def test_count_loc(rule_runner: RuleRunner) -> None:
+@pytest.mark.parametrize("batch_size", [0, 1])
+def test_count_loc(rule_runner: RuleRunner, batch_size: int) -> None:
     py_dir = "src/py/foo"
     elixir_dir = "src/elixir/foo"
     rule_runner.write_files(
@@ -67,7 +68,8 @@ def test_count_loc(rule_runner: RuleRunner) -> None:
         }
     )
     result = rule_runner.run_goal_rule(
-        CountLinesOfCode, args=[f"{py_dir}:lib", f"{elixir_dir}:lib"]
+        CountLinesOfCode,
+        args=[f"--count-loc-batch-size={batch_size}", f"{py_dir}:lib", f"{elixir_dir}:lib"],
     )
     assert result.exit_code == 0
     assert_counts(result.stdout, "Python", num_files=2, blank=2, comment=3, code=2)
@@ -84,7 +86,20 @@ def test_passthrough_args(rule_runner: RuleRunner) -> None:
     assert "Estimated Cost to Develop" not in result.stdout
 
 
-def test_files_without_owners(rule_runner: RuleRunner) -> None:
+def test_batched_passthrough_args(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files({"foo.py": "print('hello world!')\n", "foo.pyx": "print('hi')\n"})
+    # Arguments which change what is counted still apply, and the output format is overridden.
+    result = rule_runner.run_goal_rule(
+        CountLinesOfCode,
+        args=["--count-loc-batch-size=1", "foo.*", "--", "--exclude-ext=pyx", "--format=csv"],
+    )
+    assert result.exit_code == 0
+    assert_counts(result.stdout, "Python", code=1)
+    assert "Cython" not in result.stdout
+
+
+@pytest.mark.parametrize("batch_size", [0, 1])
+def test_files_without_owners(rule_runner: RuleRunner, batch_size: int) -> None:
     """cloc works on any readable file in the build root, regardless of whether it's declared in a
     BUILD file."""
     rule_runner.write_files(
@@ -93,7 +108,9 @@ def test_files_without_owners(rule_runner: RuleRunner) -> None:
             "test/foo.hs": 'main = putStrLn "Whats Pants, precious?"',
         }
     )
-    result = rule_runner.run_goal_rule(CountLinesOfCode, args=["test/foo.*"])
+    result = rule_runner.run_goal_rule(
+        CountLinesOfCode, args=[f"--count-loc-batch-size={batch_size}", "test/foo.*"]
+    )
     assert result.exit_code == 0
     assert_counts(result.stdout, "Elixir", code=1)
     assert_counts(result.stdout, "Haskell", code=1)
@@ -3,9 +3,11 @@
 
 from __future__ import annotations
 
+import itertools
 import json
+import textwrap
 from collections import deque
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 
 from pants.base.specs import Specs
@@ -24,7 +26,8 @@ from pants.engine.target import (
     Targets,
     TransitiveTargetsRequest,
 )
-from pants.option.option_types import StrOption
+from pants.option.option_types import BoolOption, IntOption, StrOption
+from pants.util.strutil import softwrap
 
 
 class PathsSubsystem(Outputting, GoalSubsystem):
@@ -44,6 +47,31 @@ class PathsSubsystem(Outputting, GoalSubsystem):
         help="The path end address",
     )
 
+    max_paths = IntOption(
+        default=None,
+        help=softwrap(
+            """
+            The maximum number of paths to list. Paths are found shortest first for each pair of
+            start and end addresses.
+            """
+        ),
+    )
+
+    prune = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            Before searching for paths, prune the dependency graph to the targets which are both
+            reachable from the start address and can reach the end address, and write each path as
+            soon as it is found rather than once all paths have been found.
+
+            This uses much less time and memory when there are many paths between well-connected
+            targets, particularly in combination with `--max-paths`. The paths listed are the same.
+            """
+        ),
+        advanced=True,
+    )
+
 
 class PathsGoal(Goal):
     subsystem_cls = PathsSubsystem
@@ -86,6 +114,90 @@ def find_paths_breadth_first(
             visited_edges.add(current_edge)
 
 
+# A path of target indexes, as a linked list of `(last target, prefix)`.
+_LinkedPath = tuple[int, "_LinkedPath | None"]
+
+
+def find_paths_in_pruned_graph(
+    adjacency_lists: Mapping[Address, Sequence[Address]], from_target: Address, to_target: Address
+) -> Iterator[list[Address]]:
+    """Yields the same paths as `find_paths_breadth_first`, in the same order.
+
+    No path from `from_target` to `to_target` can visit a target which is not reachable from
+    `from_target`, or which cannot reach `to_target`, so the graph is first pruned to the targets
+    which satisfy both, as tracked by a bitmap over the target indexes. Paths are represented by
+    linking to their prefix rather than by copying it, so each path waiting in the queue uses
+    constant memory.
+    """
+
+    if from_target == to_target:
+        yield [from_target]
+        return
+
+    index: dict[Address, int] = {}
+    for address in itertools.chain(adjacency_lists, *adjacency_lists.values()):
+        index.setdefault(address, len(index))
+    if from_target not in index or to_target not in index:
+        return
+    addresses = list(index)
+    n = len(addresses)
+    successors: list[list[int]] = [[] for _ in range(n)]
+    for address, deps in adjacency_lists.items():
+        successors[index[address]] = [index[dep] for dep in deps]
+    start, goal = index[from_target], index[to_target]
+
+    def reachable(roots: Iterable[int], edges: Sequence[Iterable[int]]) -> bytearray:
+        bitmap = bytearray(n)
+        queue = deque(roots)
+        for node in queue:
+            bitmap[node] = 1
+        while queue:
+            for next_node in edges[queue.popleft()]:
+                if not bitmap[next_node]:
+                    bitmap[next_node] = 1
+                    queue.append(next_node)
+        return bitmap
+
+    forward = reachable([start], successors)
+    if not forward[goal]:
+        return
+    predecessors: list[list[int]] = [[] for _ in range(n)]
+    for node, deps in enumerate(successors):
+        if forward[node]:
+            for dep in deps:
+                predecessors[dep].append(node)
+    backward = reachable([goal], predecessors)
+    pruned_successors = [
+        [dep for dep in deps if backward[dep]] if forward[node] and backward[node] else []
+        for node, deps in enumerate(successors)
+    ]
+
+    def to_addresses(path: _LinkedPath | None) -> list[Address]:
+        result = []
+        while path is not None:
+            node, path = path
+            result.append(addresses[node])
+        return result[::-1]
+
+    # Each edge is encoded as a single int.
+    visited_edges: set[int] = set()
+    to_walk_paths: deque[_LinkedPath] = deque([(start, None)])
+    while to_walk_paths:
+        cur_path = to_walk_paths.popleft()
+        target, prefix = cur_path
+        prev_target = -1 if prefix is None else prefix[0]
+        current_edge = (prev_target + 1) * n + target
+        if current_edge in visited_edges:
+            continue
+        visited_edges.add(current_edge)
+        for dep in pruned_successors[target]:
+            dep_path = (dep, cur_path)
+            if dep == goal:
+                yield to_addresses(dep_path)
+            else:
+                to_walk_paths.append(dep_path)
+
+
 @dataclass
 class SpecsPaths:
     paths: list[list[str]]
@@ -108,12 +220,9 @@ class RootDestinationsPair:
     destinations: Targets
 
 
-@rule(desc="Get paths between root and destination.")
-async def get_paths_between_root_and_destination(pair: RootDestinationPair) -> SpecsPaths:
+async def _get_adjacency_lists(root: Address) -> dict[Address, Targets]:
     transitive_targets = await transitive_targets_get(
-        TransitiveTargetsRequest(
-            [pair.root.address], should_traverse_deps_predicate=AlwaysTraverseDeps()
-        ),
+        TransitiveTargetsRequest([root], should_traverse_deps_predicate=AlwaysTraverseDeps()),
         **implicitly(),
     )
 
@@ -129,7 +238,12 @@ async def get_paths_between_root_and_destination(pair: RootDestinationPair) -> S
     )
 
     transitive_targets_closure_addresses = (t.address for t in transitive_targets.closure)
-    adjacency_lists = dict(zip(transitive_targets_closure_addresses, adjacent_targets_per_target))
+    return dict(zip(transitive_targets_closure_addresses, adjacent_targets_per_target))
+
+
+@rule(desc="Get paths between root and destination.")
+async def get_paths_between_root_and_destination(pair: RootDestinationPair) -> SpecsPaths:
+    adjacency_lists = await _get_adjacency_lists(pair.root.address)
 
     spec_paths = []
     for path in find_paths_breadth_first(
@@ -154,6 +268,37 @@ async def get_paths_between_root_and_destinations(
     return SpecsPathsCollection(spec_paths=list(spec_paths))
 
 
+def _write_json_list(items: Iterable[object], write: Callable[[str], None]) -> None:
+    """Write the items as `json.dumps(list(items), indent=2)` would, but one at a time."""
+    first = True
+    for item in items:
+        write(("[\n" if first else ",\n") + textwrap.indent(json.dumps(item, indent=2), "  "))
+        first = False
+    write("[]\n" if first else "\n]\n")
+
+
+async def _write_pruned_paths(
+    from_tgts: Targets,
+    to_tgts: Targets,
+    max_paths: int | None,
+    write: Callable[[str], None],
+) -> None:
+    adjacency_lists_per_root = await concurrently(
+        _get_adjacency_lists(root.address) for root in from_tgts
+    )
+    all_paths = (
+        [address.spec for address in path]
+        for root, adjacency_lists in zip(from_tgts, adjacency_lists_per_root)
+        for destination in to_tgts
+        for path in find_paths_in_pruned_graph(
+            {address: [t.address for t in deps] for address, deps in adjacency_lists.items()},
+            root.address,
+            destination.address,
+        )
+    )
+    _write_json_list(itertools.islice(all_paths, max_paths), write)
+
+
 @goal_rule
 async def paths(console: Console, paths_subsystem: PathsSubsystem) -> PathsGoal:
     path_from = paths_subsystem.from_
@@ -190,6 +335,11 @@ async def paths(console: Console, paths_subsystem: PathsSubsystem) -> PathsGoal:
         ),
     )
 
+    if paths_subsystem.prune:
+        with paths_subsystem.output(console) as write_stdout:
+            await _write_pruned_paths(from_tgts, to_tgts, paths_subsystem.max_paths, write_stdout)
+        return PathsGoal(exit_code=0)
+
     all_spec_paths = []
     spec_paths = await concurrently(
         get_paths_between_root_and_destinations(
@@ -202,6 +352,9 @@ async def paths(console: Console, paths_subsystem: PathsSubsystem) -> PathsGoal:
         for path in (p.paths for p in spec_path.spec_paths):
             all_spec_paths.extend(path)
 
+    if paths_subsystem.max_paths is not None:
+        all_spec_paths = all_spec_paths[: paths_subsystem.max_paths]
+
     with paths_subsystem.output(console) as write_stdout:
         write_stdout(json.dumps(all_spec_paths, indent=2) + "\n")
 
@@ -87,14 +87,20 @@ def assert_paths(
     path_from: str,
     path_to: str,
     expected: list[list[str]] | None = None,
+    max_paths: int | None = None,
 ) -> None:
     args = []
     if path_from:
         args += [f"--paths-from={path_from}"]
     if path_to:
         args += [f"--paths-to={path_to}"]
+    if max_paths is not None:
+        args += [f"--paths-max-paths={max_paths}"]
 
     result = rule_runner.run_goal_rule(PathsGoal, args=[*args])
+    # Pruning the graph must not change the output, including the order of the paths.
+    pruned_result = rule_runner.run_goal_rule(PathsGoal, args=[*args, "--paths-prune"])
+    assert pruned_result.stdout == result.stdout
 
     if expected is not None:
         print(sorted(json.loads(result.stdout)))
@@ -204,3 +210,14 @@ def test_excluded_paths(rule_runner: RuleRunner) -> None:
         path_to="src/prj/b",
         expected=[],
     )
+
+
+def test_max_paths(rule_runner: RuleRunner) -> None:
+    assert_paths(rule_runner, path_from="leaf::", path_to="base::", max_paths=3)
+    result = rule_runner.run_goal_rule(
+        PathsGoal, args=["--paths-from=leaf:leaf", "--paths-to=base:base", "--paths-max-paths=1"]
+    )
+    assert json.loads(result.stdout) in (
+        [["leaf:leaf", "intermediate:intermediate", "base:base"]],
+        [["leaf:leaf", "intermediate2:intermediate2", "base:base"]],
+    )
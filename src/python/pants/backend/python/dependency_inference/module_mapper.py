@@ -10,7 +10,7 @@ import logging
 import os
 from collections import defaultdict
 from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import total_ordering
 from pathlib import PurePath
 from typing import DefaultDict
@@ -455,17 +455,166 @@ class PythonModuleOwnersRequest:
     locality: str | None = None
 
 
+@dataclass(frozen=True)
+class _ModuleTrieNode:
+    """A node of the trie of module names of a resolve.
+
+    The providers are those of the module named by the path from the root to this node.
+    """
+
+    children: dict[str, _ModuleTrieNode] = field(default_factory=dict)
+    third_party: list[ModuleProvider] = field(default_factory=list)
+    first_party: list[ModuleProvider] = field(default_factory=list)
+
+    def providers(self, *, first_party: bool) -> list[ModuleProvider]:
+        return self.first_party if first_party else self.third_party
+
+
+@dataclass(frozen=True)
+class PythonModuleOwnersIndex:
+    """The first- and third-party module mappings, indexed as a trie of module names per resolve.
+
+    Looking up the providers of a module (or of its ancestors) walks the trie once, rather than
+    looking up each of the module's ancestors in the mappings.
+    """
+
+    first_party_mapping: FirstPartyPythonModuleMapping
+    third_party_mapping: ThirdPartyPythonModuleMapping
+    _tries: dict[ResolveName, _ModuleTrieNode] = field(
+        init=False, default_factory=dict, compare=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        for is_first_party, mapping in (
+            (False, self.third_party_mapping.resolves_to_modules_to_providers),
+            (True, self.first_party_mapping.resolves_to_modules_to_providers),
+        ):
+            for resolve, modules_to_providers in mapping.items():
+                root = self._tries.setdefault(resolve, _ModuleTrieNode())
+                for module, providers in modules_to_providers.items():
+                    node = root
+                    for part in module.split("."):
+                        node = node.children.setdefault(part, _ModuleTrieNode())
+                    node.providers(first_party=is_first_party).extend(providers)
+
+    def _walk(self, module_parts: list[str], resolve: str) -> list[_ModuleTrieNode]:
+        """The nodes of the module and of each of its ancestors that exist, outermost first."""
+        path: list[_ModuleTrieNode] = []
+        node = self._tries.get(resolve)
+        for part in module_parts:
+            if node is None:
+                break
+            node = node.children.get(part)
+            if node is not None:
+                path.append(node)
+        return path
+
+    def _third_party_providers(
+        self, module_parts: list[str], resolve: str
+    ) -> tuple[PossibleModuleProvider, ...]:
+        # See `ThirdPartyPythonModuleMapping._providers_for_resolve`: the providers of the closest
+        # ancestor (or the module itself) that has any.
+        path = self._walk(module_parts, resolve)
+        for depth in range(len(path), 0, -1):
+            providers = path[depth - 1].third_party
+            if providers:
+                ancestry = len(module_parts) - depth
+                return tuple(PossibleModuleProvider(mp, ancestry) for mp in providers)
+        return ()
+
+    def _first_party_providers(
+        self, module_parts: list[str], resolve: str
+    ) -> tuple[PossibleModuleProvider, ...]:
+        # See `FirstPartyPythonModuleMapping._providers_for_resolve`: the providers of the module
+        # itself, or else of its direct parent.
+        path = self._walk(module_parts, resolve)
+        if len(path) == len(module_parts) and path[-1].first_party:
+            return tuple(PossibleModuleProvider(mp, 0) for mp in path[-1].first_party)
+        if len(module_parts) > 1 and len(path) >= len(module_parts) - 1:
+            return tuple(
+                PossibleModuleProvider(mp, 1) for mp in path[len(module_parts) - 2].first_party
+            )
+        return ()
+
+    def providers_for_module(
+        self, module: str, resolve: str | None
+    ) -> tuple[PossibleModuleProvider, ...]:
+        """Find all third-party and then first-party providers for the module.
+
+        Equivalent to (but faster than) concatenating the results of `providers_for_module` of
+        the third-party and then the first-party mapping.
+        """
+        module_parts = module.split(".")
+        third_party_resolves = (
+            [resolve] if resolve else self.third_party_mapping.resolves_to_modules_to_providers
+        )
+        first_party_resolves = (
+            [resolve] if resolve else self.first_party_mapping.resolves_to_modules_to_providers
+        )
+        return (
+            *itertools.chain.from_iterable(
+                self._third_party_providers(module_parts, r) for r in third_party_resolves
+            ),
+            *itertools.chain.from_iterable(
+                self._first_party_providers(module_parts, r) for r in first_party_resolves
+            ),
+        )
+
+
+@rule(desc="Index the owners of Python modules", level=LogLevel.DEBUG)
+async def index_python_module_owners(
+    first_party_mapping: FirstPartyPythonModuleMapping,
+    third_party_mapping: ThirdPartyPythonModuleMapping,
+) -> PythonModuleOwnersIndex:
+    return PythonModuleOwnersIndex(first_party_mapping, third_party_mapping)
+
+
+@dataclass(frozen=True)
+class PythonModulesOwnersRequest:
+    """A request for the owners of many modules, e.g. of all the imports of a file.
+
+    Resolving many modules in one request avoids the overhead of one rule invocation per module.
+    """
+
+    modules: tuple[str, ...]
+    resolve: str | None
+    # See `PythonModuleOwnersRequest.locality`.
+    locality: str | None = None
+
+
+class PythonModulesOwners(FrozenDict[str, PythonModuleOwners]):
+    """The owners of each module of a `PythonModulesOwnersRequest`."""
+
+
 @rule
 async def map_module_to_address(
     request: PythonModuleOwnersRequest,
-    first_party_mapping: FirstPartyPythonModuleMapping,
-    third_party_mapping: ThirdPartyPythonModuleMapping,
+    index: PythonModuleOwnersIndex,
 ) -> PythonModuleOwners:
-    possible_providers: tuple[PossibleModuleProvider, ...] = (
-        *third_party_mapping.providers_for_module(request.module, resolve=request.resolve),
-        *first_party_mapping.providers_for_module(request.module, resolve=request.resolve),
+    return _module_owners(
+        index.providers_for_module(request.module, resolve=request.resolve), request.locality
     )
 
+
+@rule
+async def map_modules_to_addresses(
+    request: PythonModulesOwnersRequest,
+    index: PythonModuleOwnersIndex,
+) -> PythonModulesOwners:
+    return PythonModulesOwners(
+        (
+            module,
+            _module_owners(
+                index.providers_for_module(module, resolve=request.resolve), request.locality
+            ),
+        )
+        for module in request.modules
+    )
+
+
+def _module_owners(
+    possible_providers: tuple[PossibleModuleProvider, ...], locality: str | None
+) -> PythonModuleOwners:
     # We first attempt to disambiguate conflicting providers by taking - for each provider type -
     # the providers of the closest ancestors to the requested modules.
     # E.g., if we have a provider for foo.bar and for foo.bar.baz, prefer the latter.
@@ -485,7 +634,7 @@ async def map_module_to_address(
         if possible_provider.ancestry == val[0]:
             val[1].append(possible_provider.provider)
 
-    if request.locality:
+    if locality:
         # For each provider type, if we have more than one provider left, prefer
         # the one with the closest common ancestor to the requester.
         for val in type_to_closest_providers.values():
@@ -495,9 +644,7 @@ async def map_module_to_address(
             providers_with_closest_common_ancestor: list[ModuleProvider] = []
             closest_common_ancestor_len = 0
             for provider in providers:
-                common_ancestor_len = len(
-                    os.path.commonpath([request.locality, provider.addr.spec_path])
-                )
+                common_ancestor_len = len(os.path.commonpath([locality, provider.addr.spec_path]))
                 if common_ancestor_len > closest_common_ancestor_len:
                     closest_common_ancestor_len = common_ancestor_len
                     providers_with_closest_common_ancestor = []
@@ -33,7 +33,10 @@ from pants.backend.python.dependency_inference.module_mapper import (
     ModuleProviderType,
     PossibleModuleProvider,
     PythonModuleOwners,
+    PythonModuleOwnersIndex,
     PythonModuleOwnersRequest,
+    PythonModulesOwners,
+    PythonModulesOwnersRequest,
     ThirdPartyPythonModuleMapping,
     generate_mappings_from_pattern,
     module_from_stripped_path,
@@ -256,6 +259,66 @@ def test_third_party_modules_mapping() -> None:
     assert_addresses("two_resolves", (pants_provider0,), resolve="another-resolve")
 
 
+def test_module_owners_index_matches_mappings() -> None:
+    def provider(name: str, typ: ModuleProviderType = ModuleProviderType.IMPL) -> ModuleProvider:
+        return ModuleProvider(Address("", target_name=name), typ)
+
+    third_party_mapping = ThirdPartyPythonModuleMapping(
+        FrozenDict(
+            {
+                "a": FrozenDict(
+                    {
+                        "colors": (provider("ansicolors"), provider("types-ansicolors")),
+                        "pants": (provider("pantsbuild"),),
+                        "pants.testutil": (provider("pantsbuild.testutil"),),
+                        "shared": (provider("shared-a"),),
+                    }
+                ),
+                "b": FrozenDict({"shared": (provider("shared-b"),)}),
+            }
+        )
+    )
+    first_party_mapping = FirstPartyPythonModuleMapping(
+        FrozenDict(
+            {
+                "a": FrozenDict(
+                    {
+                        "project.app": (provider("app"),),
+                        "project.app.models": (provider("models"),),
+                        "shared": (provider("shared-src"),),
+                        "pants.util": (provider("util"),),
+                    }
+                ),
+                "c": FrozenDict({"project.app": (provider("app-c"),)}),
+            }
+        )
+    )
+    index = PythonModuleOwnersIndex(first_party_mapping, third_party_mapping)
+    modules = [
+        "colors",
+        "colors.red",
+        "pants",
+        "pants.testutil.foo.bar",
+        "pants.util",
+        "pants.util.strutil.softwrap",
+        "project",
+        "project.app",
+        "project.app.App",
+        "project.app.models.Model",
+        "project.app.models.Model.field",
+        "shared",
+        "shared.x",
+        "unknown",
+        "unknown.x",
+    ]
+    for resolve in ("a", "b", "c", "unknown", None):
+        for module in modules:
+            assert index.providers_for_module(module, resolve) == (
+                *third_party_mapping.providers_for_module(module, resolve),
+                *first_party_mapping.providers_for_module(module, resolve),
+            ), (module, resolve)
+
+
 @pytest.fixture
 def rule_runner() -> RuleRunner:
     return RuleRunner(
@@ -269,6 +332,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(FirstPartyPythonModuleMapping, []),
             QueryRule(ThirdPartyPythonModuleMapping, []),
             QueryRule(PythonModuleOwners, [PythonModuleOwnersRequest]),
+            QueryRule(PythonModulesOwners, [PythonModulesOwnersRequest]),
         ],
         target_types=[
             PythonSourceTarget,
@@ -927,6 +991,22 @@ def test_map_module_considers_resolves(rule_runner: RuleRunner) -> None:
         Address("", target_name="dep2"),
     )
 
+    # Resolving many modules at once gives the same owners as resolving each module.
+    for resolve in ("a", "b", None):
+        modules = ("dep", "dep.submodule", "unknown")
+        owners = rule_runner.request(
+            PythonModulesOwners, [PythonModulesOwnersRequest(modules, resolve)]
+        )
+        assert owners == PythonModulesOwners(
+            (
+                module,
+                rule_runner.request(
+                    PythonModuleOwners, [PythonModuleOwnersRequest(module, resolve)]
+                ),
+            )
+            for module in modules
+        )
+
 
 def test_issue_15111(rule_runner: RuleRunner) -> None:
     """Ensure we can handle when a single address provides multiple modules.
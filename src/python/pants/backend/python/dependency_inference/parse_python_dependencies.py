@@ -4,21 +4,33 @@ from __future__ import annotations
 
 import logging
 import os
-from collections.abc import Iterable
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
-from fnmatch import fnmatchcase
+from fnmatch import translate
+from pathlib import PurePath
 
+from pants.backend.python.dependency_inference.module_mapper import AllPythonTargets
 from pants.backend.python.dependency_inference.subsystem import PythonInferSubsystem
-from pants.core.util_rules.source_files import SourceFiles
+from pants.backend.python.target_types import PythonSourceField
+from pants.core.util_rules.source_files import (
+    SourceFiles,
+    SourceFilesRequest,
+    determine_source_files,
+)
 from pants.core.util_rules.stripped_source_files import strip_source_roots
 from pants.engine.collection import DeduplicatedCollection
-from pants.engine.fs import CreateDigest, Digest, FileContent
+from pants.engine.fs import CreateDigest, Digest, FileContent, RemovePrefix
+from pants.engine.internals.native_dep_inference import NativePythonFileDependencies
 from pants.engine.internals.native_engine import NativeDependenciesRequest
-from pants.engine.intrinsics import create_digest, parse_python_deps
-from pants.engine.rules import collect_rules, rule
+from pants.engine.intrinsics import create_digest, parse_python_deps, remove_prefix
+from pants.engine.rules import collect_rules, implicitly, rule
+from pants.source.source_root import SourceRootRequest, get_optional_source_root
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.resources import read_resource
+from pants.util.strutil import pluralize
 
 logger = logging.getLogger(__name__)
 
@@ -88,8 +100,72 @@ class ParserScript:
 _scripts_package = "pants.backend.python.dependency_inference.scripts"
 
 
-def _is_ignored_string_import(module_path: str, ignored_patterns: tuple[str, ...]) -> bool:
-    return any(fnmatchcase(module_path, ignored_pattern) for ignored_pattern in ignored_patterns)
+def _string_import_ignore_regex(ignored_patterns: tuple[str, ...]) -> re.Pattern | None:
+    """Combine the glob patterns into one regex, to match each string against all of them at once."""
+    if not ignored_patterns:
+        return None
+    return re.compile("|".join(translate(pattern) for pattern in ignored_patterns))
+
+
+def _classify_string_candidates(
+    candidates: Iterable[str], python_infer_subsystem: PythonInferSubsystem
+) -> tuple[frozenset[str], frozenset[str]]:
+    """Return which of the string candidates may be imports, and which may be assets.
+
+    Each distinct candidate is classified once, however many files it appears in.
+    """
+    if not python_infer_subsystem.string_imports and not python_infer_subsystem.assets:
+        return frozenset(), frozenset()
+    ignore_regex = _string_import_ignore_regex(python_infer_subsystem.string_import_ignore)
+    string_imports = set()
+    assets = set()
+    for string in set(candidates):
+        if (
+            python_infer_subsystem.string_imports
+            and string.count(".") >= python_infer_subsystem.string_imports_min_dots
+            and all(part.isidentifier() for part in string.split("."))
+            and not (ignore_regex and ignore_regex.match(string))
+        ):
+            string_imports.add(string)
+        if (
+            python_infer_subsystem.assets
+            and string.count("/") >= python_infer_subsystem.assets_min_slashes
+        ):
+            assets.add(string)
+    return frozenset(string_imports), frozenset(assets)
+
+
+def _python_files_dependencies(
+    native_path_to_deps: Mapping[str, NativePythonFileDependencies],
+    python_infer_subsystem: PythonInferSubsystem,
+) -> dict[str, PythonFileDependencies]:
+    string_imports, string_assets = _classify_string_candidates(
+        (
+            string
+            for native_result in native_path_to_deps.values()
+            for string in native_result.string_candidates
+        ),
+        python_infer_subsystem,
+    )
+
+    path_to_deps = {}
+    for path, native_result in native_path_to_deps.items():
+        imports = dict(native_result.imports)
+        assets = set()
+        for string, line in native_result.string_candidates.items():
+            if string in string_imports:
+                imports.setdefault(string, (line, True))
+            if string in string_assets:
+                assets.add(string)
+
+        path_to_deps[path] = PythonFileDependencies(
+            ParsedPythonImports(
+                (key, ParsedPythonImportInfo(*value)) for key, value in imports.items()
+            ),
+            ParsedPythonAssetPaths(sorted(assets)),
+            ExplicitPythonDependencies(FrozenDict(native_result.explicit_dependencies)),
+        )
+    return path_to_deps
 
 
 async def get_scripts_digest(scripts_package: str, filenames: Iterable[str]) -> Digest:
@@ -125,39 +201,79 @@ async def parse_python_dependencies(
     native_results = await parse_python_deps(
         NativeDependenciesRequest(stripped_sources.snapshot.digest)
     )
+    return PythonFilesDependencies(
+        FrozenDict(_python_files_dependencies(native_results.path_to_deps, python_infer_subsystem))
+    )
 
-    path_to_deps = {}
-    for path, native_result in native_results.path_to_deps.items():
-        imports = dict(native_result.imports)
-        assets = set()
-
-        if python_infer_subsystem.string_imports or python_infer_subsystem.assets:
-            for string, line in native_result.string_candidates.items():
-                if (
-                    python_infer_subsystem.string_imports
-                    and not _is_ignored_string_import(
-                        string, python_infer_subsystem.string_import_ignore
-                    )
-                    and string.count(".") >= python_infer_subsystem.string_imports_min_dots
-                    and all(part.isidentifier() for part in string.split("."))
-                ):
-                    imports.setdefault(string, (line, True))
-                if (
-                    python_infer_subsystem.assets
-                    and string.count("/") >= python_infer_subsystem.assets_min_slashes
-                ):
-                    assets.add(string)
-
-        explicit_deps = dict(native_result.explicit_dependencies)
 
-        path_to_deps[path] = PythonFileDependencies(
-            ParsedPythonImports(
-                (key, ParsedPythonImportInfo(*value)) for key, value in imports.items()
-            ),
-            ParsedPythonAssetPaths(sorted(assets)),
-            ExplicitPythonDependencies(FrozenDict(explicit_deps)),
+@dataclass(frozen=True)
+class FirstPartyPythonSourcesByDirectory:
+    """The sources of every first-party `python_source` target, by the directory of the file."""
+
+    mapping: FrozenDict[str, tuple[PythonSourceField, ...]]
+
+
+@rule(desc="Index first-party Python sources by directory", level=LogLevel.DEBUG)
+async def index_first_party_python_sources_by_directory(
+    all_python_targets: AllPythonTargets,
+) -> FirstPartyPythonSourcesByDirectory:
+    sources_by_directory: defaultdict[str, list[PythonSourceField]] = defaultdict(list)
+    for tgt in all_python_targets.first_party:
+        source = tgt[PythonSourceField]
+        sources_by_directory[os.path.dirname(source.file_path)].append(source)
+    return FirstPartyPythonSourcesByDirectory(
+        FrozenDict(
+            (directory, tuple(sources)) for directory, sources in sources_by_directory.items()
         )
-    return PythonFilesDependencies(FrozenDict(path_to_deps))
+    )
+
+
+@dataclass(frozen=True)
+class PythonDirectoryDependenciesRequest:
+    directory: str
+
+
+class PythonDirectoryDependencies(PythonFilesDependencies):
+    """The dependencies of the first-party Python source files in one directory, by (unstripped)
+    path.
+
+    Empty if the directory is not under a source root.
+    """
+
+
+@rule(desc="Parse the first-party Python sources of a directory", level=LogLevel.DEBUG)
+async def parse_python_dependencies_in_directory(
+    request: PythonDirectoryDependenciesRequest,
+    sources_by_directory: FirstPartyPythonSourcesByDirectory,
+    python_infer_subsystem: PythonInferSubsystem,
+) -> PythonDirectoryDependencies:
+    # All of the files in a directory share a source root, so they can be parsed together. A
+    # directory which is not under a source root is left to the per-target parsing, which reports
+    # the error for the files that are actually used.
+    optional_source_root = await get_optional_source_root(
+        SourceRootRequest(PurePath(request.directory)), **implicitly()
+    )
+    sources = sources_by_directory.mapping.get(request.directory, ())
+    if optional_source_root.source_root is None or not sources:
+        return PythonDirectoryDependencies(FrozenDict())
+    root = optional_source_root.source_root.path
+
+    source_files = await determine_source_files(SourceFilesRequest(sources))
+    digest = source_files.snapshot.digest
+    if root != ".":
+        digest = await remove_prefix(RemovePrefix(digest, root))
+    native_results = await parse_python_deps(NativeDependenciesRequest(digest))
+    native_path_to_deps = {
+        (path if root == "." else os.path.join(root, path)): native_result
+        for path, native_result in native_results.path_to_deps.items()
+    }
+    logger.debug(
+        f"Parsed {pluralize(len(native_path_to_deps), 'Python file')} in {request.directory} "
+        "for dependencies."
+    )
+    return PythonDirectoryDependencies(
+        FrozenDict(_python_files_dependencies(native_path_to_deps, python_infer_subsystem))
+    )
 
 
 def rules():
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import itertools
 import logging
+import os
 from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
@@ -17,15 +18,19 @@ from pants.backend.python.dependency_inference.default_unowned_dependencies impo
 from pants.backend.python.dependency_inference.module_mapper import (
     PythonModuleOwners,
     PythonModuleOwnersRequest,
+    PythonModulesOwnersRequest,
     ResolveName,
     map_module_to_address,
+    map_modules_to_addresses,
     module_from_stripped_path,
 )
 from pants.backend.python.dependency_inference.parse_python_dependencies import (
     ParsedPythonAssetPaths,
     ParsedPythonImports,
     ParsePythonDependenciesRequest,
+    PythonDirectoryDependenciesRequest,
     PythonFileDependencies,
+    parse_python_dependencies_in_directory,
 )
 from pants.backend.python.dependency_inference.parse_python_dependencies import (
     parse_python_dependencies as parse_python_dependencies_get,
@@ -376,7 +381,17 @@ async def _handle_unowned_imports(
 async def _exec_parse_deps(
     field_set: PythonImportDependenciesInferenceFieldSet,
     python_setup: PythonSetup,
+    python_infer_subsystem: PythonInferSubsystem,
 ) -> PythonFileDependencies:
+    if python_infer_subsystem.batch_parsing:
+        file_path = field_set.source.file_path
+        directory_dependencies = await parse_python_dependencies_in_directory(
+            PythonDirectoryDependenciesRequest(os.path.dirname(file_path)), **implicitly()
+        )
+        file_dependencies = directory_dependencies.path_to_deps.get(file_path)
+        if file_dependencies is not None:
+            return file_dependencies
+
     source = await determine_source_files(SourceFilesRequest([field_set.source]))
     resp = await parse_python_dependencies_get(
         ParsePythonDependenciesRequest(
@@ -429,16 +444,14 @@ async def resolve_parsed_dependencies(
         locality = source_root.path
 
     if parsed_imports:
-        owners_per_import = await concurrently(
-            map_module_to_address(
-                PythonModuleOwnersRequest(imported_module, request.resolve, locality),
-                **implicitly(),
-            )
-            for imported_module in parsed_imports
+        # Resolve all the imports of the file in one pass, rather than with one rule per import.
+        owners_by_import = await map_modules_to_addresses(
+            PythonModulesOwnersRequest(tuple(parsed_imports), request.resolve, locality),
+            **implicitly(),
         )
         resolve_results = _get_imports_info(
             address=request.field_set.address,
-            owners_per_import=owners_per_import,
+            owners_per_import=[owners_by_import[imp] for imp in parsed_imports],
             parsed_imports=parsed_imports,
             explicitly_provided_deps=explicitly_provided_deps,
         )
@@ -473,7 +486,9 @@ async def infer_python_dependencies_via_source(
     if not python_infer_subsystem.imports and not python_infer_subsystem.assets:
         return InferredDependencies([])
 
-    parsed_dependencies = await _exec_parse_deps(request.field_set, python_setup)
+    parsed_dependencies = await _exec_parse_deps(
+        request.field_set, python_setup, python_infer_subsystem
+    )
 
     resolve = request.field_set.resolve.normalized_value(python_setup)
 
@@ -505,7 +520,7 @@ async def infer_python_dependencies_via_source(
         deleted_python_files = tuple(f for f in deleted_files.paths if f.endswith((".py", ".pyi")))
         if deleted_python_files:
             source_roots_result = await get_optional_source_roots(
-                SourceRootsRequest.for_files(deleted_python_files)
+                SourceRootsRequest.for_files(deleted_python_files), **implicitly()
             )
             # We drop files not under a source root, since they can't be used for import anyway.
             stripped_deleted_python_files = tuple(
@@ -74,7 +74,8 @@ def assert_owners_not_found_error(
         assert item not in error_message
 
 
-def test_infer_python_imports(caplog) -> None:
+@pytest.mark.parametrize("batch_parsing", [False, True])
+def test_infer_python_imports(caplog, batch_parsing: bool) -> None:
     rule_runner = PythonRuleRunner(
         rules=[
             *import_rules(),
@@ -132,6 +133,8 @@ def test_infer_python_imports(caplog) -> None:
         ]
         if enable_string_imports:
             args.append("--python-infer-string-imports")
+        if batch_parsing:
+            args.append("--python-infer-batch-parsing")
         rule_runner.set_options(args, env_inherit={"PATH", "PYENV_ROOT", "HOME"})
         target = rule_runner.get_target(address)
         return rule_runner.request(
@@ -203,6 +206,19 @@ def test_infer_python_imports(caplog) -> None:
     assert "['src/python/ambiguous/dep.py:dep1', 'src/python/ambiguous/dep.py:dep2']" in caplog.text
     assert "disambiguated_via_ignores.py" not in caplog.text
 
+    # A file outside of any source root should not affect inference for other files.
+    rule_runner.write_files(
+        {"scripts/tool.py": "import util.dep\n", "scripts/BUILD": "python_sources()"}
+    )
+    assert run_dep_inference(
+        Address("src/python", relative_file_path="app.py")
+    ) == InferredDependencies(
+        [
+            Address("3rdparty/python", target_name="Django"),
+            Address("src/python/util", relative_file_path="dep.py"),
+        ],
+    )
+
 
 def test_infer_python_assets(caplog) -> None:
     rule_runner = PythonRuleRunner(
@@ -192,6 +192,21 @@ class PythonInferSubsystem(Subsystem):
         ),
     )
 
+    batch_parsing = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            Parse the sources of first-party Python targets together, with one call to the
+            dependency parser per directory, rather than once per target.
+
+            This reduces the overhead of inferring the dependencies of many targets at once, e.g.
+            with `dependencies ::`. A change to a file only invalidates the results for its own
+            directory, and files which are not under a source root are parsed per target.
+            """
+        ),
+    )
+
     use_rust_parser = BoolOption(
         default=True,
         help=softwrap(
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import configparser
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Sequence
 from dataclasses import dataclass
 from enum import Enum
 from io import StringIO
@@ -62,10 +62,12 @@ from pants.option.option_types import (
     EnumListOption,
     FileOption,
     FloatOption,
+    IntOption,
     StrListOption,
     StrOption,
 )
 from pants.source.source_root import AllSourceRoots
+from pants.util.collections import partition_sequentially
 from pants.util.logging import LogLevel
 from pants.util.strutil import softwrap
 
@@ -215,6 +217,23 @@ class CoverageSubsystem(PythonToolBase):
         ),
     )
 
+    merge_chunk_size = IntOption(
+        default=0,
+        advanced=True,
+        help=softwrap(
+            """
+            If positive, merge the coverage data of the batches of tests in chunks of around this
+            many batches, and then merge the chunks, rather than merging the data of all batches
+            at once.
+
+            Chunks are formed at stable boundaries, and the merge of each chunk is cached by its
+            inputs, so when only a few batches of tests change, only their chunks need to be merged
+            again. This speeds up merging for large numbers of batches, at the cost of an extra
+            merge process when no merges are cached.
+            """
+        ),
+    )
+
     def output_dir(self, distdir: DistDir) -> PurePath:
         return PurePath(self._output_dir.format(distdir=distdir.relpath))
 
@@ -486,19 +505,15 @@ async def merge_coverage_data(
     else:
         extra_sources_digest = EMPTY_DIGEST
 
-    input_digest = await merge_digests(MergeDigests(await concurrently(coverage_digest_gets)))
-    result = await fallible_to_exec_result_or_raise(
-        **implicitly(
-            VenvPexProcess(
-                coverage_setup.pex,
-                # We tell combine to keep the original input files, to aid debugging in the sandbox.
-                argv=("combine", "--keep", *sorted(coverage_data_file_paths)),
-                input_digest=input_digest,
-                output_files=(".coverage",),
-                description=f"Merge {len(coverage_data_file_paths)} Pytest coverage reports.",
-                level=LogLevel.DEBUG,
-            )
+    coverage_digests = await concurrently(coverage_digest_gets)
+    if 0 < coverage.merge_chunk_size < len(coverage_data_file_paths):
+        coverage_digests, coverage_data_file_paths = await _merge_coverage_data_in_chunks(
+            coverage_setup, coverage_digests, coverage_data_file_paths, coverage.merge_chunk_size
         )
+
+    input_digest = await merge_digests(MergeDigests(coverage_digests))
+    result = await fallible_to_exec_result_or_raise(
+        **implicitly(_combine_process(coverage_setup, input_digest, coverage_data_file_paths))
     )
     return MergedCoverageData(
         await merge_digests(MergeDigests((result.output_digest, extra_sources_digest))),
@@ -506,6 +521,58 @@ async def merge_coverage_data(
     )
 
 
+def _combine_process(
+    coverage_setup: CoverageSetup, input_digest: Digest, coverage_data_file_paths: Sequence[str]
+) -> VenvPexProcess:
+    return VenvPexProcess(
+        coverage_setup.pex,
+        # We tell combine to keep the original input files, to aid debugging in the sandbox.
+        argv=("combine", "--keep", *sorted(coverage_data_file_paths)),
+        input_digest=input_digest,
+        output_files=(".coverage",),
+        description=f"Merge {len(coverage_data_file_paths)} Pytest coverage reports.",
+        level=LogLevel.DEBUG,
+    )
+
+
+async def _merge_coverage_data_in_chunks(
+    coverage_setup: CoverageSetup,
+    coverage_digests: Sequence[Digest],
+    coverage_data_file_paths: Sequence[str],
+    chunk_size: int,
+) -> tuple[list[Digest], list[str]]:
+    """Merge the coverage data files in chunks, and return the merged data file of each chunk.
+
+    Each chunk is merged by a separate process, whose inputs are only the data files of the chunk,
+    so that the merges of unchanged chunks are cached.
+    """
+    chunks = list(
+        partition_sequentially(
+            zip(coverage_data_file_paths, coverage_digests),
+            key=lambda path_and_digest: path_and_digest[0],
+            size_target=chunk_size,
+            size_max=2 * chunk_size,
+        )
+    )
+    chunk_input_digests = await concurrently(
+        merge_digests(MergeDigests(digest for _, digest in chunk)) for chunk in chunks
+    )
+    results = await concurrently(
+        fallible_to_exec_result_or_raise(
+            **implicitly(
+                _combine_process(coverage_setup, input_digest, [path for path, _ in chunk])
+            )
+        )
+        for chunk, input_digest in zip(chunks, chunk_input_digests)
+    )
+    chunk_prefixes = [f"__coverage_chunk_{i}" for i in range(len(chunks))]
+    chunk_digests = await concurrently(
+        add_prefix(AddPrefix(result.output_digest, prefix))
+        for result, prefix in zip(results, chunk_prefixes)
+    )
+    return list(chunk_digests), [f"{prefix}/.coverage" for prefix in chunk_prefixes]
+
+
 @rule(desc="Generate Pytest coverage reports", level=LogLevel.DEBUG)
 async def generate_coverage_reports(
     data_collection: PytestCoverageDataCollection,
@@ -226,6 +226,16 @@ def test_coverage_fail_under(batched: bool) -> None:
         result.assert_failure()
 
 
+@pytest.mark.parametrize("batched", (True, False))
+def test_coverage_merge_chunks(batched: bool) -> None:
+    with setup_tmpdir(sources(batched)) as tmpdir:
+        result = run_coverage(tmpdir, "--coverage-py-merge-chunk-size=1")
+    assert (
+        "TOTAL                                                            19      2    89%"
+        in result.stderr
+    )
+
+
 @pytest.mark.parametrize("batched", (True, False))
 def test_coverage_global(batched: bool) -> None:
     with setup_tmpdir(sources(batched)) as tmpdir:
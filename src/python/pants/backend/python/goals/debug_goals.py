@@ -27,6 +27,7 @@ from pants.backend.python.dependency_inference.rules import (
     import_rules,
     resolve_parsed_dependencies,
 )
+from pants.backend.python.dependency_inference.subsystem import PythonInferSubsystem
 from pants.backend.python.goals.run_python_source import PythonSourceFieldSet
 from pants.backend.python.subsystems.setup import PythonSetup
 from pants.build_graph.address import Address
@@ -83,10 +84,11 @@ class PythonSourceAnalysis:
 async def dump_python_source_analysis_single(
     fs: PythonImportDependenciesInferenceFieldSet,
     python_setup: PythonSetup,
+    python_infer_subsystem: PythonInferSubsystem,
 ) -> PythonSourceAnalysis:
     """Infer the dependencies for a single python fieldset, keeping all the intermediate results."""
 
-    parsed_dependencies = await _exec_parse_deps(fs, python_setup)
+    parsed_dependencies = await _exec_parse_deps(fs, python_setup, python_infer_subsystem)
 
     resolve = fs.resolve.normalized_value(python_setup)
 
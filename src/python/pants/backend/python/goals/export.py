@@ -22,6 +22,7 @@ from pants.backend.python.util_rules.local_dists_pep660 import (
 )
 from pants.backend.python.util_rules.pex import (
     PexRequest,
+    VenvPexRequest,
     create_pex,
     create_venv_pex,
     find_interpreter,
@@ -219,7 +220,12 @@ async def do_export(
         session_request = dataclasses.replace(
             req.pex_request, cache_scope=ProcessCacheScope.PER_SESSION
         )
-        requirements_venv_pex = await create_venv_pex(**implicitly({session_request: PexRequest}))
+        requirements_venv_pex = await create_venv_pex(
+            VenvPexRequest(
+                session_request, pex_env.in_sandbox(working_directory=None), require_venv=True
+            ),
+            **implicitly(),
+        )
         # Note that for symlinking we ignore qualify_path_with_python_version and always qualify,
         # since we need some name for the symlink anyway.
         dest = f"{dest_prefix}/{req.py_version}"
@@ -3,10 +3,13 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import re
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from packaging.utils import canonicalize_name as canonicalize_project_name
@@ -30,12 +33,14 @@ from pants.backend.python.util_rules.lockfile_metadata import (
 from pants.backend.python.util_rules.pex import (
     Pex,
     PexRequest,
+    VenvPex,
     VenvPexProcess,
     create_pex,
     create_venv_pex,
     get_req_strings,
     setup_venv_pex_process,
 )
+from pants.backend.python.util_rules.pex_environment import PexEnvironment
 from pants.backend.python.util_rules.pex_from_targets import RequirementsPexRequest
 from pants.backend.python.util_rules.pex_requirements import PexRequirements
 from pants.backend.python.util_rules.python_sources import (
@@ -69,12 +74,14 @@ from pants.engine.fs import (
     DigestContents,
     DigestSubset,
     Directory,
+    FileContent,
     MergeDigests,
     PathGlobs,
     RemovePrefix,
 )
 from pants.engine.internals.graph import resolve_target
 from pants.engine.internals.graph import transitive_targets as transitive_targets_get
+from pants.engine.internals.native_engine import ProcessExecutionEnvironment
 from pants.engine.intrinsics import (
     create_digest,
     digest_subset_to_digest,
@@ -93,6 +100,7 @@ from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import OrderedSet
 from pants.util.pip_requirement import PipRequirement
+from pants.util.resources import read_resource
 from pants.util.strutil import softwrap
 
 logger = logging.getLogger(__name__)
@@ -181,6 +189,19 @@ async def run_all_setup_plugins(
 # ./pants test <target> -- --html=extra-output/report.html
 _EXTRA_OUTPUT_DIR = "extra-output"
 
+# See `[pytest].warm_workers`.
+_WARM_WORKER_SCRIPT = "__pants_pytest_worker.py"
+_WARM_WORKER_SOCKETS_CACHE = ("pytest_workers", ".cache/pytest_workers")
+_WARM_WORKER_IDLE_TIMEOUT_SECS = 600
+
+
+def _warm_worker_key(pytest_runner_pex: VenvPex, env: Mapping[str, str], preload: str) -> str:
+    """Batches which run with the same requirements and environment can share a worker."""
+    fingerprint = json.dumps(
+        [pytest_runner_pex.digest.fingerprint, sorted(env.items()), preload]
+    ).encode()
+    return hashlib.sha256(fingerprint).hexdigest()[:32]
+
 
 @dataclass(frozen=True)
 class TestMetadata:
@@ -265,6 +286,8 @@ async def setup_pytest_for_target(
     coverage_config: CoverageConfig,
     coverage_subsystem: CoverageSubsystem,
     test_extra_env: TestExtraEnv,
+    process_execution_environment: ProcessExecutionEnvironment,
+    pex_environment: PexEnvironment,
 ) -> TestSetup:
     addresses = tuple(field_set.address for field_set in request.field_sets)
 
@@ -281,8 +304,36 @@ async def setup_pytest_for_target(
         pytest.to_pex_request(interpreter_constraints=interpreter_constraints)
     )
 
-    # Ensure that the empty extra output dir exists.
-    extra_output_directory_digest_get = create_digest(CreateDigest([Directory(_EXTRA_OUTPUT_DIR)]))
+    # Workers run on this machine, so they are never used for processes which run elsewhere. A
+    # worker is started with the interpreter of the venv which runs the worker script, so it can
+    # import pytest: a layered PEX has no venv, and runs the script with the base interpreter.
+    use_warm_workers = (
+        pytest.warm_workers
+        and not pex_environment.layered_venvs
+        and not request.is_debug
+        and not request.prepend_argv
+        and not process_execution_environment.remote_execution
+        and process_execution_environment.docker_image is None
+    )
+
+    # Ensure that the empty extra output dir exists (and include the worker script, if needed).
+    extra_output_directory_digest_get = create_digest(
+        CreateDigest(
+            [
+                Directory(_EXTRA_OUTPUT_DIR),
+                *(
+                    [
+                        FileContent(
+                            _WARM_WORKER_SCRIPT,
+                            read_resource("pants.backend.python.goals.scripts", "pytest_worker.py"),
+                        )
+                    ]
+                    if use_warm_workers
+                    else []
+                ),
+            ]
+        )
+    )
 
     prepared_sources_get = prepare_python_sources(
         PythonSourceFilesRequest(all_targets, include_files=True), **implicitly()
@@ -450,20 +501,39 @@ async def setup_pytest_for_target(
             f"{run_description} contains:\n"
             + "\n".join(f"  {field_set.address.spec}" for field_set in request.field_sets)
         )
+    argv: tuple[str, ...] = (
+        *request.prepend_argv,
+        *pytest.args,
+        *(("-c", pytest.config) if pytest.config else ()),
+        *(("-n", "{pants_concurrency}") if xdist_concurrency else ()),
+        # N.B.: Now that we're using command-line options instead of the PYTEST_ADDOPTS
+        # environment variable, it's critical that `pytest_args` comes after `pytest.args`.
+        *pytest_args,
+        *field_set_source_files.files,
+    )
+    append_only_caches: dict[str, str] = {}
+    if use_warm_workers:
+        # Run the worker script with the venv's interpreter, which then runs pytest in a worker.
+        preload = ",".join(("pytest", *pytest.warm_worker_preload))
+        sockets_cache_name, sockets_dir = _WARM_WORKER_SOCKETS_CACHE
+        argv = (
+            _WARM_WORKER_SCRIPT,
+            sockets_dir,
+            _warm_worker_key(pytest_runner_pex, extra_env, preload),
+            str(_WARM_WORKER_IDLE_TIMEOUT_SECS),
+            preload,
+            "--",
+            *argv,
+        )
+        extra_env = {**extra_env, "PEX_INTERPRETER": "1"}
+        append_only_caches[sockets_cache_name] = sockets_dir
+
     process = await setup_venv_pex_process(
         VenvPexProcess(
             pytest_runner_pex,
-            argv=(
-                *request.prepend_argv,
-                *pytest.args,
-                *(("-c", pytest.config) if pytest.config else ()),
-                *(("-n", "{pants_concurrency}") if xdist_concurrency else ()),
-                # N.B.: Now that we're using command-line options instead of the PYTEST_ADDOPTS
-                # environment variable, it's critical that `pytest_args` comes after `pytest.args`.
-                *pytest_args,
-                *field_set_source_files.files,
-            ),
+            argv=argv,
             extra_env=extra_env,
+            append_only_caches=append_only_caches,
             input_digest=input_digest,
             output_directories=(_EXTRA_OUTPUT_DIR,),
             output_files=output_files,
@@ -16,6 +16,7 @@ from pants.backend.python.dependency_inference import rules as dependency_infere
 from pants.backend.python.goals import package_dists, package_pex_binary, pytest_runner
 from pants.backend.python.goals.coverage_py import create_or_update_coverage_config
 from pants.backend.python.goals.pytest_runner import (
+    _WARM_WORKER_SCRIPT,
     PytestPluginSetup,
     PytestPluginSetupRequest,
     PyTestRequest,
@@ -206,6 +207,51 @@ def test_passing(rule_runner: PythonRuleRunner, major_minor_interpreter: str) ->
     assert f"{PACKAGE}/tests.py ." in result.stdout_simplified_str
 
 
+def test_warm_workers(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            f"{PACKAGE}/tests.py": GOOD_TEST,
+            f"{PACKAGE}/more_tests.py": GOOD_TEST,
+            f"{PACKAGE}/failing_tests.py": "def test():\n    assert False\n",
+            f"{PACKAGE}/BUILD": "python_tests()",
+        }
+    )
+    # The first run starts a worker, and later runs may use it: the results should be the same.
+    for file_name, exit_code in (
+        ("tests.py", 0),
+        ("more_tests.py", 0),
+        ("failing_tests.py", 1),
+    ):
+        tgt = rule_runner.get_target(Address(PACKAGE, relative_file_path=file_name))
+        result = run_pytest(rule_runner, [tgt], extra_args=["--pytest-warm-workers"])
+        assert result.xml_results is not None
+        assert result.exit_code == exit_code
+        assert f"{PACKAGE}/{file_name} " in result.stdout_simplified_str
+
+
+def test_warm_workers_with_layered_venvs(rule_runner: PythonRuleRunner) -> None:
+    # A layered PEX has no venv interpreter to start a worker with, so tests run as usual.
+    rule_runner.write_files(
+        {
+            f"{PACKAGE}/tests.py": dedent(
+                f"""\
+                import os
+
+                def test():
+                    assert not os.path.exists("{_WARM_WORKER_SCRIPT}")
+                """
+            ),
+            f"{PACKAGE}/BUILD": "python_tests()",
+        }
+    )
+    tgt = rule_runner.get_target(Address(PACKAGE, relative_file_path="tests.py"))
+    result = run_pytest(
+        rule_runner, [tgt], extra_args=["--pytest-warm-workers", "--pex-layered-venvs"]
+    )
+    assert result.exit_code == 0
+    assert f"{PACKAGE}/tests.py ." in result.stdout_simplified_str
+
+
 def test_failing(rule_runner: PythonRuleRunner) -> None:
     rule_runner.write_files(
         {
@@ -0,0 +1,294 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+# NB: This must be compatible with Python 3.7+, and only uses the standard library (and pytest).
+# NB: An easy way to debug this is to invoke it directly in a directory containing tests.
+#   E.g.
+#   $ python src/python/pants/backend/python/goals/scripts/pytest_worker.py \
+#       /tmp/workers some-key 60 pytest -- -q path/to/test_foo.py
+
+"""Runs pytest in a forked child of a long-lived worker process that has pytest preloaded.
+
+Usage:
+  pytest_worker.py <socket_dir> <key> <idle_timeout_secs> <preload_modules> -- <pytest args>...
+
+Connects to the worker for `key`, which listens on a unix socket in `socket_dir`. The worker forks
+a child for each run, so every run starts from the same freshly preloaded state, and no state
+leaks between runs. The child runs pytest in the working directory and environment of this
+process, writing directly to its stdin, stdout and stderr, and this process exits with pytest's
+exit code.
+
+If there is no worker for `key` yet, this process starts one in the background for subsequent
+runs, and runs pytest itself. A worker exits after `idle_timeout_secs` without any runs.
+
+The child runs in its own process group, which is killed if this process exits before the child
+does (e.g. because it was killed on a timeout), so that no processes outlive the run. The worker
+itself outlives the sandbox of the run which started it, so the modules which it preloads are not
+hermetic: they are imported from wherever they were when the worker started.
+"""
+
+from __future__ import annotations
+
+import array
+import json
+import os
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import traceback
+
+_INT = struct.Struct("!i")
+_SERVE = "--serve"
+
+
+def _socket_name(key):
+    return key + ".sock"
+
+
+def _log_name(key):
+    return key + ".log"
+
+
+def _recv_exactly(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def _recv_int(sock):
+    data = _recv_exactly(sock, _INT.size)
+    return None if data is None else _INT.unpack(data)[0]
+
+
+def _run_pytest(pytest_args):
+    import pytest
+
+    try:
+        return int(pytest.main(list(pytest_args)))
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+# -----------------------------------------------------------------------------------------------
+# Client
+# -----------------------------------------------------------------------------------------------
+
+
+def _start_worker(socket_dir, key, idle_timeout, preload):
+    """Start a worker in the background, which outlives this process (and its sandbox)."""
+    socket_dir = os.path.realpath(socket_dir)
+    with open(__file__) as fp:
+        source = fp.read()
+    # Only keep the log of the current worker for each key, since the socket dir is never pruned.
+    with open(os.path.join(socket_dir, _log_name(key)), "wb") as log:
+        subprocess.Popen(
+            [sys.executable, "-c", source, _SERVE, socket_dir, key, str(idle_timeout), preload],
+            cwd=socket_dir,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+
+def _run_in_worker(sock, pytest_args):
+    """Run pytest in the worker, and return its exit code, or None if the worker did not start."""
+    # Pass our stdio to the worker, so that the child writes to them directly.
+    fds = array.array("i", [0, 1, 2])
+    sock.sendmsg([b"\0"], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds)])
+    request = json.dumps(
+        {"cwd": os.getcwd(), "env": dict(os.environ), "args": list(pytest_args)}
+    ).encode()
+    sock.sendall(_INT.pack(len(request)) + request)
+
+    pid = _recv_int(sock)
+    if pid is None:
+        return None
+
+    def kill_child(signum, _frame):
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except OSError:
+            pass
+        os._exit(128 + signum)
+
+    # If we are interrupted (e.g. due to a timeout), take the child down with us.
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, kill_child)
+
+    exit_code = _recv_int(sock)
+    if exit_code is None:
+        sys.stderr.write("The pytest worker exited unexpectedly.\n")
+        return 1
+    return exit_code
+
+
+def _client(socket_dir, key, idle_timeout, preload, pytest_args):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(os.path.join(socket_dir, _socket_name(key)))
+    except OSError:
+        sock.close()
+        _start_worker(socket_dir, key, idle_timeout, preload)
+        return _run_pytest(pytest_args)
+    try:
+        exit_code = _run_in_worker(sock, pytest_args)
+    finally:
+        sock.close()
+    return _run_pytest(pytest_args) if exit_code is None else exit_code
+
+
+# -----------------------------------------------------------------------------------------------
+# Worker
+# -----------------------------------------------------------------------------------------------
+
+
+def _listen(name):
+    """Listen on the named socket, or return None if another worker is already listening on it."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(name)
+    except OSError:
+        # The socket exists: either another worker is listening on it, or it is stale.
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(name)
+            sock.close()
+            return None
+        except OSError:
+            os.unlink(name)
+            sock.bind(name)
+        finally:
+            probe.close()
+    # Listen immediately: clients which connect while we are preloading wait to be accepted.
+    sock.listen(64)
+    return sock
+
+
+def _kill_group_on_disconnect(conn):
+    """Kill this process group once the client disconnects, even if it was killed uncleanly."""
+
+    def watch():
+        try:
+            # The client never sends anything more, so this returns once it disconnects.
+            conn.recv(1)
+        except OSError:
+            pass
+        os.killpg(0, signal.SIGKILL)
+
+    threading.Thread(target=watch, daemon=True).start()
+
+
+def _handle_run(conn):
+    """Run pytest for a client in this (forked) process, and return its exit code."""
+    _, ancdata, _, _ = conn.recvmsg(1, socket.CMSG_LEN(3 * array.array("i").itemsize))
+    fds = array.array("i")
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(data[: len(data) - (len(data) % fds.itemsize)])
+    length = _recv_int(conn)
+    if len(fds) != 3 or length is None:
+        return 1
+    request = json.loads(_recv_exactly(conn, length).decode())
+
+    for target_fd, fd in enumerate(fds):
+        os.dup2(fd, target_fd)
+        os.close(fd)
+    # Allow the client to kill this process and any processes it starts.
+    os.setpgid(0, 0)
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    extra_sys_path = os.environ.get("PEX_EXTRA_SYS_PATH", "")
+    sys.path[:0] = [
+        os.path.join(request["cwd"], entry) for entry in extra_sys_path.split(":") if entry
+    ]
+    sys.argv = ["pytest", *request["args"]]
+
+    conn.sendall(_INT.pack(os.getpid()))
+    _kill_group_on_disconnect(conn)
+    exit_code = _run_pytest(request["args"])
+    conn.sendall(_INT.pack(exit_code))
+    return exit_code
+
+
+def _serve(socket_dir, key, idle_timeout, preload):
+    os.chdir(socket_dir)
+    # Don't import modules from the socket dir, which `-c` puts on the path.
+    sys.path[:] = [entry for entry in sys.path if entry not in ("", socket_dir)]
+    name = _socket_name(key)
+    sock = _listen(name)
+    if sock is None:
+        return
+    inode = os.stat(name).st_ino
+
+    for module in preload:
+        try:
+            __import__(module)
+        except Exception:
+            traceback.print_exc()
+    # Don't leave any output buffered, to be flushed into the output of a run.
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    # Reap children automatically.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    sock.settimeout(idle_timeout)
+    idle = False
+    try:
+        while True:
+            try:
+                conn, _ = sock.accept()
+            except socket.timeout:
+                idle = True
+                break
+            pid = os.fork()
+            if pid == 0:
+                exit_code = 1
+                try:
+                    sock.close()
+                    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                    conn.settimeout(None)
+                    exit_code = _handle_run(conn)
+                except BaseException:
+                    traceback.print_exc()
+                finally:
+                    os._exit(exit_code)
+            conn.close()
+    finally:
+        sock.close()
+        # Only remove the socket (and the log) if it is still ours. The log is kept if the worker
+        # failed, to debug it.
+        try:
+            if os.stat(name).st_ino == inode:
+                os.unlink(name)
+                if idle:
+                    os.unlink(_log_name(key))
+        except OSError:
+            pass
+
+
+def main(args):
+    if args[0] == _SERVE:
+        socket_dir, key, idle_timeout, preload = args[1:5]
+        _serve(socket_dir, key, float(idle_timeout), [m for m in preload.split(",") if m])
+        return 0
+    socket_dir, key, idle_timeout, preload, separator = args[:5]
+    assert separator == "--", "Expected `--` before the pytest arguments."
+    # Don't leak the setting that we were run with into pytest, or any processes it runs.
+    os.environ.pop("PEX_INTERPRETER", None)
+    return _client(socket_dir, key, idle_timeout, preload, args[5:])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,149 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from textwrap import dedent
+
+from pants.util.resources import read_resource
+
+
+def test_runs_pytest_with_and_without_worker(tmp_path: Path) -> None:
+    script = tmp_path / "pytest_worker.py"
+    script.write_bytes(read_resource(__name__, "pytest_worker.py"))
+    socket_dir = tmp_path / "sockets"
+    socket_dir.mkdir()
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    (tests_dir / "test_ok.py").write_text(
+        dedent(
+            """\
+            import os
+
+            def test_ok():
+                with open("pid.txt", "w") as fp:
+                    fp.write(str(os.getpid()))
+            """
+        )
+    )
+    (tests_dir / "test_fail.py").write_text("def test_fail():\n    assert False\n")
+    (socket_dir / "key.log").write_text("output of a previous worker\n")
+
+    def run(test_file: str) -> tuple[int, int, str]:
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                str(script),
+                str(socket_dir),
+                "key",
+                # The worker exits soon after the test.
+                "5",
+                "pytest",
+                "--",
+                "-q",
+                "-p",
+                "no:cacheprovider",
+                test_file,
+            ],
+            cwd=tests_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        stdout, _ = process.communicate(timeout=60)
+        return process.returncode, process.pid, stdout.decode()
+
+    # Without a worker, the tests run in the process itself, which starts a worker.
+    exit_code, pid, output = run("test_ok.py")
+    assert exit_code == 0, output
+    assert "1 passed" in output
+    assert (tests_dir / "pid.txt").read_text() == str(pid)
+
+    deadline = time.time() + 30
+    while not (socket_dir / "key.sock").exists():
+        assert time.time() < deadline, "The worker did not start."
+        time.sleep(0.1)
+
+    # With a worker, the tests run in a child of the worker.
+    exit_code, pid, output = run("test_ok.py")
+    assert exit_code == 0, output
+    assert "1 passed" in output
+    assert (tests_dir / "pid.txt").read_text() != str(pid)
+
+    exit_code, _, output = run("test_fail.py")
+    assert exit_code == 1, output
+    assert "1 failed" in output
+    assert "output of a previous worker" not in (socket_dir / "key.log").read_text()
+
+    # The worker removes its socket and log when it exits after being idle.
+    deadline = time.time() + 30
+    while (socket_dir / "key.sock").exists() or (socket_dir / "key.log").exists():
+        assert time.time() < deadline, "The worker did not exit."
+        time.sleep(0.1)
+
+
+def test_kills_run_when_client_is_killed(tmp_path: Path) -> None:
+    script = tmp_path / "pytest_worker.py"
+    script.write_bytes(read_resource(__name__, "pytest_worker.py"))
+    socket_dir = tmp_path / "sockets"
+    socket_dir.mkdir()
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    (tests_dir / "test_slow.py").write_text(
+        dedent(
+            """\
+            import os
+            import time
+
+            def test_slow():
+                with open("pid.txt", "w") as fp:
+                    fp.write(str(os.getpid()))
+                time.sleep(60)
+            """
+        )
+    )
+
+    def start() -> subprocess.Popen:
+        return subprocess.Popen(
+            [sys.executable, str(script), str(socket_dir), "key", "5", "pytest", "--", "-q"]
+            + ["-p", "no:cacheprovider", "test_slow.py"],
+            cwd=tests_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def wait_for(condition) -> None:
+        deadline = time.time() + 30
+        while not condition():
+            assert time.time() < deadline
+            time.sleep(0.1)
+
+    def is_alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+    # The first run starts the worker.
+    first = start()
+    wait_for((socket_dir / "key.sock").exists)
+    first.kill()
+    first.wait()
+    (tests_dir / "pid.txt").unlink(missing_ok=True)
+
+    client = start()
+    pid_file = tests_dir / "pid.txt"
+    wait_for(lambda: pid_file.exists() and pid_file.read_text() != "")
+    child_pid = int(pid_file.read_text())
+    assert child_pid != client.pid
+    assert is_alive(child_pid)
+
+    # SIGKILL cannot be handled by the client, so the worker must notice that it disconnected.
+    client.kill()
+    client.wait()
+    wait_for(lambda: not is_alive(child_pid))
@@ -26,7 +26,14 @@ from pants.core.util_rules.config_files import ConfigFilesRequest
 from pants.engine.rules import collect_rules
 from pants.engine.target import Target
 from pants.engine.unions import UnionRule
-from pants.option.option_types import ArgsListOption, BoolOption, FileOption, SkipOption, StrOption
+from pants.option.option_types import (
+    ArgsListOption,
+    BoolOption,
+    FileOption,
+    SkipOption,
+    StrListOption,
+    StrOption,
+)
 from pants.util.strutil import softwrap
 
 # pants: infer-dep(pytest.lock*)
@@ -144,6 +151,48 @@ class PyTest(PythonToolBase):
         ),
     )
 
+    warm_workers = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, run each batch of tests in a process forked from a long-lived local worker,
+            which has already started the interpreter and imported pytest (and the modules in
+            `[pytest].warm_worker_preload`), rather than in a new process.
+
+            Batches share a worker if they use the same requirements and environment. Each batch
+            runs in a new fork of the worker, so no state is shared between batches. The first
+            batch for a worker starts it, and runs as usual. Workers exit after some minutes
+            without any batches to run.
+
+            Workers are only used for tests which run in a local environment, and are ignored
+            with `--debug` and `--debug-adapter`, in Docker and remote environments, and with
+            `[pex].layered_venvs`. Tests are run with `pytest.main`, rather than with any
+            configured `[pytest].console_script` or `[pytest].entry_point`. If a run is killed
+            (e.g. on a timeout), the fork running its tests is killed along with any processes it
+            started.
+
+            Results are not fully hermetic: a worker outlives the sandbox of the run which
+            started it, so the modules which it preloads come from that run, and anything the
+            worker inherited from the machine at startup is shared by later runs. Results are
+            cached as usual, so only enable this if the preloaded modules are stable.
+            """
+        ),
+    )
+    warm_worker_preload = StrListOption(
+        default=[],
+        advanced=True,
+        help=softwrap(
+            """
+            Modules to import in each `[pytest].warm_workers` worker before it runs any tests,
+            e.g. slow-to-import third-party libraries used by many tests.
+
+            Only import modules which are safe to use after a fork, and which do not change
+            during a run, i.e. not first-party modules.
+            """
+        ),
+    )
+
     skip = SkipOption("test")
 
     def config_request(self, dirs: Iterable[str]) -> ConfigFilesRequest:
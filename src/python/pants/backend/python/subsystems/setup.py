@@ -644,6 +644,25 @@ class PythonSetup(Subsystem):
         ),
         advanced=True,
     )
+    prune_lockfile_subsets = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If enabled, when subsetting a Pex lockfile, Pants omits the requirements that
+            the other requirements of the subset already pull in.
+
+            Pants indexes which projects each locked project always requires. A subset for
+            `requests` and `urllib3` is then built with the same Pex invocation as a subset for
+            just `requests`, so targets with different but overlapping requirements can share
+            a cached subset rather than each running Pex against the lockfile.
+
+            Only requirements without extras or environment markers are omitted. The version
+            constraints of an omitted requirement are not checked against the lockfile when
+            subsetting, but they were when the lockfile was generated.
+            """
+        ),
+        advanced=True,
+    )
 
     __constraints_deprecation_msg = softwrap(
         f"""
@@ -216,7 +216,8 @@ async def pyright_typecheck_partition(
         interpreter_constraints=partition.interpreter_constraints,
     )
     requirements_venv_pex = await create_venv_pex(
-        VenvPexRequest(requirements_pex_request, complete_pex_env), **implicitly()
+        VenvPexRequest(requirements_pex_request, complete_pex_env, require_venv=True),
+        **implicitly(),
     )
 
     # Force the requirements venv to materialize always by running a no-op.
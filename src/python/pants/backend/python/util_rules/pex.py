@@ -55,6 +55,7 @@ from pants.backend.python.util_rules.pex_requirements import (
     ResolveConfigRequest,
     determine_resolve_config,
     get_lockfile_for_resolve,
+    index_pex_lockfile,
     load_lockfile,
     validate_metadata,
 )
@@ -713,10 +714,16 @@ async def _setup_pex_requirements(
                 resolve_config=resolve_config,
             )
 
+        req_strings = reqs_info.req_strings
+        if python_setup.prune_lockfile_subsets:
+            lockfile_index = await index_pex_lockfile(loaded_lockfile)
+            req_strings = lockfile_index.prune(req_strings)
+            concurrency_available = len(req_strings)
+
         return _BuildPexRequirementsSetup(
             [loaded_lockfile.lockfile_digest],
             [
-                *reqs_info.req_strings,
+                *req_strings,
                 "--lock",
                 loaded_lockfile.lockfile_path,
                 *pex_lock_resolver_args,
@@ -1056,17 +1063,24 @@ class VenvScriptWriter:
     complete_pex_env: CompletePexEnvironment
     pex: Pex
     venv_dir: PurePath
+    layered: bool = False
 
     @classmethod
     def create(
-        cls, complete_pex_env: CompletePexEnvironment, pex: Pex, venv_rel_dir: PurePath
+        cls,
+        complete_pex_env: CompletePexEnvironment,
+        pex: Pex,
+        venv_rel_dir: PurePath,
+        layered: bool = False,
     ) -> VenvScriptWriter:
         # N.B.: We don't know the working directory that will be used in any given
         # invocation of the venv scripts; so we deal with working_directory once in an
         # `adjust_relative_paths` function inside the script to save rule authors from having to do
         # CWD offset math in every rule for all the relative paths their process depends on.
         venv_dir = complete_pex_env.pex_root / venv_rel_dir
-        return cls(complete_pex_env=complete_pex_env, pex=pex, venv_dir=venv_dir)
+        return cls(
+            complete_pex_env=complete_pex_env, pex=pex, venv_dir=venv_dir, layered=layered
+        )
 
     def _create_venv_script(
         self,
@@ -1074,6 +1088,7 @@ class VenvScriptWriter:
         *,
         script_path: PurePath,
         venv_executable: PurePath,
+        layered_env: Mapping[str, str] = FrozenDict(),
     ) -> VenvScript:
         env_vars = (
             f"{name}={shlex.quote(value)}"
@@ -1136,16 +1151,32 @@ class VenvScriptWriter:
             if [ -n "${{PEX_TOOLS:-}}" ]; then
               exec ${{execute_pex_args}} "$@"
             fi
-
-            # If the seeded venv has been removed from the PEX_ROOT, we re-seed from the original
-            # `--venv` mode PEX file.
-            if [ ! -e "${{venv_dir}}" ]; then
-                PEX_INTERPRETER=1 ${{execute_pex_args}} -c ''
-            fi
-
-            exec "${{target_venv_executable}}" "$@"
             """
         )
+        if self.layered:
+            # There is no venv to exec into: the PEX layers the wheels it needs from the shared
+            # installed wheels store in the PEX_ROOT onto `sys.path` itself, so we run it directly,
+            # selecting the venv executable's equivalent via Pex environment variables.
+            script += "\n"
+            if layered_env:
+                layered_env_vars = (
+                    f"{name}={shlex.quote(value)}" for name, value in layered_env.items()
+                )
+                script += f"export {' '.join(layered_env_vars)}\n"
+            script += 'exec ${execute_pex_args} "$@"\n'
+        else:
+            script += dedent(
+                """\
+
+                # If the seeded venv has been removed from the PEX_ROOT, we re-seed from the original
+                # `--venv` mode PEX file.
+                if [ ! -e "${venv_dir}" ]; then
+                    PEX_INTERPRETER=1 ${execute_pex_args} -c ''
+                fi
+
+                exec "${target_venv_executable}" "$@"
+                """
+            )
         return VenvScript(
             script=Script(script_path),
             content=FileContent(path=str(script_path), content=script.encode(), is_executable=True),
@@ -1155,7 +1186,9 @@ class VenvScriptWriter:
         """Writes a safe shim for the venv's executable `pex` script."""
         script_path = PurePath(f"{self.pex.name}_pex_shim.sh")
         return self._create_venv_script(
-            bash, script_path=script_path, venv_executable=self.venv_dir / "pex"
+            bash,
+            script_path=script_path,
+            venv_executable=self.venv_dir / "pex",
         )
 
     def bin(self, bash: BashBinary, name: str) -> VenvScript:
@@ -1165,11 +1198,19 @@ class VenvScriptWriter:
             bash,
             script_path=script_path,
             venv_executable=self.venv_dir / "bin" / name,
+            layered_env=FrozenDict({"PEX_SCRIPT": name}),
         )
 
     def python(self, bash: BashBinary) -> VenvScript:
         """Writes a safe shim for the venv's python binary."""
-        return self.bin(bash, "python")
+        if not self.layered:
+            return self.bin(bash, "python")
+        return self._create_venv_script(
+            bash,
+            script_path=PurePath(f"{self.pex.name}_bin_python_shim.sh"),
+            venv_executable=self.venv_dir / "bin" / "python",
+            layered_env=FrozenDict({"PEX_INTERPRETER": "1"}),
+        )
 
 
 @dataclass(frozen=True)
@@ -1189,6 +1230,7 @@ class VenvPexRequest:
     complete_pex_env: CompletePexEnvironment
     bin_names: tuple[str, ...] = ()
     site_packages_copies: bool = False
+    require_venv: bool = False
 
     def __init__(
         self,
@@ -1196,6 +1238,7 @@ class VenvPexRequest:
         complete_pex_env: CompletePexEnvironment,
         bin_names: Iterable[str] = (),
         site_packages_copies: bool = False,
+        require_venv: bool = False,
     ) -> None:
         """A request for a PEX that runs in a venv and optionally exposes select venv `bin` scripts.
 
@@ -1206,11 +1249,14 @@ class VenvPexRequest:
             dependencies when installing them in the venv site-packages directory. By default this
             is `False` and symlinks are used instead which is a win in the time and space dimensions
             but results in a non-standard venv structure that does trip up some libraries.
+        :param require_venv: `True` if the caller uses the venv directory itself, in which case
+            a venv is materialized even when `[pex].layered_venvs` is enabled.
         """
         object.__setattr__(self, "pex_request", pex_request)
         object.__setattr__(self, "complete_pex_env", complete_pex_env)
         object.__setattr__(self, "bin_names", tuple(bin_names))
         object.__setattr__(self, "site_packages_copies", site_packages_copies)
+        object.__setattr__(self, "require_venv", require_venv)
 
 
 @rule
@@ -1250,12 +1296,22 @@ async def create_venv_pex(
     # bash script that checks to see if the `pex` venv script exists in the PEX_ROOT and re-creates
     # the PEX_ROOT venv if not. Using the shim script to run Python tools gets us down to the ~1ms
     # of overhead we currently enjoy.
+    #
+    # With `[pex].layered_venvs` we skip the venv altogether. Distinct requirement sets each get
+    # their own venv, so e.g. every pytest partition pays for creating one even when nearly all
+    # their distributions overlap. A plain PEX instead adds each wheel it needs to `sys.path`
+    # straight from the installed wheels store in the PEX_ROOT, where every wheel is installed
+    # once under its hash and shared by all PEXes. Seeding the PEX when building it installs its
+    # wheels there up front, so running it only pays the O(100ms) PEX bootstrap overhead.
 
     pex_request = request.pex_request
-    seeded_venv_request = dataclasses.replace(
-        pex_request,
-        additional_args=pex_request.additional_args
-        + (
+    layered = pex_environment.layered_venvs and not (
+        request.require_venv or request.site_packages_copies
+    )
+    if layered:
+        seed_args: tuple[str, ...] = ("--seed", "verbose")
+    else:
+        seed_args = (
             "--venv",
             "prepend",
             "--seed",
@@ -1263,12 +1319,14 @@ async def create_venv_pex(
             pex_environment.venv_site_packages_copies_option(
                 use_copies=request.site_packages_copies
             ),
-        ),
+        )
+    seeded_venv_request = dataclasses.replace(
+        pex_request, additional_args=pex_request.additional_args + seed_args
     )
     venv_pex_result = await build_pex(seeded_venv_request, **implicitly())
     # Pex verbose --seed mode outputs the absolute path of the PEX executable as well as the
     # absolute path of the PEX_ROOT.  In the --venv case this is the `pex` script in the venv root
-    # directory.
+    # directory, and in the layered case it is the seeded copy of the PEX.
     seed_info = json.loads(venv_pex_result.result.stdout.decode())
     abs_pex_root = PurePath(seed_info["pex_root"])
     abs_pex_path = PurePath(seed_info["pex"])
@@ -1278,6 +1336,7 @@ async def create_venv_pex(
         complete_pex_env=request.complete_pex_env,
         pex=venv_pex_result.create_pex(),
         venv_rel_dir=venv_rel_dir,
+        layered=layered,
     )
     pex = venv_script_writer.exe(bash)
     python = venv_script_writer.python(bash)
@@ -81,6 +81,25 @@ class PexSubsystem(Subsystem):
         ),
         advanced=True,
     )
+    layered_venvs = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            Run PEXes that Pants would otherwise install into a venv directly from Pex's shared
+            store of installed wheels, rather than materializing a venv per distinct set of
+            requirements.
+
+            Pex installs each wheel once into a content-addressed directory in the
+            `--named-caches-dir`, and layers the directories of the wheels a PEX needs onto
+            `sys.path` when it boots. Enabling this saves the disk space and first-run latency
+            of creating a venv for every test partition, tool and `run`, at the cost of some
+            startup overhead on each invocation. PEXes that must be real venvs, such as those
+            exported or used to configure Pyright, and those that need site-packages copies,
+            are still installed into venvs.
+            """
+        ),
+        advanced=True,
+    )
     emit_warnings = BoolOption(
         default=False,
         help=softwrap(
@@ -147,6 +166,7 @@ class PexEnvironment:
     named_caches_dir: PurePath
     bootstrap_python: PythonBuildStandaloneBinary
     venv_use_symlinks: bool = False
+    layered_venvs: bool = False
 
     _PEX_ROOT_DIRNAME = "pex_root"
 
@@ -198,6 +218,7 @@ async def find_pex_python(
         named_caches_dir=named_caches_dir.val,
         bootstrap_python=python_binary,
         venv_use_symlinks=pex_subsystem.venv_use_symlinks,
+        layered_venvs=pex_subsystem.layered_venvs,
     )
 
 
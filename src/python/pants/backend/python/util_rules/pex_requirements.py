@@ -12,6 +12,8 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
+from packaging.utils import canonicalize_name as canonicalize_project_name
+
 from pants.backend.python.subsystems.repos import PythonRepos
 from pants.backend.python.subsystems.setup import InvalidLockfileBehavior, PythonSetup
 from pants.backend.python.target_types import PythonRequirementsField
@@ -41,6 +43,7 @@ from pants.engine.intrinsics import (
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.unions import UnionMembership
 from pants.util.docutil import bin_name, doc_url
+from pants.util.frozendict import FrozenDict
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.pip_requirement import PipRequirement
 from pants.util.requirements import parse_requirements_file
@@ -335,6 +338,80 @@ async def load_lockfile(
     )
 
 
+@dataclass(frozen=True)
+class PexLockfileIndex:
+    """The projects in a PEX-native lockfile that each locked project unconditionally requires.
+
+    A project maps to the transitive closure of the projects named in its `requires_dists` without
+    an environment marker, in every locked resolve that contains it. The closure does not include
+    the project itself, unless it is part of a dependency cycle.
+    """
+
+    implied_projects: FrozenDict[str, frozenset[str]]
+
+    def prune(self, req_strings: Iterable[str]) -> tuple[str, ...]:
+        """Drop the requirement strings that other requirement strings already imply.
+
+        Subsetting a lockfile for `requests` or for `requests` and `urllib3` yields the same
+        distributions, so dropping `urllib3` lets both subsets share one Pex invocation. Only
+        plain requirements (without extras or markers) are dropped, and only in favor of a
+        requirement without a marker, which is always installed.
+        """
+        reqs = [(req_string, PipRequirement.parse(req_string)) for req_string in req_strings]
+
+        def closure(req: PipRequirement) -> frozenset[str]:
+            return self.implied_projects.get(canonicalize_project_name(req.name), frozenset())
+
+        kept: list[str] = []
+        implied: set[str] = set()
+        # Requirements that imply the most go first, so that of the members of a dependency cycle
+        # only the first is kept.
+        for req_string, req in sorted(reqs, key=lambda r: (-len(closure(r[1])), r[0])):
+            parsed = req.as_packaging_requirement()
+            if not parsed.extras and not parsed.marker:
+                if canonicalize_project_name(req.name) in implied:
+                    continue
+            kept.append(req_string)
+            if not parsed.marker:
+                implied.update(closure(req))
+        return tuple(sorted(kept))
+
+
+@rule
+async def index_pex_lockfile(loaded_lockfile: LoadedLockfile) -> PexLockfileIndex:
+    if loaded_lockfile.lockfile_format != LockfileFormat.PEX:
+        return PexLockfileIndex(FrozenDict())
+    lockfile_contents = await get_digest_contents(loaded_lockfile.lockfile_digest)
+    lockfile_json = json.loads(lockfile_contents[0].content)
+
+    direct: dict[str, set[str]] = {}
+    for locked_resolve in lockfile_json.get("locked_resolves", ()):
+        for locked_requirement in locked_resolve.get("locked_requirements", ()):
+            project = canonicalize_project_name(locked_requirement["project_name"])
+            unconditional = set()
+            for requires_dist in locked_requirement.get("requires_dists", ()):
+                req = PipRequirement.parse(requires_dist).as_packaging_requirement()
+                if not req.marker:
+                    unconditional.add(canonicalize_project_name(req.name))
+            # An edge only holds if it holds in every locked resolve that has the project.
+            if project in direct:
+                direct[project] &= unconditional
+            else:
+                direct[project] = unconditional
+
+    implied_projects: dict[str, frozenset[str]] = {}
+    for project in direct:
+        seen: set[str] = set()
+        to_visit = list(direct[project])
+        while to_visit:
+            dep = to_visit.pop()
+            if dep not in seen:
+                seen.add(dep)
+                to_visit.extend(direct.get(dep, ()))
+        implied_projects[project] = frozenset(seen)
+    return PexLockfileIndex(FrozenDict(implied_projects))
+
+
 @dataclass(frozen=True)
 class EntireLockfile:
     """A request to resolve the entire contents of a lockfile.
@@ -12,13 +12,19 @@ import pytest
 
 from pants.backend.python.subsystems.setup import InvalidLockfileBehavior, PythonSetup
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
-from pants.backend.python.util_rules.lockfile_metadata import PythonLockfileMetadataV3
+from pants.backend.python.util_rules.lockfile_metadata import (
+    LockfileFormat,
+    PythonLockfileMetadataV3,
+)
 from pants.backend.python.util_rules.pex_requirements import (
+    LoadedLockfile,
     Lockfile,
+    PexLockfileIndex,
     ResolveConfig,
     ResolvePexConstraintsFile,
     _pex_lockfile_requirement_count,
     get_metadata,
+    index_pex_lockfile,
     is_probably_pex_json_lockfile,
     strip_comments_from_pex_json_lockfile,
     validate_metadata,
@@ -29,8 +35,11 @@ from pants.core.util_rules.lockfile_metadata import (
     END_LOCKFILE_HEADER,
     InvalidLockfileError,
 )
+from pants.engine.fs import DigestContents, FileContent
 from pants.engine.internals.native_engine import EMPTY_DIGEST
 from pants.testutil.option_util import create_subsystem
+from pants.testutil.rule_runner import run_rule_with_mocks
+from pants.util.frozendict import FrozenDict
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.pip_requirement import PipRequirement
 from pants.util.strutil import comma_separated_list
@@ -485,6 +494,90 @@ def _uv_config(
     return tomllib.loads(cfg.uv_config(extra_find_links=extra_find_links))
 
 
+def test_index_pex_lockfile() -> None:
+    def locked(project_name: str, *requires_dists: str) -> dict:
+        return {"project_name": project_name, "version": "1.0", "requires_dists": requires_dists}
+
+    lockfile_json = {
+        "locked_resolves": [
+            {
+                "locked_requirements": [
+                    locked("Requests", "urllib3>=1.21", "idna", 'PySocks; extra == "socks"'),
+                    locked("urllib3", "certifi"),
+                    locked("idna"),
+                    locked("certifi"),
+                    locked("cycle-a", "cycle_b"),
+                    locked("cycle-b", "cycle-a"),
+                ]
+            },
+            {
+                "locked_requirements": [
+                    locked("urllib3"),
+                    locked("certifi"),
+                ]
+            },
+        ]
+    }
+    loaded_lockfile = LoadedLockfile(
+        EMPTY_DIGEST,
+        "lock.json",
+        metadata=None,
+        requirement_estimate=6,
+        lockfile_format=LockfileFormat.PEX,
+        as_constraints_strings=None,
+        original_lockfile=Lockfile("lock.json", "test", "a"),
+    )
+    index = run_rule_with_mocks(
+        index_pex_lockfile,
+        rule_args=[loaded_lockfile],
+        mock_calls={
+            "pants.engine.intrinsics.get_digest_contents": lambda _: DigestContents(
+                [FileContent("lock.json", json.dumps(lockfile_json).encode())]
+            ),
+        },
+    )
+    assert index.implied_projects == FrozenDict(
+        {
+            "requests": frozenset({"urllib3", "idna"}),
+            # The edge to certifi is missing from the second resolve.
+            "urllib3": frozenset(),
+            "idna": frozenset(),
+            "certifi": frozenset(),
+            "cycle-a": frozenset({"cycle-a", "cycle-b"}),
+            "cycle-b": frozenset({"cycle-a", "cycle-b"}),
+        }
+    )
+
+
+def test_pex_lockfile_index_prune() -> None:
+    index = PexLockfileIndex(
+        FrozenDict(
+            {
+                "requests": frozenset({"urllib3", "idna"}),
+                "urllib3": frozenset(),
+                "idna": frozenset(),
+                "cycle-a": frozenset({"cycle-a", "cycle-b"}),
+                "cycle-b": frozenset({"cycle-a", "cycle-b"}),
+            }
+        )
+    )
+    assert index.prune(["urllib3>=1.21", "requests", "IDNA"]) == ("requests",)
+    assert index.prune(["urllib3", "requests[socks]"]) == ("requests[socks]",)
+    # Requirements with extras or markers are kept, as are those only implied under a marker.
+    assert index.prune(["requests", "urllib3[secure]", 'idna; python_version >= "3"']) == (
+        "idna; python_version >= \"3\"",
+        "requests",
+        "urllib3[secure]",
+    )
+    assert index.prune(['requests; sys_platform == "linux"', "urllib3"]) == (
+        'requests; sys_platform == "linux"',
+        "urllib3",
+    )
+    # Only one member of a dependency cycle is kept.
+    assert index.prune(["cycle-b", "cycle-a"]) == ("cycle-a",)
+    assert index.prune(["unlocked", "requests"]) == ("requests", "unlocked")
+
+
 def test_uv_config_indexes():
     ics = InterpreterConstraints([">=3.8"])
 
@@ -788,6 +788,31 @@ def test_venv_pex_resolve_info(rule_runner: RuleRunner, pex_type: type[Pex | Ven
     assert dists[4].project_name == "urllib3"
 
 
+def test_layered_venv_pex(rule_runner: RuleRunner) -> None:
+    venv_pex = create_pex_and_get_all_data(
+        rule_runner,
+        pex_type=VenvPex,
+        requirements=PexRequirements(["six==1.12.0"]),
+        additional_pants_args=("--pex-layered-venvs",),
+    ).pex
+    assert isinstance(venv_pex, VenvPex)
+
+    result = rule_runner.request(
+        ProcessResult,
+        [
+            VenvPexProcess(
+                venv_pex,
+                argv=["-c", "import six, sys; print(six.__file__); print(sys.prefix)"],
+                description="Import six from the shared installed wheels store.",
+            )
+        ],
+    )
+    six_file, prefix = result.stdout.decode().splitlines()
+    # The distribution is loaded from where Pex installed it, rather than from a venv.
+    assert "installed_wheels" in six_file
+    assert "venvs" not in prefix
+
+
 def test_determine_pex_python_and_platforms() -> None:
     hardcoded_python = PythonExecutable("/hardcoded/python")
     discovered_python = PythonExecutable("/discovered/python")
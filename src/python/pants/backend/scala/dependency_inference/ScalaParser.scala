@@ -567,19 +567,39 @@ object ScalaParser {
     analysisTraverser.toAnalysis
   }
 
+  /** Arguments are `<scala version> <source3>`, followed by pairs of `<output path> <source path>`,
+    * so that many sources can be analyzed in one process. All sources are analyzed even if some
+    * fail to parse.
+    */
   def main(args: Array[String]): Unit = {
-    val outputPath = java.nio.file.Paths.get(args(0))
-    val pathStr = args(1)
-    val scalaVersion = args(2)
-    val source3 = args(3).toBoolean
-    val analysis = analyze(pathStr, scalaVersion, source3)
-
-    val json = analysis.asJson.noSpaces
-    java.nio.file.Files.write(
-      outputPath,
-      json.getBytes(),
-      java.nio.file.StandardOpenOption.CREATE_NEW,
-      java.nio.file.StandardOpenOption.WRITE
-    )
+    if (args.length < 4 || args.length % 2 != 0) {
+      throw new IllegalArgumentException(
+        "Expected `<scala version> <source3>` followed by pairs of `<output path> <source path>`."
+      )
+    }
+    val scalaVersion = args(0)
+    val source3 = args(1).toBoolean
+
+    val failedSources = ArrayBuffer[String]()
+    args.drop(2).grouped(2).foreach { case Array(outputPathStr, pathStr) =>
+      try {
+        val analysis = analyze(pathStr, scalaVersion, source3)
+        val json = analysis.asJson.noSpaces
+        java.nio.file.Files.write(
+          java.nio.file.Paths.get(outputPathStr),
+          json.getBytes(),
+          java.nio.file.StandardOpenOption.CREATE_NEW,
+          java.nio.file.StandardOpenOption.WRITE
+        )
+      } catch {
+        case e: Exception =>
+          System.err.println(s"Failed to analyze $pathStr:")
+          e.printStackTrace()
+          failedSources += pathStr
+      }
+    }
+    if (failedSources.nonEmpty) {
+      throw new RuntimeException(s"Failed to analyze: ${failedSources.mkString(", ")}")
+    }
   }
 }
@@ -7,8 +7,10 @@ from dataclasses import dataclass
 from pants.backend.scala.compile import scalac_plugins
 from pants.backend.scala.dependency_inference import scala_parser, symbol_mapper
 from pants.backend.scala.dependency_inference.scala_parser import (
-    resolve_fallible_result_to_analysis,
+    ScalaParser,
+    create_analyze_scala_source_request,
 )
+from pants.backend.scala.dependency_inference.symbol_mapper import analyze_scala_sources
 from pants.backend.scala.subsystems.scala import ScalaSubsystem
 from pants.backend.scala.subsystems.scala_infer import ScalaInferSubsystem
 from pants.backend.scala.target_types import ScalaDependenciesField, ScalaSourceField
@@ -58,18 +60,20 @@ async def infer_scala_dependencies_via_source_analysis(
     scala_infer_subsystem: ScalaInferSubsystem,
     jvm: JvmSubsystem,
     symbol_mapping: SymbolMapping,
+    parser_tool: ScalaParser,
 ) -> InferredDependencies:
     if not scala_infer_subsystem.imports:
         return InferredDependencies([])
 
     address = request.field_set.address
-    explicitly_provided_deps, analysis = await concurrently(
+    analyze_request = await create_analyze_scala_source_request(
+        **implicitly(SourceFilesRequest([request.field_set.source]))
+    )
+    explicitly_provided_deps, (analysis,) = await concurrently(
         determine_explicitly_provided_dependencies(
             **implicitly(DependenciesRequest(request.field_set.dependencies))
         ),
-        resolve_fallible_result_to_analysis(
-            **implicitly(SourceFilesRequest([request.field_set.source]))
-        ),
+        analyze_scala_sources([analyze_request], parser_tool),
     )
 
     symbols: OrderedSet[str] = OrderedSet()
@@ -51,6 +51,10 @@ from pants.engine.rules import collect_rules, implicitly, rule
 from pants.engine.target import WrappedTargetRequest
 from pants.engine.unions import UnionRule
 from pants.jvm.compile import ClasspathEntry
+from pants.jvm.dependency_inference.batched_source_analysis import (
+    JvmSourceParser,
+    analyze_sources_in_batches,
+)
 from pants.jvm.jdk_rules import InternalJdk, JvmProcess
 from pants.jvm.jdk_rules import rules as jdk_rules
 from pants.jvm.resolve.common import ArtifactRequirements
@@ -58,16 +62,19 @@ from pants.jvm.resolve.coursier_fetch import ToolClasspathRequest, materialize_c
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, JvmToolBase
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.option.option_types import IntOption
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.resources import read_resource
+from pants.util.strutil import softwrap
 
 logger = logging.getLogger(__name__)
 
 
 _PARSER_SCALA_VERSION = ScalaVersion.parse("2.13.8")
 _PARSER_SCALA_BINARY_VERSION = _PARSER_SCALA_VERSION.binary
+_PARSER_MAIN_CLASS = "org.pantsbuild.backend.scala.dependency_inference.ScalaParser"
 
 
 class ScalaParser(JvmToolBase):
@@ -86,6 +93,21 @@ class ScalaParser(JvmToolBase):
         "scala_parser.lock",
     )
 
+    batch_size = IntOption(
+        default=0,
+        advanced=True,
+        help=softwrap(
+            """
+            If positive, analyze Scala sources for dependency inference with one parser process
+            per batch of up to this many files (of the same Scala version and dialect), rather
+            than with one process per file.
+
+            Files are assigned to batches stably, so that after a change to a few files, only the
+            batches containing them are analyzed again.
+            """
+        ),
+    )
+
 
 @dataclass(frozen=True)
 class ScalaImport:
@@ -341,11 +363,11 @@ async def analyze_scala_source_dependencies(
                     processorcp_relpath,
                 ],
                 argv=[
-                    "org.pantsbuild.backend.scala.dependency_inference.ScalaParser",
-                    analysis_output_path,
-                    source_path,
+                    _PARSER_MAIN_CLASS,
                     str(request.scala_version),
                     str(request.source3),
+                    analysis_output_path,
+                    source_path,
                 ],
                 input_digest=prefixed_source_files_digest,
                 extra_immutable_input_digests=extra_immutable_input_digests,
@@ -360,6 +382,58 @@ async def analyze_scala_source_dependencies(
     return FallibleScalaSourceDependencyAnalysisResult(process_result=process_result)
 
 
+@dataclass(frozen=True)
+class AnalyzeScalaSourcesBatchRequest:
+    """A request to analyze any number of Scala source files of the same dialect, in batches."""
+
+    source_files: SourceFiles
+    scala_version: ScalaVersion
+    source3: bool
+
+
+class ScalaSourceDependencyAnalysisBatch(FrozenDict[str, ScalaSourceDependencyAnalysis]):
+    """The analysis of each file of an `AnalyzeScalaSourcesBatchRequest`, by path."""
+
+
+@rule(desc="Analyze Scala sources for dependencies", level=LogLevel.DEBUG)
+async def analyze_scala_source_dependencies_batch(
+    request: AnalyzeScalaSourcesBatchRequest,
+    jdk: InternalJdk,
+    processor_classfiles: ScalaParserCompiledClassfiles,
+    tool: ScalaParser,
+) -> ScalaSourceDependencyAnalysisBatch:
+    processorcp_relpath = "__processorcp"
+    toolcp_relpath = "__toolcp"
+    tool_classpath = await materialize_classpath_for_tool(
+        ToolClasspathRequest(lockfile=GenerateJvmLockfileFromTool.create(tool))
+    )
+    parser = JvmSourceParser(
+        name="scala_parser",
+        jdk=jdk,
+        classpath_entries=(
+            *tool_classpath.classpath_entries(toolcp_relpath),
+            processorcp_relpath,
+        ),
+        extra_immutable_input_digests=FrozenDict(
+            {
+                toolcp_relpath: tool_classpath.digest,
+                processorcp_relpath: processor_classfiles.digest,
+            }
+        ),
+        main_class=_PARSER_MAIN_CLASS,
+        leading_args=(str(request.scala_version), str(request.source3)),
+    )
+    analyses = await analyze_sources_in_batches(
+        request.source_files,
+        parser,
+        batch_size=tool.batch_size,
+    )
+    return ScalaSourceDependencyAnalysisBatch(
+        (path, ScalaSourceDependencyAnalysis.from_json_dict(analysis))
+        for path, analysis in analyses.items()
+    )
+
+
 @rule(level=LogLevel.DEBUG)
 async def resolve_fallible_result_to_analysis(
     fallible_result: FallibleScalaSourceDependencyAnalysisResult,
@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 
 from pants.backend.scala.dependency_inference.scala_parser import (
+    AnalyzeScalaSourceRequest,
+    AnalyzeScalaSourcesBatchRequest,
+    ScalaParser,
+    ScalaSourceDependencyAnalysis,
+    analyze_scala_source_dependencies_batch,
+    create_analyze_scala_source_request,
     resolve_fallible_result_to_analysis,
 )
 from pants.backend.scala.target_types import ScalaSourceField
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.backend.scala.util_rules.versions import ScalaVersion
+from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.addresses import Address
+from pants.engine.fs import MergeDigests
 from pants.engine.internals.selectors import concurrently
+from pants.engine.intrinsics import digest_to_snapshot
 from pants.engine.rules import collect_rules, implicitly, rule
 from pants.engine.target import AllTargets, Targets
 from pants.engine.unions import UnionRule
@@ -24,6 +33,7 @@ from pants.jvm.dependency_inference.artifact_mapper import (
 from pants.jvm.dependency_inference.symbol_mapper import FirstPartyMappingRequest, SymbolMap
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 
@@ -42,6 +52,85 @@ async def find_all_scala_targets(targets: AllTargets) -> AllScalaTargets:
     return AllScalaTargets(tgt for tgt in targets if tgt.has_field(ScalaSourceField))
 
 
+_ScalaDialect = tuple[ScalaVersion, bool]
+
+
+class AllScalaSourceAnalyses(
+    FrozenDict[tuple[str, ScalaVersion, bool], ScalaSourceDependencyAnalysis]
+):
+    """The analysis of the source of every Scala target, by path, Scala version and `source3`."""
+
+
+@rule(desc="Analyze all Scala sources for dependencies", level=LogLevel.DEBUG)
+async def analyze_all_scala_sources(scala_targets: AllScalaTargets) -> AllScalaSourceAnalyses:
+    analyze_requests = await concurrently(
+        create_analyze_scala_source_request(
+            **implicitly(SourceFilesRequest([target[ScalaSourceField]]))
+        )
+        for target in scala_targets
+    )
+    requests_by_dialect: defaultdict[_ScalaDialect, list[AnalyzeScalaSourceRequest]]
+    requests_by_dialect = defaultdict(list)
+    for request in analyze_requests:
+        requests_by_dialect[(request.scala_version, request.source3)].append(request)
+
+    dialects = list(requests_by_dialect)
+    merged_snapshots = await concurrently(
+        digest_to_snapshot(
+            **implicitly(
+                MergeDigests(
+                    request.source_files.snapshot.digest for request in requests_by_dialect[dialect]
+                )
+            )
+        )
+        for dialect in dialects
+    )
+    batches = await concurrently(
+        analyze_scala_source_dependencies_batch(
+            AnalyzeScalaSourcesBatchRequest(
+                SourceFiles(merged_snapshot, ()), scala_version, source3
+            ),
+            **implicitly(),
+        )
+        for (scala_version, source3), merged_snapshot in zip(dialects, merged_snapshots)
+    )
+    return AllScalaSourceAnalyses(
+        ((path, scala_version, source3), analysis)
+        for (scala_version, source3), batch in zip(dialects, batches)
+        for path, analysis in batch.items()
+    )
+
+
+async def analyze_scala_sources(
+    requests: Sequence[AnalyzeScalaSourceRequest], tool: ScalaParser
+) -> tuple[ScalaSourceDependencyAnalysis, ...]:
+    """Analyze the single source file of each of the given requests.
+
+    If `[scala-parser].batch_size` is set, the analyses are looked up in `AllScalaSourceAnalyses`,
+    which analyzes the sources of all Scala targets together in batches per Scala version and
+    dialect once, for both the symbol map and the inference of each target. Otherwise (or for a
+    file which is not the source of a Scala target), each file is analyzed by its own process.
+    """
+    all_analyses = (
+        await analyze_all_scala_sources(**implicitly())
+        if tool.batch_size > 0
+        else AllScalaSourceAnalyses()
+    )
+    keys = [
+        (request.source_files.files[0], request.scala_version, request.source3)
+        for request in requests
+    ]
+    unanalyzed = [
+        (key, request) for key, request in zip(keys, requests) if key not in all_analyses
+    ]
+    analyses = await concurrently(
+        resolve_fallible_result_to_analysis(**implicitly({request: AnalyzeScalaSourceRequest}))
+        for _, request in unanalyzed
+    )
+    analyzed = {key: analysis for (key, _), analysis in zip(unanalyzed, analyses)}
+    return tuple(all_analyses[key] if key in all_analyses else analyzed[key] for key in keys)
+
+
 SCALA_PACKAGE_OBJECT_NAMESPACE: SymbolNamespace = "package object"
 
 
@@ -61,13 +150,15 @@ async def map_first_party_scala_targets_to_symbols(
     _: FirstPartyScalaTargetsMappingRequest,
     scala_targets: AllScalaTargets,
     jvm: JvmSubsystem,
+    parser_tool: ScalaParser,
 ) -> SymbolMap:
-    source_analysis = await concurrently(
-        resolve_fallible_result_to_analysis(
+    analyze_requests = await concurrently(
+        create_analyze_scala_source_request(
             **implicitly(SourceFilesRequest([target[ScalaSourceField]]))
         )
         for target in scala_targets
     )
+    source_analysis = await analyze_scala_sources(analyze_requests, parser_tool)
     address_and_analysis = zip(
         [(tgt.address, tgt[JvmResolveField].normalized_value(jvm)) for tgt in scala_targets],
         source_analysis,
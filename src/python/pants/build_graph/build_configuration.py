@@ -64,6 +64,9 @@ class BuildConfiguration:
     union_rule_to_providers: FrozenDict[UnionRule, tuple[str, ...]]
     allow_unknown_options: bool
     remote_auth_plugin_func: Callable | None
+    # The option scopes of backends which were not loaded, because the run did not need them.
+    # See `[GLOBAL].lazy_backend_loading`.
+    deferred_scopes: tuple[str, ...] = ()
 
     @property
     def all_subsystems(self) -> tuple[type[Subsystem], ...]:
@@ -144,6 +147,7 @@ class BuildConfiguration:
         )
         _allow_unknown_options: bool = False
         _remote_auth_plugin: Callable | None = None
+        _deferred_scopes: list[str] = field(default_factory=list)
         _pants_ng: bool = False
 
         def registered_aliases(self) -> BuildFileAliases:
@@ -302,6 +306,15 @@ class BuildConfiguration:
                 )
             self.register_subsystems(plugin_or_backend, auxiliary_goals)
 
+        def register_deferred_backend(self, backend: str, scopes: Iterable[str]) -> None:
+            """Records that the given backend was not loaded, along with its option scopes.
+
+            Config for these scopes is not validated, since it can't be without loading the
+            backend.
+            """
+            logger.debug(f"Deferring the loading of backend: {backend}")
+            self._deferred_scopes.extend(scopes)
+
         def allow_unknown_options(self, allow: bool = True) -> None:
             """Allows overriding whether Options parsing will fail for unrecognized Options.
 
@@ -331,6 +344,7 @@ class BuildConfiguration:
                 ),
                 allow_unknown_options=self._allow_unknown_options,
                 remote_auth_plugin_func=self._remote_auth_plugin,
+                deferred_scopes=tuple(self._deferred_scopes),
             )
 
 
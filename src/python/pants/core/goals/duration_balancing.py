@@ -0,0 +1,153 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""Balancing of test batches and shards by the durations that tests took in previous runs."""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import math
+import os
+import statistics
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import TypeVar
+
+from pants.util.dirutil import safe_mkdir_for
+from pants.util.frozendict import FrozenDict
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# The weight of the latest observation when updating the duration of a test, so that predictions
+# follow changes in the duration of a test, without being thrown by a single slow run.
+_SMOOTHING = 0.5
+
+# The predicted duration of every test, in seconds, when no durations have been recorded at all.
+_DEFAULT_DURATION = 1.0
+
+
+class TestDurations:
+    """The smoothed wall time, in seconds, that each test target took to run in previous runs.
+
+    The durations are stored as a JSON object in a file, keyed by address spec, so that the file
+    can be shared between machines, e.g. to give every CI shard the same view of the durations.
+    """
+
+    # Prevent pytest from trying to collect this class as a test.
+    __test__ = False
+
+    def __init__(self, durations: Mapping[str, float] = FrozenDict()) -> None:
+        self.durations = FrozenDict(durations)
+        # Tests which have never run are predicted to take as long as a typical test which has.
+        self._default = (
+            statistics.median(self.durations.values()) if self.durations else _DEFAULT_DURATION
+        )
+
+    @classmethod
+    def load(cls, path: str) -> TestDurations:
+        """Load the durations from the file at `path`, or none if it is missing or unreadable."""
+        try:
+            with open(path) as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable test durations file {path}: {e}")
+            return cls()
+        if not isinstance(data, dict):
+            logger.warning(f"Ignoring malformed test durations file {path}.")
+            return cls()
+        return cls(
+            {
+                key: float(value)
+                for key, value in data.items()
+                if isinstance(value, (int, float)) and math.isfinite(value) and value >= 0
+            }
+        )
+
+    def save(self, path: str) -> None:
+        safe_mkdir_for(path)
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+        with open(tmp_path, "w") as fp:
+            json.dump(dict(sorted(self.durations.items())), fp, indent=2)
+        os.replace(tmp_path, path)
+
+    def predict(self, key: str) -> float:
+        return self.durations.get(key, self._default)
+
+    def updated(self, observed: Mapping[str, float]) -> TestDurations:
+        """Return the durations updated with newly observed durations."""
+        durations = dict(self.durations)
+        for key, duration in observed.items():
+            previous = durations.get(key)
+            durations[key] = (
+                duration
+                if previous is None
+                else _SMOOTHING * duration + (1 - _SMOOTHING) * previous
+            )
+        return TestDurations(durations)
+
+
+def bin_pack(
+    items: Iterable[_T],
+    *,
+    key: Callable[[_T], str],
+    weight: Callable[[_T], float],
+    num_bins: int,
+    max_bin_size: int | None = None,
+) -> list[list[_T]]:
+    """Distribute the items across `num_bins` bins, so that the bins have similar total weights.
+
+    Uses the "longest processing time first" heuristic: each item, from the heaviest to the
+    lightest, is added to the bin with the smallest total weight (which has room for it, if
+    `max_bin_size` is set). Ties are broken by `key`, so the result is deterministic. Empty bins are
+    kept, so that the position of a bin is meaningful (e.g. as a shard index), and items within a
+    bin are ordered by `key`.
+    """
+    if num_bins <= 0:
+        raise ValueError(f"The number of bins must be positive, but was {num_bins}.")
+    sorted_items = sorted(((weight(item), key(item), item) for item in items), key=lambda t: t[:2])
+    if max_bin_size is not None and len(sorted_items) > num_bins * max_bin_size:
+        raise ValueError(
+            f"Cannot fit {len(sorted_items)} items into {num_bins} bins of at most "
+            f"{max_bin_size} items each."
+        )
+
+    bins: list[list[tuple[str, _T]]] = [[] for _ in range(num_bins)]
+    # A heap of (total weight, bin index) for the bins which still have room.
+    heap = [(0.0, i) for i in range(num_bins)]
+    for item_weight, item_key, item in reversed(sorted_items):
+        total, i = heapq.heappop(heap)
+        bins[i].append((item_key, item))
+        if max_bin_size is None or len(bins[i]) < max_bin_size:
+            heapq.heappush(heap, (total + item_weight, i))
+    return [[item for _, item in sorted(b, key=lambda t: t[0])] for b in bins]
+
+
+def partition_by_duration(
+    items: Sequence[_T],
+    *,
+    key: Callable[[_T], str],
+    durations: TestDurations,
+    size_target: int,
+    size_max: int,
+) -> list[list[_T]]:
+    """Partition the items into batches of around `size_target` items with similar durations.
+
+    As many batches are created as `partition_sequentially` would create on average, but unlike
+    with that function, adding or removing an item may move other items to different batches.
+    """
+    if not items:
+        return []
+    num_batches = max(1, math.ceil(len(items) / max(1, size_target)))
+    batches = bin_pack(
+        items,
+        key=key,
+        weight=lambda item: durations.predict(key(item)),
+        num_bins=num_batches,
+        max_bin_size=max(size_max, math.ceil(len(items) / num_batches)),
+    )
+    return [batch for batch in batches if batch]
@@ -0,0 +1,62 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from pathlib import Path
+
+import pytest
+
+from pants.core.goals.duration_balancing import TestDurations, bin_pack, partition_by_duration
+
+
+def test_durations_round_trip(tmp_path: Path) -> None:
+    path = str(tmp_path / "durations.json")
+    assert TestDurations.load(path).durations == {}
+
+    TestDurations({"a": 1.0, "b": 2.5}).save(path)
+    assert TestDurations.load(path).durations == {"a": 1.0, "b": 2.5}
+
+    (tmp_path / "durations.json").write_text("{not json")
+    assert TestDurations.load(path).durations == {}
+
+
+def test_durations_predict_and_update() -> None:
+    durations = TestDurations({"a": 1.0, "b": 2.0, "c": 10.0})
+    assert durations.predict("a") == 1.0
+    # Unknown tests are predicted to take the median duration.
+    assert durations.predict("unknown") == 2.0
+    assert TestDurations().predict("unknown") == 1.0
+
+    updated = durations.updated({"a": 3.0, "d": 4.0})
+    assert updated.durations == {"a": 2.0, "b": 2.0, "c": 10.0, "d": 4.0}
+
+
+def test_bin_pack_balances_weights() -> None:
+    weights = {"a": 8.0, "b": 7.0, "c": 6.0, "d": 5.0, "e": 4.0}
+    bins = bin_pack(weights, key=str, weight=weights.__getitem__, num_bins=2)
+    assert bins == [["a", "d", "e"], ["b", "c"]]
+    # Empty bins are kept, so that bins can be used as shards.
+    assert bin_pack(["a"], key=str, weight=lambda _: 1.0, num_bins=3) == [["a"], [], []]
+
+
+def test_bin_pack_is_deterministic() -> None:
+    items = [f"item{i}" for i in range(20)]
+    bins = bin_pack(items, key=str, weight=lambda _: 1.0, num_bins=3)
+    assert bins == bin_pack(reversed(items), key=str, weight=lambda _: 1.0, num_bins=3)
+    assert sorted(item for b in bins for item in b) == sorted(items)
+
+
+def test_bin_pack_max_bin_size() -> None:
+    weights = {"a": 100.0, "b": 1.0, "c": 1.0, "d": 1.0}
+    bins = bin_pack(weights, key=str, weight=weights.__getitem__, num_bins=2, max_bin_size=2)
+    assert bins == [["a", "b"], ["c", "d"]]
+    with pytest.raises(ValueError):
+        bin_pack(weights, key=str, weight=weights.__getitem__, num_bins=1, max_bin_size=2)
+
+
+def test_partition_by_duration() -> None:
+    durations = TestDurations({"slow": 10.0, "a": 1.0, "b": 1.0, "c": 1.0})
+    assert partition_by_duration([], key=str, durations=durations, size_target=2, size_max=4) == []
+    batches = partition_by_duration(
+        ["a", "b", "c", "slow"], key=str, durations=durations, size_target=2, size_max=4
+    )
+    assert sorted(batches) == [["a", "b", "c"], ["slow"]]
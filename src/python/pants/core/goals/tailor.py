@@ -9,12 +9,12 @@ import logging
 import os
 from abc import ABCMeta
 from collections import defaultdict
-from collections.abc import Iterable, Iterator, Mapping
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
 
-from pants.base.specs import AncestorGlobSpec, DirLiteralSpec, RawSpecs, Specs
+from pants.base.specs import DirLiteralSpec, RawSpecs, Specs
 from pants.build_graph.address import Address
 from pants.engine.collection import DeduplicatedCollection
 from pants.engine.console import Console
@@ -22,7 +22,7 @@ from pants.engine.environment import EnvironmentName
 from pants.engine.fs import CreateDigest, Digest, FileContent, PathGlobs, Workspace
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.internals.build_files import BuildFileOptions
-from pants.engine.internals.graph import resolve_source_paths, resolve_unexpanded_targets
+from pants.engine.internals.graph import resolve_source_paths
 from pants.engine.internals.selectors import concurrently
 from pants.engine.internals.specs_rules import resolve_specs_paths
 from pants.engine.intrinsics import create_digest, get_digest_contents, path_globs_to_paths
@@ -43,6 +43,7 @@ from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized
 from pants.util.strutil import help_text, softwrap
+from pants.vcs.changed import get_added_files, get_deleted_files
 
 logger = logging.getLogger(__name__)
 
@@ -337,6 +338,17 @@ class TailorSubsystem(GoalSubsystem):
         ),
         advanced=True,
     )
+    ignore_modified_files = BoolOption(
+        default=False,
+        help=softwrap(
+            f"""
+            When run on changed files, e.g. `{bin_name()} --changed-since=HEAD tailor`, only
+            consider the directories of files that were added or removed, and skip those whose
+            files were only modified.
+            """
+        ),
+        advanced=True,
+    )
     _ignore_adding_targets = StrListOption(
         help=softwrap(
             """
@@ -418,19 +430,31 @@ def group_by_build_file(
     return ret
 
 
-class AllOwnedSources(DeduplicatedCollection[str]):
-    """All files in the project already owned by targets."""
+class OwnedSourcesIndex(FrozenDict[str, tuple[Address, ...]]):
+    """The addresses of the existing targets that own each file, keyed by file path."""
 
 
-@rule(desc="Determine all files already owned by targets", level=LogLevel.DEBUG)
-async def determine_all_owned_sources(all_tgts: AllUnexpandedTargets) -> AllOwnedSources:
+@rule(desc="Index all files already owned by targets", level=LogLevel.DEBUG)
+async def index_owned_sources(all_tgts: AllUnexpandedTargets) -> OwnedSourcesIndex:
     all_sources_paths = await concurrently(
         resolve_source_paths(SourcesPathsRequest(tgt.get(SourcesField)), **implicitly())
         for tgt in all_tgts
     )
-    return AllOwnedSources(
-        itertools.chain.from_iterable(sources_paths.files for sources_paths in all_sources_paths)
-    )
+
+    owners: defaultdict[str, list[Address]] = defaultdict(list)
+    for tgt, sources_paths in zip(all_tgts, all_sources_paths):
+        for file in sources_paths.files:
+            owners[file].append(tgt.address)
+    return OwnedSourcesIndex((file, tuple(addresses)) for file, addresses in owners.items())
+
+
+class AllOwnedSources(DeduplicatedCollection[str]):
+    """All files in the project already owned by targets."""
+
+
+@rule(desc="Determine all files already owned by targets", level=LogLevel.DEBUG)
+async def determine_all_owned_sources(index: OwnedSourcesIndex) -> AllOwnedSources:
+    return AllOwnedSources(index.keys())
 
 
 @dataclass(frozen=True)
@@ -471,33 +495,23 @@ class DisjointSourcePutativeTarget:
 
 
 @rule
-async def restrict_conflicting_sources(ptgt: PutativeTarget) -> DisjointSourcePutativeTarget:
+async def restrict_conflicting_sources(
+    ptgt: PutativeTarget, owned_sources: OwnedSourcesIndex
+) -> DisjointSourcePutativeTarget:
     source_paths = await path_globs_to_paths(
         PathGlobs(
             SourcesField.prefix_glob_with_dirpath(ptgt.path, glob) for glob in ptgt.owned_sources
         )
     )
-    source_path_set = set(source_paths.files)
-    source_dirs = {os.path.dirname(path) for path in source_path_set}
-    possible_owners = await resolve_unexpanded_targets(
-        **implicitly(
-            RawSpecs(
-                ancestor_globs=tuple(AncestorGlobSpec(d) for d in source_dirs),
-                description_of_origin="the `tailor` goal",
-            )
-        )
-    )
-    possible_owners_sources = await concurrently(
-        resolve_source_paths(SourcesPathsRequest(t.get(SourcesField)), **implicitly())
-        for t in possible_owners
+    conflicting_addrs = sorted(
+        {
+            address.spec
+            for path in source_paths.files
+            for address in owned_sources.get(path, ())
+        }
     )
-    conflicting_targets = []
-    for tgt, sources in zip(possible_owners, possible_owners_sources):
-        if source_path_set.intersection(sources.files):
-            conflicting_targets.append(tgt)
 
-    if conflicting_targets:
-        conflicting_addrs = sorted(tgt.address.spec for tgt in conflicting_targets)
+    if conflicting_addrs:
         explicit_srcs_str = ", ".join(ptgt.kwargs.get("sources") or [])  # type: ignore[arg-type]
         orig_sources_str = (
             f"[{explicit_srcs_str}]" if explicit_srcs_str else f"the default for {ptgt.type_alias}"
@@ -652,7 +666,16 @@ async def tailor(
         return TailorGoal(exit_code=0)
 
     specs_paths = await resolve_specs_paths(specs)
-    dir_search_paths = tuple(sorted({os.path.dirname(f) for f in specs_paths.files}))
+    search_files: Iterable[str] = specs_paths.files
+    if specs.includes.from_change_detection and tailor_subsystem.ignore_modified_files:
+        added_files, deleted_files = await concurrently(
+            get_added_files(**implicitly()), get_deleted_files(**implicitly())
+        )
+        added_file_set = set(added_files.paths)
+        search_files = itertools.chain(
+            (f for f in specs_paths.files if f in added_file_set), deleted_files.paths
+        )
+    dir_search_paths = tuple(sorted({os.path.dirname(f) for f in search_files}))
 
     putative_targets_results = await concurrently(
         generate_putative_targets(
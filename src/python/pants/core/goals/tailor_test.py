@@ -17,6 +17,7 @@ from pants.core.goals.tailor import (
     DisjointSourcePutativeTarget,
     EditBuildFilesRequest,
     EditedBuildFiles,
+    OwnedSourcesIndex,
     PutativeTarget,
     PutativeTargets,
     PutativeTargetsRequest,
@@ -29,6 +30,7 @@ from pants.core.goals.tailor import (
     resolve_specs_with_build,
 )
 from pants.core.util_rules import source_files
+from pants.engine.addresses import Address
 from pants.engine.fs import DigestContents, FileContent
 from pants.engine.internals.build_files import extract_build_file_options
 from pants.engine.intrinsics import path_globs_to_paths
@@ -145,6 +147,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(DisjointSourcePutativeTarget, (PutativeTarget,)),
             QueryRule(EditedBuildFiles, (EditBuildFilesRequest,)),
             QueryRule(AllOwnedSources, ()),
+            QueryRule(OwnedSourcesIndex, ()),
         ],
         target_types=[FortranLibraryTarget, FortranTestsTarget],
     )
@@ -516,6 +519,49 @@ def test_all_owned_sources(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_owned_sources_index(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "dir/a.f90": "",
+            "dir/b.f90": "",
+            "dir/sub/c.f90": "",
+            "dir/BUILD": "fortran_library(sources=['*.f90', 'sub/c.f90'])",
+            "dir/sub/BUILD": "fortran_library()",
+            "unowned.f90": "",
+        }
+    )
+    assert rule_runner.request(OwnedSourcesIndex, []) == OwnedSourcesIndex(
+        {
+            "dir/a.f90": (Address("dir"),),
+            "dir/b.f90": (Address("dir"),),
+            "dir/sub/c.f90": (Address("dir"), Address("dir/sub")),
+        }
+    )
+
+
+def test_restrict_conflicting_sources_from_index(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "dir/a.f90": "",
+            "dir/b.f90": "",
+            "dir/sub/BUILD": "fortran_library(sources=[])",
+        }
+    )
+    # Files which are owned by no target do not conflict.
+    ptgt = PutativeTarget(
+        "dir", "dir0", "fortran_library", ["b.f90"], FortranLibrarySources.default
+    )
+    assert rule_runner.request(DisjointSourcePutativeTarget, [ptgt]).putative_target == ptgt
+
+    rule_runner.write_files({"dir/BUILD": "fortran_library(sources=['a.f90'])"})
+    restricted_ptgt = rule_runner.request(DisjointSourcePutativeTarget, [ptgt]).putative_target
+    assert ("b.f90",) == restricted_ptgt.owned_sources
+    assert (
+        "# NOTE: Sources restricted from the default for fortran_library due to conflict with",
+        "#   - dir:dir",
+    ) == restricted_ptgt.comments
+
+
 def test_target_type_with_no_sources_field(rule_runner: RuleRunner) -> None:
     putative_targets = rule_runner.request(
         PutativeTargets, [MockPutativeFortranModuleRequest(("dir",))]
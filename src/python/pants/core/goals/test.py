@@ -22,6 +22,7 @@ from pants.core.environments.rules import (
     SingleEnvironmentNameRequest,
     resolve_single_environment_name,
 )
+from pants.core.goals.duration_balancing import TestDurations, bin_pack, partition_by_duration
 from pants.core.goals.multi_tool_goal_helper import SkippableSubsystem
 from pants.core.goals.package import (
     BuiltPackage,
@@ -79,6 +80,7 @@ from pants.engine.target import (
     parse_shard_spec,
 )
 from pants.engine.unions import UnionMembership, UnionRule, distinct_union_type_per_subclass, union
+from pants.option.global_options import GlobalOptions
 from pants.option.option_types import BoolOption, EnumOption, IntOption, StrListOption, StrOption
 from pants.util.collections import partition_sequentially
 from pants.util.dirutil import safe_open
@@ -640,9 +642,9 @@ class TestSubsystem(GoalSubsystem):
             Useful for splitting large numbers of test files across multiple machines in CI.
             For example, you can run three shards with `--shard=0/3`, `--shard=1/3`, `--shard=2/3`.
 
-            Note that the shards are roughly equal in size as measured by number of files.
-            No attempt is made to consider the size of different files, the time they have
-            taken to run in the past, or other such sophisticated measures.
+            Note that the shards are roughly equal in size as measured by number of files, unless
+            `[test].balance_by_duration` is set, in which case they are roughly equal in the time
+            their tests took to run in the past.
             """
         ),
     )
@@ -713,6 +715,38 @@ class TestSubsystem(GoalSubsystem):
         ),
     )
 
+    balance_by_duration = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            Balance batches of tests (see `[test].batch_size`) and shards of tests (see
+            `[test].shard`) by the time that their tests took to run in previous runs, rather than
+            by their number of files.
+
+            The wall time of each test target that runs is recorded in `[test].durations_file`.
+            Test targets with no recorded time are assumed to take as long as a typical test.
+
+            Balanced batches are not created at stable boundaries, so adding or removing a test may
+            change the batches of other tests, and cause cache misses for those batches.
+
+            When sharding, every shard must use the same durations file, e.g. one restored from a
+            CI cache, or else some tests may run in no shard or in several shards.
+            """
+        ),
+    )
+    _durations_file = StrOption(
+        "--durations-file",
+        default=str(PurePath("{pants_workdir}", "test_durations.json")),
+        advanced=True,
+        help=softwrap(
+            """
+            Path to the file that records the durations of test targets, for
+            `[test].balance_by_duration`. Relative paths are relative to the build root.
+            """
+        ),
+    )
+
     show_rerun_command = BoolOption(
         default="CI" in os.environ,
         advanced=True,
@@ -749,6 +783,9 @@ class TestSubsystem(GoalSubsystem):
     def report_dir(self, distdir: DistDir) -> PurePath:
         return PurePath(self._report_dir.format(distdir=distdir.relpath))
 
+    def durations_file(self, pants_workdir: str) -> str:
+        return self._durations_file.format(pants_workdir=pants_workdir)
+
     @property
     def attempts_default(self):
         if self._attempts_default < 1:
@@ -861,6 +898,7 @@ async def _get_test_batches(
     targets_to_field_sets: TargetRootsToFieldSets,
     local_environment_name: ChosenLocalEnvironmentName,
     test_subsystem: TestSubsystem,
+    durations: TestDurations | None = None,
 ) -> list[TestRequest.Batch]:
     def partitions_call(request_type: type[TestRequest]) -> Coroutine[Any, Any, Partitions]:
         partition_type = cast(TestRequest, request_type)
@@ -884,21 +922,74 @@ async def _get_test_batches(
         partitions_call(request_type) for request_type in core_request_types
     )
 
+    def key(element: Any) -> str:
+        return str(element.address) if isinstance(element, FieldSet) else str(element)
+
+    def batches(elements: Sequence[Any]) -> Iterable[list[Any]]:
+        if durations is not None:
+            return partition_by_duration(
+                elements,
+                key=key,
+                durations=durations,
+                size_target=test_subsystem.batch_size,
+                size_max=2 * test_subsystem.batch_size,
+            )
+        return partition_sequentially(
+            elements,
+            key=key,
+            size_target=test_subsystem.batch_size,
+            size_max=2 * test_subsystem.batch_size,
+        )
+
     return [
         request_type.Batch(
             cast(TestRequest, request_type).tool_name, tuple(batch), partition.metadata
         )
         for request_type, partitions in zip(core_request_types, all_partitions)
         for partition in partitions
-        for batch in partition_sequentially(
-            partition.elements,
-            key=lambda x: str(x.address) if isinstance(x, FieldSet) else str(x),
-            size_target=test_subsystem.batch_size,
-            size_max=2 * test_subsystem.batch_size,
-        )
+        for batch in batches(partition.elements)
     ]
 
 
+def _shard_by_duration(
+    targets_to_field_sets: TargetRootsToFieldSets,
+    durations: TestDurations,
+    shard: int,
+    num_shards: int,
+) -> TargetRootsToFieldSets:
+    """Keep the targets of the given shard, of shards balanced by the durations of the targets."""
+    shards = bin_pack(
+        targets_to_field_sets.mapping,
+        key=lambda tgt: tgt.address.spec,
+        weight=lambda tgt: durations.predict(tgt.address.spec),
+        num_bins=num_shards,
+    )
+    return TargetRootsToFieldSets(
+        {tgt: targets_to_field_sets.mapping[tgt] for tgt in shards[shard]}
+    )
+
+
+def _observed_durations(results: Iterable[TestResult], run_id: RunId) -> dict[str, float]:
+    """The wall time, in seconds, of each test target which ran in this run.
+
+    The time of a batch of several targets is split evenly between them.
+    """
+    observed = {}
+    for result in results:
+        metadata = result.result_metadata
+        if (
+            metadata is None
+            or metadata.total_elapsed_ms is None
+            or metadata.source(run_id) != ProcessResultMetadata.Source.RAN
+            or not result.addresses
+        ):
+            continue
+        duration = metadata.total_elapsed_ms / 1000 / len(result.addresses)
+        for address in result.addresses:
+            observed[address.spec] = duration
+    return observed
+
+
 async def _run_debug_tests(
     batches: Iterable[TestRequest.Batch],
     environment_names: Sequence[EnvironmentName],
@@ -955,6 +1046,7 @@ async def run_tests(
     distdir: DistDir,
     run_id: RunId,
     local_environment_name: ChosenLocalEnvironmentName,
+    global_options: GlobalOptions,
 ) -> Test:
     if test_subsystem.debug_adapter:
         goal_description = f"`{test_subsystem.name} --debug-adapter`"
@@ -967,16 +1059,23 @@ async def run_tests(
         no_applicable_targets_behavior = NoApplicableTargetsBehavior.warn
 
     shard, num_shards = parse_shard_spec(test_subsystem.shard, "the [test].shard option")
+    durations_file = test_subsystem.durations_file(global_options.pants_workdir)
+    durations = TestDurations.load(durations_file) if test_subsystem.balance_by_duration else None
     targets_to_valid_field_sets = await find_valid_field_sets_for_target_roots(
         TargetRootsToFieldSetsRequest(
             TestFieldSet,
             goal_description=goal_description,
             no_applicable_targets_behavior=no_applicable_targets_behavior,
-            shard=shard,
-            num_shards=num_shards,
+            # Balanced shards are computed below, from all the targets.
+            shard=shard if durations is None else 0,
+            num_shards=num_shards if durations is None else -1,
         ),
         **implicitly(),
     )
+    if durations is not None and num_shards > 0:
+        targets_to_valid_field_sets = _shard_by_duration(
+            targets_to_valid_field_sets, durations, shard, num_shards
+        )
 
     request_types = union_membership.get(TestRequest)
     test_batches = await _get_test_batches(
@@ -984,6 +1083,7 @@ async def run_tests(
         targets_to_valid_field_sets,
         local_environment_name,
         test_subsystem,
+        durations,
     )
 
     environment_names = await concurrently(
@@ -1116,6 +1216,11 @@ async def run_tests(
     if test_subsystem.experimental_report_test_result_info:
         _save_test_result_info_report_file(run_id, test_result_info)
 
+    if durations is not None:
+        observed_durations = _observed_durations(results, run_id)
+        if observed_durations:
+            durations.updated(observed_durations).save(durations_file)
+
     return Test(exit_code)
 
 
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import os
 from abc import abstractmethod
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -19,6 +20,7 @@ from pants.backend.python.target_types import PexBinary, PythonSourcesGeneratorT
 from pants.backend.python.target_types_rules import rules as python_target_type_rules
 from pants.backend.python.util_rules import pex_from_targets
 from pants.core.environments.rules import ChosenLocalEnvironmentName
+from pants.core.goals.duration_balancing import TestDurations
 from pants.core.goals.test import (
     BuildPackageDependenciesRequest,
     BuiltPackageDependencies,
@@ -65,6 +67,7 @@ from pants.engine.target import (
     TargetRootsToFieldSetsRequest,
 )
 from pants.engine.unions import UnionMembership, UnionRule
+from pants.option.global_options import GlobalOptions
 from pants.option.option_types import SkipOption
 from pants.option.subsystem import Subsystem
 from pants.testutil.option_util import create_goal_subsystem, create_subsystem
@@ -261,6 +264,7 @@ def run_test_rule(
     output: ShowOutput = ShowOutput.ALL,
     valid_targets: bool = True,
     show_rerun_command: bool = False,
+    balance_by_duration: bool = False,
     run_id: RunId = RunId(999),
 ) -> tuple[int, str]:
     test_subsystem = create_goal_subsystem(
@@ -277,6 +281,8 @@ def run_test_rule(
         shard="",
         batch_size=1,
         show_rerun_command=show_rerun_command,
+        balance_by_duration=balance_by_duration,
+        durations_file=os.path.join("{pants_workdir}", "test_durations.json"),
     )
     debug_adapter_subsystem = create_subsystem(
         DebugAdapterSubsystem,
@@ -339,6 +345,7 @@ def run_test_rule(
                 DistDir(relpath=Path("dist")),
                 run_id,
                 ChosenLocalEnvironmentName(EnvironmentName(None)),
+                create_subsystem(GlobalOptions, pants_workdir=rule_runner.pants_workdir),
             ],
             mock_calls={
                 "pants.core.goals.test.partition_tests": mock_partitioner,
@@ -362,6 +369,24 @@ def run_test_rule(
         return result.exit_code, stdio_reader.get_stderr()
 
 
+def test_balance_by_duration_records_durations(rule_runner: PythonRuleRunner) -> None:
+    durations_file = os.path.join(rule_runner.pants_workdir, "test_durations.json")
+    TestDurations({"//:t1": 3.0}).save(durations_file)
+    exit_code, _ = run_test_rule(
+        rule_runner,
+        request_type=SuccessfulRequest,
+        targets=[make_target(Address("", target_name=name)) for name in ("t1", "t2")],
+        balance_by_duration=True,
+        # Results are only recorded if they ran in this run.
+        run_id=RunId(0),
+    )
+    assert exit_code == 0
+    assert TestDurations.load(durations_file).durations == {
+        "//:t1": pytest.approx((3.0 + 0.999) / 2),
+        "//:t2": pytest.approx(0.999),
+    }
+
+
 def test_invalid_target_noops(rule_runner: PythonRuleRunner) -> None:
     exit_code, stderr = run_test_rule(
         rule_runner,
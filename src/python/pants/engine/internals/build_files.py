@@ -5,19 +5,21 @@ from __future__ import annotations
 
 import ast
 import builtins
+import hashlib
 import itertools
 import logging
 import os.path
 import sys
 import typing
 from collections import defaultdict
-from collections.abc import Coroutine, Sequence
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from pathlib import PurePath
 from typing import Any, cast
 
 import typing_extensions
 
+from pants.base.build_environment import get_buildroot
 from pants.build_graph.address import (
     Address,
     AddressInput,
@@ -55,7 +57,7 @@ from pants.engine.internals.synthetic_targets import (
     get_synthetic_address_maps,
 )
 from pants.engine.internals.target_adaptor import TargetAdaptor, TargetAdaptorRequest
-from pants.engine.intrinsics import get_digest_contents, path_globs_to_paths
+from pants.engine.intrinsics import get_digest_contents, path_globs_to_digest, path_globs_to_paths
 from pants.engine.rules import QueryRule, collect_rules, implicitly, rule
 from pants.engine.target import (
     DependenciesRuleApplication,
@@ -67,7 +69,9 @@ from pants.engine.unions import UnionMembership
 from pants.init.bootstrap_scheduler import BootstrapStatus
 from pants.option.global_options import GlobalOptions
 from pants.util.frozendict import FrozenDict
+from pants.util.persistent_cache import PersistentCache, fingerprint_strings
 from pants.util.strutil import softwrap
+from pants.version import VERSION
 
 logger = logging.getLogger(__name__)
 
@@ -188,6 +192,201 @@ async def evaluate_preludes(
     return BuildFilePreludeSymbols.create(locals, env_vars)
 
 
+@dataclass(frozen=True)
+class BuildFileParseCacheKey:
+    """The inputs that affect the evaluation of every BUILD file.
+
+    See `[GLOBAL].build_file_parse_cache`. If `cache_dir` is None, the cache is disabled.
+    """
+
+    cache_dir: str | None
+    fingerprint: str = ""
+
+
+# Bump this when changing the format of cached BUILD file parse results.
+_BUILD_FILE_PARSE_CACHE_VERSION = 1
+
+
+@rule
+async def compute_build_file_parse_cache_key(
+    global_options: GlobalOptions,
+    bootstrap_status: BootstrapStatus,
+    build_file_options: BuildFileOptions,
+    parser: Parser,
+    registered_target_types: RegisteredTargetTypes,
+    union_membership: UnionMembership,
+    maybe_build_file_dependency_rules_implementation: MaybeBuildFileDependencyRulesImplementation,
+) -> BuildFileParseCacheKey:
+    if not global_options.build_file_parse_cache:
+        return BuildFileParseCacheKey(cache_dir=None)
+
+    prelude_digest = await path_globs_to_digest(
+        PathGlobs(
+            build_file_options.prelude_globs,
+            glob_match_error_behavior=GlobMatchErrorBehavior.ignore,
+        )
+    )
+    dependency_rules_class = (
+        maybe_build_file_dependency_rules_implementation.build_file_dependency_rules_class
+    )
+
+    def type_name(cls: type) -> str:
+        return f"{cls.__module__}.{cls.__qualname__}"
+
+    # Detect when the set of symbols (and the fields of each target type) changes, e.g. due to
+    # enabling a backend, and when the implementation of any of them changes, e.g. in an in-repo
+    # plugin.
+    registered_aliases = (
+        *(f"{alias}={type_name(type(value))}" for alias, value in sorted(parser.symbols.items())),
+        *(
+            f"{alias}={type_name(tgt_type)}:"
+            + ",".join(
+                sorted(
+                    field_type.alias for field_type in tgt_type.class_field_types(union_membership)
+                )
+            )
+            for alias, tgt_type in sorted(registered_target_types.aliases_to_types.items())
+        ),
+    )
+    return BuildFileParseCacheKey(
+        cache_dir=global_options.pants_workdir,
+        fingerprint=fingerprint_strings(
+            (
+                VERSION,
+                get_buildroot(),
+                repr(build_file_options),
+                str(bootstrap_status.in_progress),
+                str(parser.ignore_unrecognized_symbols),
+                prelude_digest.fingerprint,
+                type_name(dependency_rules_class) if dependency_rules_class else "",
+                *registered_aliases,
+                *_fingerprint_source_files(
+                    (
+                        *parser.symbols.values(),
+                        *(
+                            field_type
+                            for tgt_type in registered_target_types.types
+                            for field_type in (
+                                tgt_type,
+                                *tgt_type.class_field_types(union_membership),
+                            )
+                        ),
+                        *([dependency_rules_class] if dependency_rules_class else []),
+                    )
+                ),
+            )
+        ),
+    )
+
+
+def _fingerprint_source_files(implementations: Sequence[Any]) -> list[str]:
+    """Fingerprint the source files of the modules which define the given objects (and the
+    classes of those objects, and their base classes)."""
+    module_names: set[str] = set()
+    for implementation in implementations:
+        cls = implementation if isinstance(implementation, type) else type(implementation)
+        module_names.update(base.__module__ for base in cls.__mro__)
+        module_name = getattr(implementation, "__module__", None)
+        if isinstance(module_name, str):
+            module_names.add(module_name)
+
+    fingerprints = []
+    for module_name in sorted(module_names):
+        path = getattr(sys.modules.get(module_name), "__file__", None)
+        if not path:
+            continue
+        try:
+            with open(path, "rb") as f:
+                fingerprints.append(f"{path}={hashlib.sha256(f.read()).hexdigest()}")
+        except OSError:
+            fingerprints.append(f"{path}=<unreadable>")
+    return fingerprints
+
+
+@dataclass(frozen=True)
+class _ParsedBuildFiles:
+    """The result of evaluating the BUILD files in a directory, as stored in the parse cache."""
+
+    declared_address_maps: tuple[AddressMap, ...]
+    defaults: BuildFileDefaults
+    dependents_rules: BuildFileDependencyRules | None
+    dependencies_rules: BuildFileDependencyRules | None
+    # The names of the environment variables requested while evaluating each BUILD file, and a
+    # fingerprint of their values. The entry is only valid if the values are unchanged.
+    env_vars: tuple[tuple[tuple[str, ...], str], ...]
+
+    def to_picklable(self) -> tuple:
+        # TargetAdaptor is not picklable, so we store its constructor arguments instead.
+        return (
+            tuple(
+                (
+                    address_map.path,
+                    tuple(
+                        (
+                            tgt.type_alias,
+                            tgt.name,
+                            tgt.description_of_origin,
+                            tgt.origin_sources_blocks,
+                            dict(tgt.kwargs),
+                        )
+                        for tgt in address_map.name_to_target_adaptor.values()
+                    ),
+                )
+                for address_map in self.declared_address_maps
+            ),
+            self.defaults,
+            self.dependents_rules,
+            self.dependencies_rules,
+            self.env_vars,
+        )
+
+    @classmethod
+    def from_picklable(cls, value: tuple) -> _ParsedBuildFiles:
+        address_maps, defaults, dependents_rules, dependencies_rules, env_vars = value
+        return cls(
+            declared_address_maps=tuple(
+                AddressMap.create(
+                    path,
+                    (
+                        TargetAdaptor(type_alias, name, origin, origin_sources_blocks, **kwargs)
+                        for type_alias, name, origin, origin_sources_blocks, kwargs in targets
+                    ),
+                )
+                for path, targets in address_maps
+            ),
+            defaults=defaults,
+            dependents_rules=dependents_rules,
+            dependencies_rules=dependencies_rules,
+            env_vars=env_vars,
+        )
+
+
+def _fingerprint_env_vars(env_vars: EnvironmentVars) -> str:
+    return fingerprint_strings(f"{k}={v}" for k, v in sorted(env_vars.items()))
+
+
+async def _load_parsed_build_files(
+    cache: PersistentCache, key: str, env: CompleteEnvironmentVars
+) -> _ParsedBuildFiles | None:
+    cached = cache.load_pickle(key)
+    if cached is None:
+        return None
+    try:
+        parsed = _ParsedBuildFiles.from_picklable(cached)
+    except Exception as e:
+        logger.debug(f"Ignoring unusable BUILD file parse cache entry: {e}")
+        return None
+    current_env_vars = await concurrently(
+        environment_vars_subset(EnvironmentVarsRequest(names), env) for names, _ in parsed.env_vars
+    )
+    if any(
+        _fingerprint_env_vars(current) != fingerprint
+        for current, (_, fingerprint) in zip(current_env_vars, parsed.env_vars)
+    ):
+        return None
+    return parsed
+
+
 @rule
 async def get_all_build_file_symbols_info(
     parser: Parser, prelude_symbols: BuildFilePreludeSymbols
@@ -253,6 +452,8 @@ class AddressFamilyDir(EngineAwareParameter):
 class OptionalAddressFamily:
     path: str
     address_family: AddressFamily | None = None
+    # The key of this family in the BUILD file parse cache, if it is enabled.
+    parse_cache_key: str | None = field(default=None, compare=False)
 
     def ensure(self) -> AddressFamily:
         if self.address_family is not None:
@@ -316,6 +517,74 @@ class BUILDFileEnvVarExtractor(ast.NodeVisitor):
             self.visit(kwarg)
 
 
+def _evaluate_build_files(
+    directory: str,
+    parsed_build_files: Sequence[tuple[FileContent, ast.Module]],
+    env_vars: Sequence[tuple[tuple[str, ...], EnvironmentVars]],
+    parser: Parser,
+    prelude_symbols: BuildFilePreludeSymbols,
+    bootstrap_status: BootstrapStatus,
+    defaults: BuildFileDefaults,
+    dependents_rules: BuildFileDependencyRules | None,
+    dependencies_rules: BuildFileDependencyRules | None,
+    registered_target_types: RegisteredTargetTypes,
+    union_membership: UnionMembership,
+    maybe_build_file_dependency_rules_implementation: MaybeBuildFileDependencyRulesImplementation,
+) -> _ParsedBuildFiles:
+    defaults_parser_state = BuildFileDefaultsParserState.create(
+        directory, defaults, registered_target_types, union_membership
+    )
+    build_file_dependency_rules_class = (
+        maybe_build_file_dependency_rules_implementation.build_file_dependency_rules_class
+    )
+    if build_file_dependency_rules_class is not None:
+        dependents_rules_parser_state = build_file_dependency_rules_class.create_parser_state(
+            directory,
+            dependents_rules,
+        )
+        dependencies_rules_parser_state = build_file_dependency_rules_class.create_parser_state(
+            directory,
+            dependencies_rules,
+        )
+    else:
+        dependents_rules_parser_state = None
+        dependencies_rules_parser_state = None
+
+    declared_address_maps = [
+        AddressMap.parse(
+            fc.path,
+            fc.content.decode(),
+            tree,
+            parser,
+            prelude_symbols,
+            file_env_vars,
+            bootstrap_status.in_progress,
+            defaults_parser_state,
+            dependents_rules_parser_state,
+            dependencies_rules_parser_state,
+        )
+        for (fc, tree), (_, file_env_vars) in zip(parsed_build_files, env_vars)
+    ]
+    declared_address_maps.sort(key=lambda x: x.path)
+
+    # Freeze defaults and dependency rules
+    return _ParsedBuildFiles(
+        declared_address_maps=tuple(declared_address_maps),
+        defaults=defaults_parser_state.get_frozen_defaults(),
+        dependents_rules=cast(
+            "BuildFileDependencyRules | None",
+            dependents_rules_parser_state
+            and dependents_rules_parser_state.get_frozen_dependency_rules(),
+        ),
+        dependencies_rules=cast(
+            "BuildFileDependencyRules | None",
+            dependencies_rules_parser_state
+            and dependencies_rules_parser_state.get_frozen_dependency_rules(),
+        ),
+        env_vars=tuple((names, _fingerprint_env_vars(values)) for names, values in env_vars),
+    )
+
+
 @rule(desc="Search for addresses in BUILD files")
 async def parse_address_family(
     directory: AddressFamilyDir,
@@ -327,6 +596,7 @@ async def parse_address_family(
     union_membership: UnionMembership,
     maybe_build_file_dependency_rules_implementation: MaybeBuildFileDependencyRulesImplementation,
     session_values: SessionValues,
+    build_file_parse_cache_key: BuildFileParseCacheKey,
 ) -> OptionalAddressFamily:
     """Given an AddressMapper and a directory, return an AddressFamily.
 
@@ -355,6 +625,7 @@ async def parse_address_family(
     defaults = BuildFileDefaults({})
     dependents_rules: BuildFileDependencyRules | None = None
     dependencies_rules: BuildFileDependencyRules | None = None
+    parent_parse_cache_key = ""
     parent_dirs = tuple(PurePath(directory.path).parents)
     if parent_dirs:
         maybe_parents = await concurrently(
@@ -367,78 +638,69 @@ async def parse_address_family(
                 defaults = family.defaults
                 dependents_rules = family.dependents_rules
                 dependencies_rules = family.dependencies_rules
+                parent_parse_cache_key = maybe_parent.parse_cache_key or ""
                 break
 
-    defaults_parser_state = BuildFileDefaultsParserState.create(
-        directory.path, defaults, registered_target_types, union_membership
-    )
-    build_file_dependency_rules_class = (
-        maybe_build_file_dependency_rules_implementation.build_file_dependency_rules_class
-    )
-    if build_file_dependency_rules_class is not None:
-        dependents_rules_parser_state = build_file_dependency_rules_class.create_parser_state(
-            directory.path,
-            dependents_rules,
+    parse_cache: PersistentCache | None = None
+    parse_cache_key: str | None = None
+    parsed: _ParsedBuildFiles | None = None
+    env = session_values[CompleteEnvironmentVars]
+    if build_file_parse_cache_key.cache_dir is not None:
+        parse_cache = PersistentCache(
+            build_file_parse_cache_key.cache_dir,
+            "build_file_parse_cache",
+            version=_BUILD_FILE_PARSE_CACHE_VERSION,
         )
-        dependencies_rules_parser_state = build_file_dependency_rules_class.create_parser_state(
-            directory.path,
-            dependencies_rules,
+        # A directory inherits the defaults and dependency rules of its closest ancestor with an
+        # AddressFamily, so the key of that ancestor is part of our own key.
+        parse_cache_key = fingerprint_strings(
+            (
+                build_file_parse_cache_key.fingerprint,
+                directory.path,
+                parent_parse_cache_key,
+                *itertools.chain.from_iterable(
+                    (fc.path, hashlib.sha256(fc.content).hexdigest()) for fc in digest_contents
+                ),
+            )
         )
-    else:
-        dependents_rules_parser_state = None
-        dependencies_rules_parser_state = None
-
-    parsed_build_files = [
-        (fc, _parse_build_file_ast(fc.content, fc.path)) for fc in digest_contents
-    ]
-
-    def _extract_env_vars(
-        tree: ast.Module, filename: str, extra_env: Sequence[str], env: CompleteEnvironmentVars
-    ) -> Coroutine[Any, Any, EnvironmentVars]:
-        """For BUILD file env vars, we only ever consult the local systems env."""
-        env_vars = (*BUILDFileEnvVarExtractor.get_env_vars_from_tree(tree, filename), *extra_env)
-        return environment_vars_subset(EnvironmentVarsRequest(env_vars), env)
-
-    all_env_vars = await concurrently(
-        _extract_env_vars(
-            tree,
-            fc.path,
-            prelude_symbols.referenced_env_vars,
-            session_values[CompleteEnvironmentVars],
+        parsed = await _load_parsed_build_files(parse_cache, parse_cache_key, env)
+
+    if parsed is None:
+        parsed_build_files = [
+            (fc, _parse_build_file_ast(fc.content, fc.path)) for fc in digest_contents
+        ]
+        # For BUILD file env vars, we only ever consult the local systems env.
+        env_var_names = [
+            (
+                *BUILDFileEnvVarExtractor.get_env_vars_from_tree(tree, fc.path),
+                *prelude_symbols.referenced_env_vars,
+            )
+            for fc, tree in parsed_build_files
+        ]
+        all_env_vars = await concurrently(
+            environment_vars_subset(EnvironmentVarsRequest(names), env) for names in env_var_names
         )
-        for fc, tree in parsed_build_files
-    )
-
-    declared_address_maps = [
-        AddressMap.parse(
-            fc.path,
-            fc.content.decode(),
-            tree,
+        parsed = _evaluate_build_files(
+            directory.path,
+            parsed_build_files,
+            tuple(zip(env_var_names, all_env_vars)),
             parser,
             prelude_symbols,
-            env_vars,
-            bootstrap_status.in_progress,
-            defaults_parser_state,
-            dependents_rules_parser_state,
-            dependencies_rules_parser_state,
+            bootstrap_status,
+            defaults,
+            dependents_rules,
+            dependencies_rules,
+            registered_target_types,
+            union_membership,
+            maybe_build_file_dependency_rules_implementation,
         )
-        for (fc, tree), env_vars in zip(parsed_build_files, all_env_vars)
-    ]
-    declared_address_maps.sort(key=lambda x: x.path)
-
-    # Freeze defaults and dependency rules
-    frozen_defaults = defaults_parser_state.get_frozen_defaults()
-    frozen_dependents_rules = cast(
-        "BuildFileDependencyRules | None",
-        dependents_rules_parser_state
-        and dependents_rules_parser_state.get_frozen_dependency_rules(),
-    )
-    frozen_dependencies_rules = cast(
-        "BuildFileDependencyRules | None",
-        dependencies_rules_parser_state
-        and dependencies_rules_parser_state.get_frozen_dependency_rules(),
-    )
+        if parse_cache is not None and parse_cache_key is not None:
+            parse_cache.store_pickle(parse_cache_key, parsed.to_picklable())
 
+    declared_address_maps = parsed.declared_address_maps
+    frozen_defaults = parsed.defaults
+    frozen_dependents_rules = parsed.dependents_rules
+    frozen_dependencies_rules = parsed.dependencies_rules
     # Process synthetic targets.
 
     def apply_defaults(tgt: TargetAdaptor) -> TargetAdaptor:
@@ -542,6 +804,7 @@ async def parse_address_family(
             dependents_rules=frozen_dependents_rules,
             dependencies_rules=frozen_dependencies_rules,
         ),
+        parse_cache_key=parse_cache_key,
     )
 
 
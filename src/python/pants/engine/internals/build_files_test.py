@@ -3,14 +3,18 @@
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import re
+import sys
 from collections.abc import Mapping
+from pathlib import Path
 from textwrap import dedent
 from typing import Any
 
 import pytest
 
+from pants.base.exceptions import MappingError
 from pants.build_graph.address import BuildFileAddressRequest, MaybeAddress, ResolveError
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.core.target_types import GenericTarget, ResourceTarget
@@ -21,8 +25,10 @@ from pants.engine.internals.build_files import (
     AddressFamilyDir,
     BUILDFileEnvVarExtractor,
     BuildFileOptions,
+    BuildFileParseCacheKey,
     BuildFileSyntaxError,
     OptionalAddressFamily,
+    _fingerprint_source_files,
     evaluate_preludes,
     parse_address_family,
 )
@@ -74,6 +80,7 @@ def test_parse_address_family_empty() -> None:
             UnionMembership.empty(),
             MaybeBuildFileDependencyRulesImplementation(None),
             SessionValues({CompleteEnvironmentVars: CompleteEnvironmentVars({})}),
+            BuildFileParseCacheKey(cache_dir=None),
         ],
         mock_calls={
             "pants.engine.intrinsics.get_digest_contents": lambda __implicitly: DigestContents(
@@ -113,6 +120,7 @@ def test_extend_synthetic_target() -> None:
             UnionMembership.empty(),
             MaybeBuildFileDependencyRulesImplementation(None),
             SessionValues({CompleteEnvironmentVars: CompleteEnvironmentVars({})}),
+            BuildFileParseCacheKey(cache_dir=None),
         ],
         mock_calls={
             "pants.engine.intrinsics.get_digest_contents": lambda __implicitly: DigestContents(
@@ -179,6 +187,78 @@ def test_extend_synthetic_target() -> None:
     assert tgt.kwargs == FrozenDict({"description": "b", "extend": 42})
 
 
+def test_fingerprint_source_files(tmp_path: Path) -> None:
+    # E.g. a macro or target type defined by an in-repo plugin.
+    plugin_file = tmp_path / "my_plugin.py"
+    plugin_file.write_text("class MyTarget:\n    pass\n")
+    spec = importlib.util.spec_from_file_location("my_plugin", plugin_file)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["my_plugin"] = module
+    try:
+        spec.loader.exec_module(module)
+        original = _fingerprint_source_files([module.MyTarget, module.MyTarget()])
+        assert any(str(plugin_file) in fingerprint for fingerprint in original)
+        assert _fingerprint_source_files([module.MyTarget]) == original
+
+        plugin_file.write_text("class MyTarget:\n    alias = 'changed'\n")
+        assert _fingerprint_source_files([module.MyTarget]) != original
+    finally:
+        del sys.modules["my_plugin"]
+
+
+def test_parse_address_family_cache(tmp_path: Path) -> None:
+    def parse(build_file_content: bytes, target_types: RegisteredTargetTypes) -> AddressFamily:
+        optional_af = run_rule_with_mocks(
+            parse_address_family,
+            rule_args=[
+                AddressFamilyDir("/foo"),
+                Parser(
+                    build_root="",
+                    registered_target_types=target_types,
+                    union_membership=UnionMembership.empty(),
+                    object_aliases=BuildFileAliases(),
+                    ignore_unrecognized_symbols=False,
+                ),
+                BootstrapStatus(in_progress=False),
+                BuildFileOptions(("BUILD",)),
+                BuildFilePreludeSymbols(FrozenDict(), ()),
+                target_types,
+                UnionMembership.empty(),
+                MaybeBuildFileDependencyRulesImplementation(None),
+                SessionValues({CompleteEnvironmentVars: CompleteEnvironmentVars({})}),
+                BuildFileParseCacheKey(cache_dir=str(tmp_path), fingerprint="fingerprint"),
+            ],
+            mock_calls={
+                "pants.engine.intrinsics.get_digest_contents": lambda __implicitly: DigestContents(
+                    [FileContent(path="/foo/BUILD", content=build_file_content)]
+                ),
+                "pants.engine.internals.synthetic_targets.get_synthetic_address_maps": lambda __implicitly: SyntheticAddressMaps(),
+                "pants.engine.internals.build_files.parse_address_family": lambda __implicitly: OptionalAddressFamily(
+                    "/"
+                ),
+                "pants.core.util_rules.env_vars.environment_vars_subset": lambda _1,
+                _2: EnvironmentVars({}),
+            },
+        )
+        assert optional_af.address_family is not None
+        return optional_af.address_family
+
+    build_file_content = b"resource(name='aaa', description='a', tags=['t'])"
+    af = parse(build_file_content, RegisteredTargetTypes({"resource": ResourceTarget}))
+    path, tgt = af.name_to_target_adaptors["aaa"]
+    assert path == "/foo/BUILD"
+    assert tgt.kwargs == FrozenDict({"description": "a", "tags": ("t",)})
+
+    # With no registered `resource` symbol, the BUILD file can only be loaded from the cache.
+    no_target_types = RegisteredTargetTypes({})
+    assert parse(build_file_content, no_target_types).name_to_target_adaptors == {
+        "aaa": (path, tgt)
+    }
+    with pytest.raises(MappingError):
+        parse(b"resource(name='bbb')", no_target_types)
+
+
 def run_prelude_parsing_rule(prelude_content: str) -> BuildFilePreludeSymbols:
     symbols = run_rule_with_mocks(
         evaluate_preludes,
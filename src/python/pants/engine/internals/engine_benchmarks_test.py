@@ -2,10 +2,29 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
 from dataclasses import dataclass
-from random import randrange
+from random import Random, randrange
 
+import pytest
+
+from pants.engine.addresses import Address, Addresses
+from pants.engine.internals.graph import (
+    FilenameTargetSourceBlocksMapping,
+    TargetSourceBlocks,
+    TextBlocksOwnersRequest,
+    find_source_blocks_owners,
+    index_source_blocks,
+)
+from pants.engine.internals.target_adaptor import SourceBlock, SourceBlocks
 from pants.engine.rules import concurrently, rule
-from pants.testutil.rule_runner import QueryRule, RuleRunner
+from pants.engine.target import (
+    CoarsenedTargets,
+    Dependencies,
+    Target,
+    TransitiveTargets,
+    TransitiveTargetsRequest,
+)
+from pants.testutil.rule_runner import QueryRule, RuleRunner, run_rule_with_mocks
+from pants.vcs.hunk import TextBlock, TextBlocks
 
 
 @dataclass(frozen=True)
@@ -45,3 +64,101 @@ def test_bench_wide():
     for _ in range(0, 5):
         rule_runner.scheduler.scheduler.invalidate_all()
         _ = rule_runner.request(Wide, [1000])
+
+
+class MockDependencies(Dependencies):
+    pass
+
+
+class MockTarget(Target):
+    alias = "tgt"
+    core_fields = (MockDependencies,)
+
+
+def _write_wide_fan_in_graph(rule_runner: RuleRunner, num_targets: int, fan_out: int) -> Address:
+    """Write a graph in which every target depends on up to `fan_out` random lower-numbered targets.
+
+    Returns the address of a root which depends on every target in the top layer.
+    """
+    rng = Random(num_targets)
+    per_dir = 100
+    build_files: dict[str, list[str]] = {}
+    for i in range(1, num_targets):
+        deps = sorted({f"d{j // per_dir}:t{j}" for j in (rng.randrange(i) for _ in range(fan_out))})
+        build_files.setdefault(f"d{i // per_dir}/BUILD", []).append(
+            f"tgt(name='t{i}', dependencies={deps!r})"
+        )
+    top_layer = [f"d{j // per_dir}:t{j}" for j in range(max(0, num_targets - per_dir), num_targets)]
+    build_files["root/BUILD"] = [f"tgt(name='root', dependencies={top_layer!r})"]
+    build_files["d0/BUILD"].append("tgt(name='t0')")
+    rule_runner.write_files({path: "\n".join(lines) for path, lines in build_files.items()})
+    return Address("root", target_name="root")
+
+
+@pytest.mark.parametrize("num_targets", [2_500, 5_000])
+def test_bench_transitive_targets(num_targets: int) -> None:
+    """Compare per-target and batched transitive traversal over a graph with wide fan-in.
+
+    The batched traversal should scale linearly with the size of the graph: run with larger values
+    of `num_targets` (e.g. 100_000) to compare locally.
+    """
+    results = {}
+    for batched in (False, True):
+        rule_runner = RuleRunner(
+            rules=[
+                QueryRule(TransitiveTargets, [TransitiveTargetsRequest]),
+                QueryRule(CoarsenedTargets, [Addresses]),
+            ],
+            target_types=[MockTarget],
+            bootstrap_args=[f"--{'' if batched else 'no-'}batched-transitive-traversal"],
+        )
+        root = _write_wide_fan_in_graph(rule_runner, num_targets, fan_out=5)
+        transitive_targets = rule_runner.request(
+            TransitiveTargets, [TransitiveTargetsRequest([root])]
+        )
+        coarsened_targets = rule_runner.request(CoarsenedTargets, [Addresses([root])])
+        results[batched] = (
+            [t.address for t in transitive_targets.closure],
+            [t.address for t in coarsened_targets.closure()],
+        )
+
+    assert results[False] == results[True]
+
+
+@pytest.mark.parametrize("num_targets", [1_000])
+def test_bench_source_blocks_owners(num_targets: int) -> None:
+    """Compare a linear scan of the source blocks of a BUILD file with many targets to the index
+    used by `find_source_blocks_owners`, for a diff which touches many places in the file."""
+    rng = Random(num_targets)
+    build_file = "src/BUILD"
+    # Each target is defined in 5 lines, and some also own a second, detached block of lines.
+    target_blocks = []
+    for i in range(num_targets):
+        blocks = [SourceBlock(start=5 * i + 1, end=5 * i + 6)]
+        if i % 10 == 0:
+            start = 5 * num_targets + i + 1
+            blocks.append(SourceBlock(start=start, end=start + 1))
+        target_blocks.append(
+            TargetSourceBlocks(
+                address=Address("src", target_name=f"t{i}"), source_blocks=SourceBlocks(blocks)
+            )
+        )
+    mapping = FilenameTargetSourceBlocksMapping({build_file: tuple(target_blocks)})
+    text_blocks = TextBlocks(
+        TextBlock(start=rng.randrange(6 * num_targets), count=rng.choice((0, 1, 3)))
+        for _ in range(num_targets)
+    )
+
+    expected = {
+        tb.address
+        for text_block in text_blocks
+        for tb in target_blocks
+        if any(block.is_touched_by(text_block) for block in tb.source_blocks)
+    }
+
+    index = run_rule_with_mocks(index_source_blocks, rule_args=[mapping])
+    owners = run_rule_with_mocks(
+        find_source_blocks_owners,
+        rule_args=[TextBlocksOwnersRequest(build_file, text_blocks), index],
+    )
+    assert set(owners) == expected
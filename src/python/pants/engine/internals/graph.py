@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import dataclasses
+import fnmatch
 import functools
 import itertools
 import json
@@ -108,6 +109,7 @@ from pants.option.bootstrap_options import UnmatchedBuildFileGlobs
 from pants.option.global_options import GlobalOptions
 from pants.util.docutil import bin_name, doc_url
 from pants.util.frozendict import FrozenDict
+from pants.util.interval_index import IntervalIndex
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized
 from pants.util.ordered_set import FrozenOrderedSet, OrderedSet
@@ -639,16 +641,16 @@ async def resolve_target_for_bootstrapping(
     return WrappedTargetForBootstrap(target)
 
 
-@rule(_masked_types=[EnvironmentName])
-async def resolve_targets(
-    targets: UnexpandedTargets,
+async def _expand_target_generators(
+    targets: Iterable[Target],
     target_types_to_generate_requests: TargetTypesToGenerateTargetsRequests,
     local_environment_name: ChosenLocalEnvironmentName,
-) -> Targets:
-    # Replace all generating targets with what they generate. Otherwise, keep them. If a target
-    # generator does not generate any targets, keep the target generator.
-    # TODO: This method does not preserve the order of inputs.
-    expanded_targets: OrderedSet[Target] = OrderedSet()
+) -> dict[Address, tuple[Target, ...]]:
+    """Find the targets generated by each of the target generators in the input.
+
+    The result contains an entry for each target generator, in input order. If a target generator
+    does not generate any targets, it maps to itself.
+    """
     generator_targets = []
     parametrizations_gets = []
     for tgt in targets:
@@ -673,15 +675,30 @@ async def resolve_targets(
                     )
                 )
             )
-        else:
-            expanded_targets.add(tgt)
 
     all_generated_targets = await concurrently(parametrizations_gets)
-    expanded_targets.update(
-        tgt
+    return {
+        generator.address: tuple(parametrizations.generated_or_generator(generator.address))
         for generator, parametrizations in zip(generator_targets, all_generated_targets)
-        for tgt in parametrizations.generated_or_generator(generator.address)
+    }
+
+
+@rule(_masked_types=[EnvironmentName])
+async def resolve_targets(
+    targets: UnexpandedTargets,
+    target_types_to_generate_requests: TargetTypesToGenerateTargetsRequests,
+    local_environment_name: ChosenLocalEnvironmentName,
+) -> Targets:
+    # Replace all generating targets with what they generate. Otherwise, keep them. If a target
+    # generator does not generate any targets, keep the target generator.
+    # TODO: This method does not preserve the order of inputs.
+    generated = await _expand_target_generators(
+        targets, target_types_to_generate_requests, local_environment_name
+    )
+    expanded_targets: OrderedSet[Target] = OrderedSet(
+        tgt for tgt in targets if tgt.address not in generated
     )
+    expanded_targets.update(itertools.chain.from_iterable(generated.values()))
     return Targets(expanded_targets)
 
 
@@ -800,14 +817,21 @@ class _DependencyMapping:
     roots_as_targets: Collection[Target]
 
 
+@dataclass(frozen=True)
+class TransitiveTraversalOptions:
+    batched: bool
+
+
 @rule
-async def transitive_dependency_mapping(request: _DependencyMappingRequest) -> _DependencyMapping:
-    """This uses iteration, rather than recursion, so that we can tolerate dependency cycles.
+async def extract_transitive_traversal_options(
+    global_options: GlobalOptions,
+) -> TransitiveTraversalOptions:
+    return TransitiveTraversalOptions(batched=global_options.batched_transitive_traversal)
 
-    Unlike a traditional BFS algorithm, we batch each round of traversals via `concurrently` for
-    improved performance / concurrency.
-    """
-    roots_as_targets = await resolve_unexpanded_targets(Addresses(request.tt_request.roots))
+
+async def _per_target_transitive_dependency_mapping(
+    request: _DependencyMappingRequest, roots_as_targets: Sequence[Target]
+) -> tuple[dict[Address, tuple[Address, ...]], OrderedSet[Target]]:
     visited: OrderedSet[Target] = OrderedSet()
     queued = FrozenOrderedSet(roots_as_targets)
     dependency_mapping: dict[Address, tuple[Address, ...]] = {}
@@ -850,6 +874,102 @@ async def transitive_dependency_mapping(request: _DependencyMappingRequest) -> _
         )
         visited.update(queued)
 
+    return dependency_mapping, visited
+
+
+async def _batched_transitive_dependency_mapping(
+    request: _DependencyMappingRequest,
+    roots_as_targets: Sequence[Target],
+    target_types_to_generate_requests: TargetTypesToGenerateTargetsRequests,
+    local_environment_name: ChosenLocalEnvironmentName,
+) -> tuple[dict[Address, tuple[Address, ...]], OrderedSet[Target]]:
+    """A level-synchronous traversal which resolves all new dependencies of a round in bulk.
+
+    Each round resolves the dependency addresses of every target in the frontier, and then
+    resolves the targets for all of the addresses which have not been seen before with a single
+    request, rather than resolving the targets of each frontier target's dependencies separately.
+    Targets which have already been traversed are never re-resolved.
+    """
+    visited: OrderedSet[Target] = OrderedSet()
+    dependency_mapping: dict[Address, tuple[Address, ...]] = {}
+    # The unexpanded target for each address seen so far, and for target generators, the targets
+    # that they expand to (if `request.expanded_targets`).
+    unexpanded: dict[Address, Target] = {}
+    generated: dict[Address, tuple[Target, ...]] = {}
+
+    frontier: Sequence[Target] = roots_as_targets
+    while frontier:
+        dependency_addresses = await concurrently(
+            resolve_dependencies(
+                DependenciesRequest(
+                    tgt.get(Dependencies),
+                    should_traverse_deps_predicate=request.tt_request.should_traverse_deps_predicate,
+                ),
+                **implicitly(),
+            )
+            for tgt in frontier
+        )
+
+        new_addresses = FrozenOrderedSet(
+            address
+            for addresses in dependency_addresses
+            for address in addresses
+            if address not in unexpanded
+        )
+        if new_addresses:
+            new_targets = await resolve_unexpanded_targets(Addresses(new_addresses))
+            unexpanded.update(zip(new_addresses, new_targets))
+            if request.expanded_targets:
+                generated.update(
+                    await _expand_target_generators(
+                        new_targets, target_types_to_generate_requests, local_environment_name
+                    )
+                )
+
+        next_frontier: list[Target] = []
+        for tgt, addresses in zip(frontier, dependency_addresses):
+            # NB: This mirrors the order in which `resolve_targets` returns targets, so that the
+            # result is identical to the non-batched traversal.
+            direct_dependencies: OrderedSet[Target] = OrderedSet(
+                unexpanded[a] for a in addresses if a not in generated
+            )
+            direct_dependencies.update(t for a in addresses if a in generated for t in generated[a])
+            dependency_mapping[tgt.address] = tuple(t.address for t in direct_dependencies)
+            for dep in direct_dependencies:
+                if dep in visited:
+                    continue
+                visited.add(dep)
+                if dep.address not in dependency_mapping:
+                    next_frontier.append(dep)
+        frontier = next_frontier
+
+    return dependency_mapping, visited
+
+
+@rule
+async def transitive_dependency_mapping(
+    request: _DependencyMappingRequest,
+    traversal_options: TransitiveTraversalOptions,
+    target_types_to_generate_requests: TargetTypesToGenerateTargetsRequests,
+    local_environment_name: ChosenLocalEnvironmentName,
+) -> _DependencyMapping:
+    """This uses iteration, rather than recursion, so that we can tolerate dependency cycles.
+
+    Unlike a traditional BFS algorithm, we batch each round of traversals via `concurrently` for
+    improved performance / concurrency.
+    """
+    roots_as_targets = await resolve_unexpanded_targets(Addresses(request.tt_request.roots))
+    dependency_mapping: dict[Address, tuple[Address, ...]]
+    visited: OrderedSet[Target]
+    if traversal_options.batched:
+        dependency_mapping, visited = await _batched_transitive_dependency_mapping(
+            request, roots_as_targets, target_types_to_generate_requests, local_environment_name
+        )
+    else:
+        dependency_mapping, visited = await _per_target_transitive_dependency_mapping(
+            request, roots_as_targets
+        )
+
     # NB: We use `roots_as_targets` to get the root addresses, rather than `request.roots`. This
     # is because expanding from the `Addresses` -> `Targets` may have resulted in generated
     # targets being used, so we need to use `roots_as_targets` to have this expansion.
@@ -944,7 +1064,7 @@ async def transitive_targets(
     environment_name = local_environment_name.val
 
     dependency_mapping = await transitive_dependency_mapping(
-        _DependencyMappingRequest(request, True)
+        _DependencyMappingRequest(request, True), **implicitly()
     )
     targets = (*dependency_mapping.roots_as_targets, *dependency_mapping.visited)
 
@@ -1028,7 +1148,8 @@ async def resolve_coarsened_targets(
                 should_traverse_deps_predicate=request.should_traverse_deps_predicate,
             ),
             expanded_targets=request.expanded_targets,
-        )
+        ),
+        **implicitly(),
     )
     addresses_to_targets = {
         t.address: t for t in [*dependency_mapping.visited, *dependency_mapping.roots_as_targets]
@@ -1164,6 +1285,32 @@ async def calc_source_block_mapping(
     )
 
 
+class FilenameSourceBlocksIndex(FrozenDict[str, IntervalIndex[Address]]):
+    """Map file paths to an index of the addresses of the targets owning each source block.
+
+    The source blocks of a file are closed intervals of lines for the purposes of
+    `SourceBlock.is_touched_by`, so that the owners of changed lines are found in logarithmic time
+    in the number of targets defined in the file.
+    """
+
+
+@rule
+async def index_source_blocks(
+    mapping: FilenameTargetSourceBlocksMapping,
+) -> FilenameSourceBlocksIndex:
+    return FilenameSourceBlocksIndex(
+        (
+            filename,
+            IntervalIndex(
+                (source_block.start, source_block.end, target_blocks.address)
+                for target_blocks in file_blocks
+                for source_block in target_blocks.source_blocks
+            ),
+        )
+        for filename, file_blocks in mapping.items()
+    )
+
+
 class FilesWithSourceBlocks(frozenset[str]):
     pass
 
@@ -1209,36 +1356,71 @@ class Owners(FrozenOrderedSet[Address]):
 
 @rule
 def find_source_blocks_owners(
-    request: TextBlocksOwnersRequest, mapping: FilenameTargetSourceBlocksMapping
+    request: TextBlocksOwnersRequest, index: FilenameSourceBlocksIndex
 ) -> Owners:
-    file_blocks = mapping.get(request.filename)
-    if not file_blocks:
+    file_index = index.get(request.filename)
+    if not file_index:
         return Owners()
 
-    owners = set()
-
     # Let's say the rule is called to figure out which targets has changed given the `git diff` output.
-    # Then `request.source_blocks` is populated with source blocks parsed from `git diff` output
-    # and `file_blocks` is holding the list of all source blocks for the given `request.filename`.
-    # In order to get an answer we need to find an intersection for all pairs of blocks and return
-    # the targets they correspond to.
-    #
-    # TODO Use interval tree?
-    for request_block, target_blocks in itertools.product(request.text_blocks, file_blocks):
-        for target_block in target_blocks.source_blocks:
-            if not target_block.is_touched_by(request_block):
-                continue
-            owners.add(target_blocks.address)
-            break  # continue outer loop
+    # Then `request.text_blocks` is populated with text blocks parsed from `git diff` output, and
+    # `file_index` holds all source blocks for the given `request.filename`. We look up the source
+    # blocks which each text block touches, and return the targets they correspond to.
+    owners = set()
+    for text_block in request.text_blocks:
+        # See `SourceBlock.is_touched_by`: an empty block (i.e. a pure deletion in the diff) touches
+        # the lines on either side of it.
+        if text_block.count == 0:
+            start = end = text_block.start + 1
+        else:
+            start, end = text_block.start, text_block.end
+        owners.update(file_index.overlapping(start, end))
 
     return Owners(owners)
 
 
+@dataclass(frozen=True)
+class FileOwnersIndexOptions:
+    enable: bool
+
+
+@rule
+async def extract_file_owners_index_options(
+    global_options: GlobalOptions,
+) -> FileOwnersIndexOptions:
+    return FileOwnersIndexOptions(enable=global_options.file_owners_index)
+
+
+class FileOwnersIndex(FrozenDict[str, tuple[Target, ...]]):
+    """Map each file path to the (expanded) targets whose `sources` include it."""
+
+
+@rule(
+    desc="Index the owners of all source files",
+    level=LogLevel.DEBUG,
+    _masked_types=[EnvironmentName],
+)
+async def index_file_owners(all_targets: AllTargets) -> FileOwnersIndex:
+    targets_with_sources = [tgt for tgt in all_targets if tgt.has_field(SourcesField)]
+    all_sources_paths = await concurrently(
+        resolve_source_paths(SourcesPathsRequest(tgt[SourcesField]), **implicitly())
+        for tgt in targets_with_sources
+    )
+    owners: DefaultDict[str, list[Target]] = defaultdict(list)
+    for tgt, sources_paths in zip(targets_with_sources, all_sources_paths):
+        for path in sources_paths.files:
+            owners[path].append(tgt)
+    return FileOwnersIndex((path, tuple(tgts)) for path, tgts in owners.items())
+
+
 @rule(desc="Find which targets own certain files", _masked_types=[EnvironmentName])
 async def find_owners(
     owners_request: OwnersRequest,
     local_environment_name: ChosenLocalEnvironmentName,
     target_origin_sources_blocks_options: TargetOriginSourcesBlocksOptions,
+    file_owners_index_options: FileOwnersIndexOptions,
+    build_file_options: BuildFileOptions,
+    specs_filter: SpecsFilter,
 ) -> Owners:
     block_owners: tuple[Owners, ...] = (
         await concurrently(
@@ -1254,6 +1436,29 @@ async def find_owners(
 
     live_files = FrozenOrderedSet(sources_paths.files)
     deleted_files = FrozenOrderedSet(s for s in owners_request.sources if s not in live_files)
+
+    result = set()
+    unmatched_sources = set(owners_request.sources)
+    if file_owners_index_options.enable and live_files:
+        # Look up the owners of live files in the index, and fall back to searching ancestor
+        # directories below only for files which the index has no owners for, and for BUILD files
+        # (which may be owned by the targets that they define).
+        file_owners_index = await index_file_owners(**implicitly())
+        unindexed_live_files = []
+        for path in live_files:
+            owning_tgts = file_owners_index.get(path)
+            if not owning_tgts or any(
+                fnmatch.fnmatch(os.path.basename(path), pattern)
+                for pattern in build_file_options.patterns
+            ):
+                unindexed_live_files.append(path)
+                continue
+            for tgt in owning_tgts:
+                if not owners_request.filter_by_global_options or specs_filter.matches(tgt):
+                    unmatched_sources.discard(path)
+                    result.add(tgt.address)
+        live_files = FrozenOrderedSet(unindexed_live_files)
+
     live_dirs = FrozenOrderedSet(os.path.dirname(s) for s in live_files)
     deleted_dirs = FrozenOrderedSet(os.path.dirname(s) for s in deleted_files)
 
@@ -1299,8 +1504,6 @@ async def find_owners(
     )
     live_candidate_tgts, deleted_candidate_tgts = await concurrently(live_get, deleted_get)
 
-    result = set()
-    unmatched_sources = set(owners_request.sources)
     for live in (True, False):
         candidate_tgts: Sequence[Target]
         if live:
@@ -157,8 +157,8 @@ class MockTargetGenerator(TargetFilesGenerator):
     moved_fields = (MockDependencies, Tags, ResolveField)
 
 
-@pytest.fixture
-def transitive_targets_rule_runner() -> RuleRunner:
+@pytest.fixture(params=[False, True], ids=["per_target_traversal", "batched_traversal"])
+def transitive_targets_rule_runner(request) -> RuleRunner:
     return RuleRunner(
         rules=[
             QueryRule(AllTargets, []),
@@ -173,6 +173,8 @@ def transitive_targets_rule_runner() -> RuleRunner:
         # inherent environment so that the positions which do require the environment are
         # highlighted.
         inherent_environment=None,
+        # The batched traversal must produce identical results, so run every test against both.
+        bootstrap_args=[f"--{'' if request.param else 'no-'}batched-transitive-traversal"],
     )
 
 
@@ -827,8 +829,8 @@ def test_invalid_target(transitive_targets_rule_runner: RuleRunner) -> None:
         get_target("t1")
 
 
-@pytest.fixture
-def owners_rule_runner() -> RuleRunner:
+@pytest.fixture(params=[False, True], ids=["ancestor_globs", "file_owners_index"])
+def owners_rule_runner(request) -> RuleRunner:
     return RuleRunner(
         rules=[
             QueryRule(Owners, [OwnersRequest]),
@@ -842,6 +844,8 @@ def owners_rule_runner() -> RuleRunner:
         # inherent environment so that the positions which do require the environment are
         # highlighted.
         inherent_environment=None,
+        # Finding owners using the index must produce identical results.
+        bootstrap_args=[f"--{'' if request.param else 'no-'}file-owners-index"],
     )
 
 
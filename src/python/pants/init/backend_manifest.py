@@ -0,0 +1,306 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import importlib.util
+import os
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from pants.build_graph.build_configuration import BuildConfiguration
+from pants.engine.goal import GoalSubsystem
+from pants.engine.rules import TaskRule
+from pants.engine.unions import UnionMembership, is_union
+from pants.goal.auxiliary_goal import AuxiliaryGoal
+from pants.option.subsystem import Subsystem
+from pants.util.persistent_cache import PersistentCache, fingerprint_strings
+from pants.version import VERSION
+
+_BACKEND_MANIFEST_VERSION = 1
+
+
+def _type_id(typ: type) -> str:
+    return f"{typ.__module__}.{typ.__qualname__}"
+
+
+def _is_pinned_union(union_base: type) -> bool:
+    """Whether members of the given union must always be loaded, independent of the goals run.
+
+    Unions declared by the engine (e.g. target field plugins, target generation, dependency
+    inference and source hydration) are consulted while constructing the build graph, and subsystem
+    plugin options are consulted while parsing options. Neither is visible as an edge of the rule
+    graph.
+    """
+    module = union_base.__module__
+    return module.startswith("pants.engine.") or module == Subsystem.__module__
+
+
+@dataclass(frozen=True)
+class BackendManifest:
+    """What each backend contributes, recorded from a run which loaded all of them.
+
+    The rule graph is recorded at the granularity of types: for each `@rule`, its output type, the
+    types it consumes (as parameters or via calls), and the rules it calls by name.
+    """
+
+    # Backends which must always be loaded, because they define BUILD file symbols, a remote auth
+    # plugin, or members of pinned unions.
+    pinned: frozenset[str]
+    # Backend -> the option scopes of the subsystems and goals which it registers.
+    scopes: Mapping[str, tuple[str, ...]]
+    # Backend -> the goals which it registers.
+    goals: Mapping[str, tuple[str, ...]]
+    auxiliary_goals: frozenset[str]
+    # Target type aliases and BUILD file aliases.
+    symbols: frozenset[str]
+    # Rule name -> (output type, consumed types, called rule names).
+    rules: Mapping[str, tuple[str, tuple[str, ...], tuple[str, ...]]]
+    # Goal name -> the name of its `@goal_rule`.
+    goal_rules: Mapping[str, str]
+    unions: frozenset[str]
+    # (union base, union member, providing backend), for unions which are not pinned.
+    union_rules: tuple[tuple[str, str, str], ...]
+
+    @classmethod
+    def create(
+        cls,
+        backends: Sequence[str],
+        build_configuration: BuildConfiguration,
+        *,
+        pinned: Iterable[str],
+    ) -> BackendManifest:
+        backend_set = set(backends)
+        pinned_backends = set(pinned)
+
+        scopes: dict[str, list[str]] = defaultdict(list)
+        goals: dict[str, list[str]] = defaultdict(list)
+        auxiliary_goals = set()
+        for subsystem, providers in build_configuration.subsystem_to_providers.items():
+            subsystem_scopes = [subsystem.options_scope]
+            if subsystem.deprecated_options_scope:
+                subsystem_scopes.append(subsystem.deprecated_options_scope)
+            is_goal = issubclass(subsystem, GoalSubsystem)
+            if issubclass(subsystem, AuxiliaryGoal):
+                auxiliary_goals.add(subsystem.options_scope)
+            for provider in providers:
+                if provider not in backend_set:
+                    continue
+                scopes[provider].extend(subsystem_scopes)
+                if is_goal:
+                    goals[provider].append(subsystem.options_scope)
+
+        for providers in build_configuration.target_type_to_providers.values():
+            pinned_backends.update(provider for provider in providers if provider in backend_set)
+
+        rules: dict[str, tuple[str, tuple[str, ...], tuple[str, ...]]] = {}
+        goal_rules: dict[str, str] = {}
+        unions: set[str] = set()
+        for rule in build_configuration.rules:
+            if not isinstance(rule, TaskRule):
+                continue
+            consumed_types = {
+                *rule.parameters.values(),
+                *(awaitable.output_type for awaitable in rule.awaitables),
+                *(typ for awaitable in rule.awaitables for typ in awaitable.input_types),
+            }
+            if UnionMembership in consumed_types:
+                # The rule may look up the members of any union that it can name.
+                consumed_types.update(
+                    value
+                    for value in rule.func.__globals__.values()
+                    if isinstance(value, type) and is_union(value)
+                )
+            unions.update(_type_id(typ) for typ in consumed_types if is_union(typ))
+            rules[rule.canonical_name] = (
+                _type_id(rule.output_type),
+                tuple(sorted(_type_id(typ) for typ in consumed_types)),
+                tuple(sorted({aw.rule_id for aw in rule.awaitables if aw.rule_id})),
+            )
+            if getattr(rule.output_type, "__goal__", False):
+                goal_rules[rule.output_type.subsystem_cls.options_scope] = rule.canonical_name
+
+        union_rules = []
+        for union_rule, providers in build_configuration.union_rule_to_providers.items():
+            providers = tuple(provider for provider in providers if provider in backend_set)
+            if _is_pinned_union(union_rule.union_base):
+                pinned_backends.update(providers)
+                continue
+            for provider in providers:
+                union_rules.append(
+                    (_type_id(union_rule.union_base), _type_id(union_rule.union_member), provider)
+                )
+
+        return cls(
+            pinned=frozenset(pinned_backends),
+            scopes={backend: tuple(backend_scopes) for backend, backend_scopes in scopes.items()},
+            goals={backend: tuple(backend_goals) for backend, backend_goals in goals.items()},
+            auxiliary_goals=frozenset(auxiliary_goals),
+            symbols=frozenset(
+                (
+                    *(tgt_type.alias for tgt_type in build_configuration.target_types),
+                    *build_configuration.registered_aliases.objects,
+                    *build_configuration.registered_aliases.context_aware_object_factories,
+                )
+            ),
+            rules=rules,
+            goal_rules=goal_rules,
+            unions=frozenset(unions),
+            union_rules=tuple(union_rules),
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "pinned": sorted(self.pinned),
+            "scopes": self.scopes,
+            "goals": self.goals,
+            "auxiliary_goals": sorted(self.auxiliary_goals),
+            "symbols": sorted(self.symbols),
+            "rules": self.rules,
+            "goal_rules": self.goal_rules,
+            "unions": sorted(self.unions),
+            "union_rules": self.union_rules,
+        }
+
+    @classmethod
+    def from_json(cls, value: Any) -> BackendManifest | None:
+        try:
+            return cls(
+                pinned=frozenset(value["pinned"]),
+                scopes={backend: tuple(scopes) for backend, scopes in value["scopes"].items()},
+                goals={backend: tuple(goals) for backend, goals in value["goals"].items()},
+                auxiliary_goals=frozenset(value["auxiliary_goals"]),
+                symbols=frozenset(value["symbols"]),
+                rules={
+                    name: (output_type, tuple(consumed_types), tuple(calls))
+                    for name, (output_type, consumed_types, calls) in value["rules"].items()
+                },
+                goal_rules=dict(value["goal_rules"]),
+                unions=frozenset(value["unions"]),
+                union_rules=tuple(
+                    (base, member, backend) for base, member, backend in value["union_rules"]
+                ),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+
+    @property
+    def all_goals(self) -> frozenset[str]:
+        return frozenset(goal for goals in self.goals.values() for goal in goals)
+
+    @property
+    def all_scopes(self) -> frozenset[str]:
+        return frozenset(scope for scopes in self.scopes.values() for scope in scopes)
+
+    def required_backends(
+        self, backends: Iterable[str], goals: Iterable[str], scopes: Iterable[str]
+    ) -> frozenset[str]:
+        """Return the subset of the given backends needed to run the given goals.
+
+        :param goals: The goals to run. All of the union members which are transitively reachable
+          from their `@goal_rule`s are loaded.
+        :param scopes: Option scopes which are referenced by the run (e.g. by a flag), whose
+          backends must be loaded for their options to be recognized.
+        """
+        backends = tuple(backends)
+        goals = frozenset(goals)
+        referenced_scopes = goals | frozenset(scopes)
+        required = {
+            backend
+            for backend in backends
+            if backend in self.pinned
+            or not referenced_scopes.isdisjoint(self.scopes.get(backend, ()))
+        }
+
+        rules_by_output_type: dict[str, list[str]] = defaultdict(list)
+        rules_by_consumed_type: dict[str, list[str]] = defaultdict(list)
+        for name, (output_type, consumed_types, _) in self.rules.items():
+            rules_by_output_type[output_type].append(name)
+            for consumed_type in consumed_types:
+                rules_by_consumed_type[consumed_type].append(name)
+        members_by_union: dict[str, list[tuple[str, str]]] = defaultdict(list)
+        for union_base, union_member, provider in self.union_rules:
+            members_by_union[union_base].append((union_member, provider))
+
+        visited_rules: set[str] = set()
+        visited_types: set[str] = set()
+        to_visit = [self.goal_rules[goal] for goal in goals if goal in self.goal_rules]
+        while to_visit:
+            name = to_visit.pop()
+            if name in visited_rules or name not in self.rules:
+                continue
+            visited_rules.add(name)
+            _, consumed_types, calls = self.rules[name]
+            to_visit.extend(calls)
+            for consumed_type in consumed_types:
+                if consumed_type in visited_types:
+                    continue
+                visited_types.add(consumed_type)
+                to_visit.extend(rules_by_output_type[consumed_type])
+                if consumed_type not in self.unions:
+                    continue
+                # The implementations of a union's members are the rules which consume them.
+                for union_member, provider in members_by_union[consumed_type]:
+                    required.add(provider)
+                    to_visit.extend(rules_by_consumed_type[union_member])
+
+        return frozenset(backend for backend in backends if backend in required)
+
+
+def backend_manifest_cache(pants_workdir: str) -> PersistentCache:
+    return PersistentCache(pants_workdir, "backend_manifests", version=_BACKEND_MANIFEST_VERSION)
+
+
+def backend_manifest_key(
+    plugins: Sequence[str], backends: Sequence[str], pythonpath: Sequence[str] = ()
+) -> str:
+    """A key for the manifest of the given plugins and backends.
+
+    Backends which are distributed with Pants are covered by its version. In-repo plugins are
+    covered by the modification times and sizes of all of the sources under the `pythonpath`
+    entries from which they are loaded, so that a change to any module which they might import
+    (e.g. a sibling package shared by several plugins) changes the key. Other backends are covered
+    by the sources of their own packages. Sources are never imported to compute the key.
+    """
+    components = [VERSION, *plugins, "--", *backends, "--"]
+    source_roots = [os.path.abspath(path) for path in pythonpath]
+    for source_root in source_roots:
+        components.append(source_root)
+        components.extend(_source_stats(source_root))
+    components.append("--")
+    for backend in backends:
+        if backend == "pants" or backend.startswith("pants."):
+            continue
+        try:
+            spec = importlib.util.find_spec(backend)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is None or spec.origin is None:
+            components.append(f"{backend}:<missing>")
+            continue
+        package_dir = os.path.dirname(os.path.abspath(spec.origin))
+        if any(
+            os.path.commonpath((package_dir, source_root)) == source_root
+            for source_root in source_roots
+        ):
+            continue
+        components.extend(_source_stats(package_dir))
+    return fingerprint_strings(components)
+
+
+def _source_stats(directory: str) -> list[str]:
+    stats = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file in sorted(files):
+            if not file.endswith(".py"):
+                continue
+            path = os.path.join(root, file)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stats.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+    return stats
@@ -0,0 +1,28 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+import os
+from pathlib import Path
+
+from pants.init.backend_manifest import backend_manifest_key
+
+
+def test_backend_manifest_key_covers_pythonpath(tmp_path: Path) -> None:
+    plugins_dir = tmp_path / "pants-plugins"
+    (plugins_dir / "my_backend").mkdir(parents=True)
+    (plugins_dir / "common").mkdir()
+    (plugins_dir / "my_backend" / "register.py").write_text("from common.util import f\n")
+    (plugins_dir / "common" / "util.py").write_text("def f(): pass\n")
+
+    def key() -> str:
+        return backend_manifest_key([], ["my_backend"], [str(plugins_dir)])
+
+    original = key()
+    assert key() == original
+
+    # A change to a module shared by in-repo plugins changes the key, although it is not part of
+    # the package of any backend.
+    util = plugins_dir / "common" / "util.py"
+    util.write_text("def f(): return 1\n")
+    os.utime(util, ns=(1, 1))
+    assert key() != original
@@ -5,6 +5,7 @@ import importlib
 import importlib.metadata
 import logging
 import traceback
+from collections.abc import Mapping, Sequence
 from importlib.metadata import Distribution
 
 from packaging.requirements import InvalidRequirement, Requirement
@@ -12,8 +13,18 @@ from packaging.utils import NormalizedName, canonicalize_name
 
 from pants.base.exceptions import BackendConfigurationError
 from pants.build_graph.build_configuration import BuildConfiguration
-from pants.goal.builtins import register_builtin_goals
+from pants.engine.unions import UnionMembership
+from pants.goal.builtins import builtin_goals, register_builtin_goals
+from pants.goal.help import NO_GOAL_NAME
+from pants.init.backend_manifest import (
+    BackendManifest,
+    backend_manifest_cache,
+    backend_manifest_key,
+)
 from pants.init.import_util import find_matching_distributions
+from pants.option.alias import CliOptions
+from pants.option.options import Options
+from pants.option.scope import GLOBAL_SCOPE, ScopeInfo
 from pants.util.ordered_set import FrozenOrderedSet
 
 logger = logging.getLogger(__name__)
@@ -49,6 +60,146 @@ def load_backends_and_plugins(
     return bc_builder.create()
 
 
+def load_backends_and_plugins_lazily(
+    plugins: list[str],
+    backends: list[str],
+    bc_builder: BuildConfiguration.Builder,
+    *,
+    args: Sequence[str],
+    env: Mapping[str, str],
+    pants_workdir: str,
+    pythonpath: Sequence[str] = (),
+    allow_pantsrc: bool = True,
+) -> BuildConfiguration:
+    """Load named plugins, and those source backends which are needed to run the goals in `args`.
+
+    Which backends are needed is decided using the `BackendManifest` recorded by a previous run
+    with the same plugins and backends. If there is no such manifest, all backends are loaded and
+    the manifest is recorded.
+
+    :param plugins: plugins to load.
+    :param backends: backends to load, if needed.
+    :param bc_builder: The BuildConfiguration (for adding aliases).
+    :param args: The command line of the run, including the binary name.
+    :param env: The environment of the run.
+    :param pants_workdir: The directory in which to record backend manifests.
+    :param pythonpath: The entries of `[GLOBAL].pythonpath`, from which in-repo plugins are loaded.
+    :param allow_pantsrc: Whether to read config from rcfiles when parsing `args`.
+    """
+    backend_packages = _backend_packages(backends)
+    cache = backend_manifest_cache(pants_workdir)
+    key = backend_manifest_key(plugins, backend_packages, pythonpath)
+    cached = cache.load_json(key)
+    manifest = BackendManifest.from_json(cached) if cached is not None else None
+
+    pinned: list[str] = []
+    if manifest is None:
+        # Record which backends register BUILD file aliases or a remote auth plugin, since that
+        # can't be recovered from the resulting BuildConfiguration.
+        for backend_package in backend_packages:
+            aliases = bc_builder.registered_aliases()
+            remote_auth_plugin = bc_builder._remote_auth_plugin
+            load_backend(bc_builder, backend_package)
+            if (
+                bc_builder.registered_aliases() != aliases
+                or bc_builder._remote_auth_plugin is not remote_auth_plugin
+            ):
+                pinned.append(backend_package)
+    else:
+        required = _required_backends(manifest, backend_packages, args, env, allow_pantsrc)
+        for backend_package in backend_packages:
+            if required is None or backend_package in required:
+                load_backend(bc_builder, backend_package)
+            else:
+                bc_builder.register_deferred_backend(
+                    backend_package, manifest.scopes.get(backend_package, ())
+                )
+
+    load_plugins(bc_builder, plugins)
+    if not bc_builder._pants_ng:
+        register_builtin_goals(bc_builder)
+    build_configuration = bc_builder.create()
+    if manifest is None:
+        manifest = BackendManifest.create(backend_packages, build_configuration, pinned=pinned)
+        cache.store_json(key, manifest.to_json())
+    return build_configuration
+
+
+# Builtin goals which don't require any particular backend (beyond those required by the goals
+# they are given as arguments, in the case of `help`).
+_HELP_GOALS = frozenset({"help", "help-advanced"})
+_BACKEND_INDEPENDENT_BUILTIN_GOALS = frozenset({NO_GOAL_NAME, "version", *_HELP_GOALS})
+
+
+def _required_backends(
+    manifest: BackendManifest,
+    backend_packages: Sequence[str],
+    args: Sequence[str],
+    env: Mapping[str, str],
+    allow_pantsrc: bool,
+) -> frozenset[str] | None:
+    """Return the backends which are needed to run the goals in `args`, or None for all of them."""
+    all_goals = manifest.all_goals
+    all_scopes = manifest.all_scopes
+    scope_infos = {
+        scope: ScopeInfo(
+            scope, is_goal=scope in all_goals, is_auxiliary=scope in manifest.auxiliary_goals
+        )
+        for scope in all_scopes
+    }
+    for scope_info in (
+        ScopeInfo(GLOBAL_SCOPE),
+        CliOptions.get_scope_info(),
+        *(goal.get_scope_info() for goal in builtin_goals()),
+    ):
+        scope_infos[scope_info.scope] = scope_info
+    try:
+        # NB: This only determines the goals and flags of the run: options are validated once all
+        # needed backends have been loaded.
+        options = Options.create(
+            args=args,
+            env=env,
+            config_sources=None,
+            known_scope_infos=tuple(scope_infos.values()),
+            allow_unknown_options=True,
+            allow_pantsrc=allow_pantsrc,
+        )
+        CliOptions.register_options_on_scope(options, UnionMembership.empty())
+        aliases = options.for_scope("cli").alias
+    except Exception as e:
+        logger.debug(f"Loading all backends, since the command line could not be parsed: {e!r}")
+        return None
+
+    builtin_goal = options.builtin_or_auxiliary_goal
+    if builtin_goal is not None and builtin_goal not in _BACKEND_INDEPENDENT_BUILTIN_GOALS:
+        # E.g. `help-all`, an auxiliary goal, or an unknown goal (for which we suggest goals).
+        return None
+    referenced_scopes = set(options.goals)
+    if builtin_goal in _HELP_GOALS:
+        if options.specs:
+            return None
+        for thing in options.unknown_goals:
+            if thing in all_scopes:
+                referenced_scopes.add(thing)
+            elif thing not in manifest.symbols:
+                # E.g. `help goals`, which lists everything.
+                return None
+
+    # Flags may be given on the command line, or via a CLI alias.
+    words = list(args[1 : args.index("--")] if "--" in args else args[1:])
+    for alias in aliases.values():
+        words.extend(alias.split())
+    for word in words:
+        if not word.startswith("--"):
+            continue
+        flag = word[2:].partition("=")[0].removeprefix("no-")
+        referenced_scopes.update(
+            scope for scope in all_scopes if flag.startswith(f"{scope}-")
+        )
+
+    return manifest.required_backends(backend_packages, options.goals, referenced_scopes)
+
+
 def load_plugins(
     build_configuration: BuildConfiguration.Builder,
     plugins: list[str],
@@ -136,12 +287,15 @@ def load_build_configuration_from_source(
     :raises: :class:``pants.base.exceptions.BuildConfigurationError`` if there is a problem loading
       the build configuration.
     """
-    # NB: Backends added here must be explicit dependencies of this module.
-    backend_packages = FrozenOrderedSet(["pants.core", "pants.backend.project_info", *backends])
-    for backend_package in backend_packages:
+    for backend_package in _backend_packages(backends):
         load_backend(build_configuration, backend_package)
 
 
+def _backend_packages(backends: list[str]) -> FrozenOrderedSet[str]:
+    # NB: Backends added here must be explicit dependencies of this module.
+    return FrozenOrderedSet(["pants.core", "pants.backend.project_info", *backends])
+
+
 def load_backend(build_configuration: BuildConfiguration.Builder, backend_package: str) -> None:
     """Installs the given backend package into the build configuration.
 
@@ -16,6 +16,9 @@ from typing import Any
 from pants.base.exceptions import BuildConfigurationError
 from pants.build_graph.build_configuration import BuildConfiguration
 from pants.build_graph.build_file_aliases import BuildFileAliases
+from pants.core.goals import lint_goal
+from pants.core.goals.lint import LintFilesRequest, LintResult
+from pants.core.util_rules.partitions import Partitions
 from pants.engine.rules import rule
 from pants.engine.target import COMMON_TARGET_FIELDS, Target
 from pants.init.extension_loader import (
@@ -23,9 +26,12 @@ from pants.init.extension_loader import (
     PluginNotFound,
     load_backend,
     load_backends_and_plugins,
+    load_backends_and_plugins_lazily,
     load_plugins,
 )
+from pants.option.option_types import SkipOption
 from pants.option.subsystem import Subsystem
+from pants.util.contextutil import temporary_dir
 from pants.util.frozendict import FrozenDict
 from pants.util.memo import memoized_method
 from pants.util.ordered_set import FrozenOrderedSet
@@ -112,6 +118,25 @@ class PluginProduct:
     pass
 
 
+class DummyLinterSubsystem(Subsystem):
+    options_scope = "dummy-linter"
+    skip = SkipOption("lint")
+
+
+class DummyLintRequest(LintFilesRequest):
+    tool_subsystem = DummyLinterSubsystem
+
+
+@rule
+async def partition_dummy_lint(request: DummyLintRequest.PartitionRequest) -> Partitions:
+    return Partitions()
+
+
+@rule
+async def dummy_lint(request: DummyLintRequest.Batch) -> LintResult:
+    return LintResult(0, "", "", "dummy-linter")
+
+
 @rule
 async def example_plugin_rule(root_type: RootType) -> PluginProduct:
     return PluginProduct()
@@ -365,3 +390,77 @@ class LoaderTest(unittest.TestCase):
             # the plugin will override the alias registered by the backend
             registered_aliases = build_configuration.registered_aliases
             self.assertEqual(DummyObject2, registered_aliases.objects["override-alias"])
+
+    def test_lazy_backend_loading(self):
+        def backend_rules():
+            return [example_rule, *DummySubsystem.rules()]
+
+        with (
+            temporary_dir() as workdir,
+            self.create_register(target_types=lambda: [DummyTarget]) as target_backend,
+            self.create_register(rules=backend_rules) as rules_backend,
+        ):
+            backends = [target_backend, rules_backend]
+
+            def load(*args: str) -> BuildConfiguration:
+                return load_backends_and_plugins_lazily(
+                    [],
+                    backends,
+                    BuildConfiguration.Builder(),
+                    args=("pants", *args),
+                    env={},
+                    pants_workdir=workdir,
+                    allow_pantsrc=False,
+                )
+
+            # Without a manifest, all backends are loaded (and the manifest is recorded).
+            build_configuration = load("list")
+            assert example_rule.rule in build_configuration.rules
+            assert build_configuration.deferred_scopes == ()
+
+            # The backend which only contributes rules is not needed by `list`.
+            build_configuration = load("list")
+            assert DummyTarget in build_configuration.target_types
+            assert example_rule.rule not in build_configuration.rules
+            assert build_configuration.deferred_scopes == ("dummy-subsystem",)
+
+            # Unless one of its options is set.
+            build_configuration = load("--dummy-subsystem-foo=bar", "list")
+            assert example_rule.rule in build_configuration.rules
+            assert build_configuration.deferred_scopes == ()
+
+    def test_lazy_backend_loading_of_union_members(self):
+        def linter_rules():
+            return [partition_dummy_lint, dummy_lint, *DummyLintRequest.rules()]
+
+        with (
+            temporary_dir() as workdir,
+            self.create_register(rules=lint_goal.rules) as lint_backend,
+            self.create_register(rules=linter_rules) as linter_backend,
+        ):
+            backends = [lint_backend, linter_backend]
+
+            def load(*args: str) -> BuildConfiguration:
+                return load_backends_and_plugins_lazily(
+                    [],
+                    backends,
+                    BuildConfiguration.Builder(),
+                    args=("pants", *args),
+                    env={},
+                    pants_workdir=workdir,
+                    allow_pantsrc=False,
+                )
+
+            # Record the manifest.
+            load("list")
+
+            # The linter is a member of a union which is reachable from the `lint` goal, so its
+            # backend is loaded for `lint`, although none of its options are set.
+            build_configuration = load("lint")
+            assert dummy_lint.rule in build_configuration.rules
+            assert build_configuration.deferred_scopes == ()
+
+            # But not for a goal which does not reach the union.
+            build_configuration = load("list")
+            assert dummy_lint.rule not in build_configuration.rules
+            assert "dummy-linter" in build_configuration.deferred_scopes
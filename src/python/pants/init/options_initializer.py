@@ -20,6 +20,7 @@ from pants.init.bootstrap_scheduler import BootstrapScheduler
 from pants.init.engine_initializer import EngineInitializer
 from pants.init.extension_loader import (
     load_backends_and_plugins,
+    load_backends_and_plugins_lazily,
     load_build_configuration_from_source,
 )
 from pants.init.plugin_resolver import PluginResolver
@@ -57,10 +58,26 @@ def _initialize_build_configuration(
     plugin_resolver.resolve(options_bootstrapper, env, backends_requirements)
 
     # Load plugins and backends.
+    bc_builder = BuildConfiguration.Builder(_pants_ng=bootstrap_options.pants_ng)
+    # NB: pantsd reuses the BuildConfiguration of one run for later runs of other goals, so it
+    # must load all backends.
+    if (
+        bootstrap_options.lazy_backend_loading
+        and not bootstrap_options.pantsd
+        and not bootstrap_options.pants_ng
+    ):
+        return load_backends_and_plugins_lazily(
+            bootstrap_options.plugins,
+            bootstrap_options.backend_packages,
+            bc_builder,
+            args=options_bootstrapper.args,
+            env=options_bootstrapper.env,
+            pants_workdir=bootstrap_options.pants_workdir,
+            pythonpath=bootstrap_options.pythonpath,
+            allow_pantsrc=options_bootstrapper.allow_pantsrc,
+        )
     return load_backends_and_plugins(
-        bootstrap_options.plugins,
-        bootstrap_options.backend_packages,
-        BuildConfiguration.Builder(_pants_ng=bootstrap_options.pants_ng),
+        bootstrap_options.plugins, bootstrap_options.backend_packages, bc_builder
     )
 
 
@@ -0,0 +1,145 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""Analysis of many JVM sources with one parser process per batch of files.
+
+The JVM source parsers used for dependency inference accept any number of `(output, source)` path
+pairs as arguments, and write one JSON analysis per source file. Files are partitioned into batches
+stably (see `partition_sequentially`), so that after a change to a few files, the processes for the
+other batches are hits in the process cache.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from pants.core.util_rules.source_files import SourceFiles
+from pants.engine.fs import CreateDigest, Digest, FileEntry
+from pants.engine.internals.selectors import concurrently
+from pants.engine.intrinsics import (
+    create_digest,
+    execute_process,
+    get_digest_contents,
+    get_digest_entries,
+)
+from pants.engine.process import (
+    FallibleProcessResult,
+    ProductDescription,
+    fallible_to_exec_result_or_raise,
+)
+from pants.engine.rules import implicitly
+from pants.jvm.jdk_rules import InternalJdk, JvmProcess
+from pants.util.collections import partition_sequentially
+from pants.util.frozendict import FrozenDict
+from pants.util.logging import LogLevel
+from pants.util.strutil import pluralize
+
+logger = logging.getLogger(__name__)
+
+_SOURCE_PREFIX = "__source_to_analyze"
+
+
+@dataclass(frozen=True)
+class JvmSourceParser:
+    """How to invoke a JVM source parser for a batch of files.
+
+    The parser is invoked as `<main_class> <*leading_args> [<output> <source>]...`.
+    """
+
+    name: str
+    jdk: InternalJdk
+    classpath_entries: tuple[str, ...]
+    extra_immutable_input_digests: FrozenDict[str, Digest]
+    main_class: str
+    leading_args: tuple[str, ...] = ()
+
+
+def partition_into_batches(items: Sequence[FileEntry], batch_size: int) -> list[list[FileEntry]]:
+    """Stably split the items into batches of at most `batch_size` (or one batch if it is not
+    positive)."""
+    if batch_size <= 0:
+        return [list(items)] if items else []
+    return list(
+        partition_sequentially(
+            items,
+            key=lambda entry: entry.path,
+            size_target=max(1, batch_size // 2),
+            size_max=batch_size,
+        )
+    )
+
+
+async def analyze_sources_in_batches(
+    source_files: SourceFiles, parser: JvmSourceParser, *, batch_size: int
+) -> dict[str, Any]:
+    """Return the JSON analysis of each of the given source files, by path."""
+    entries = [
+        entry
+        for entry in await get_digest_entries(source_files.snapshot.digest)
+        if isinstance(entry, FileEntry)
+    ]
+    batches = partition_into_batches(entries, batch_size)
+    logger.debug(
+        f"Analyzing {pluralize(len(entries), 'file')} in {pluralize(len(batches), 'batch')} "
+        f"with {parser.name}."
+    )
+    batch_analyses = await concurrently(_analyze_batch(batch, parser) for batch in batches)
+    return {
+        path: analysis
+        for analyses_by_path in batch_analyses
+        for path, analysis in analyses_by_path.items()
+    }
+
+
+async def _analyze_batch(batch: Sequence[FileEntry], parser: JvmSourceParser) -> Mapping[str, Any]:
+    input_digest = await create_digest(
+        CreateDigest(
+            FileEntry(os.path.join(_SOURCE_PREFIX, entry.path), entry.file_digest)
+            for entry in batch
+        )
+    )
+    output_paths = tuple(f"__source_analysis_{i}.json" for i in range(len(batch)))
+    process_result = await execute_process(
+        **implicitly(
+            JvmProcess(
+                jdk=parser.jdk,
+                classpath_entries=parser.classpath_entries,
+                argv=[
+                    parser.main_class,
+                    *parser.leading_args,
+                    *(
+                        arg
+                        for output_path, entry in zip(output_paths, batch)
+                        for arg in (output_path, os.path.join(_SOURCE_PREFIX, entry.path))
+                    ),
+                ],
+                input_digest=input_digest,
+                extra_immutable_input_digests=parser.extra_immutable_input_digests,
+                output_files=output_paths,
+                extra_nailgun_keys=parser.extra_immutable_input_digests,
+                description=(
+                    f"Analyzing {batch[0].path}"
+                    if len(batch) == 1
+                    else f"Analyzing {pluralize(len(batch), 'source file')} with {parser.name}"
+                ),
+                level=LogLevel.DEBUG,
+            )
+        )
+    )
+    description = ProductDescription(f"Source dependency analysis with {parser.name} failed.")
+    result = await fallible_to_exec_result_or_raise(
+        **implicitly({process_result: FallibleProcessResult, description: ProductDescription})
+    )
+    contents = {
+        file_content.path: file_content.content
+        for file_content in await get_digest_contents(result.output_digest)
+    }
+    return {
+        entry.path: json.loads(contents[output_path])
+        for output_path, entry in zip(output_paths, batch)
+    }
@@ -835,6 +835,26 @@ class BootstrapOptions:
         default=False,
         help="Re-resolve plugins, even if previously resolved.",
     )
+    lazy_backend_loading = BoolOption(
+        advanced=True,
+        default=False,
+        help=softwrap(
+            """
+            Only load the `backend_packages` which are needed by the goals of a run.
+
+            Loading every backend (importing its `register.py` and all of its rule modules) is a
+            significant part of the startup time of a run without `pantsd`. When this option is
+            set, Pants records a manifest of the goals, option scopes, target types and unions
+            contributed by each backend under the `pants_workdir`, keyed by the set of
+            backends and plugins. Later runs use the manifest to skip importing backends which
+            neither define BUILD file symbols nor contribute to the requested goals, e.g. most
+            linters and formatters for `pants list`.
+
+            Config sections for skipped backends are not validated. This option has no effect
+            when `pantsd` is enabled, since the daemon loads all backends once.
+            """
+        ),
+    )
     level = LogLevelOption()
     show_log_target = BoolOption(
         default=False,
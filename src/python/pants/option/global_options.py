@@ -173,6 +173,54 @@ class GlobalOptions(BootstrapOptions, Subsystem):
         help="Enable fine grained target analysis based on line numbers.",
         advanced=True,
     )
+    batched_transitive_traversal = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            When computing transitive dependencies (e.g. for `TransitiveTargets` and
+            `CoarsenedTargets`), resolve the targets of all newly discovered dependencies in each
+            round of the traversal with a single bulk request, and never re-resolve targets which
+            have already been visited.
+
+            This reduces the number of rule invocations and intermediate sets needed to traverse
+            deep dependency graphs with wide fan-in. The results are identical either way.
+            """
+        ),
+        advanced=True,
+    )
+    file_owners_index = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            When finding the targets which own files (e.g. for `--changed-since` and for file
+            arguments), look up each file in an index of the sources of all targets, rather than
+            matching the `sources` of every target in each of the file's ancestor directories
+            against every file.
+
+            The index is built once per session (and kept in memory by `pantsd` until BUILD files
+            or sources change), so this is most useful when finding the owners of large numbers of
+            files.
+            """
+        ),
+        advanced=True,
+    )
+    build_file_parse_cache = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            Persist the targets, `__defaults__` and dependency rules evaluated from the BUILD files
+            in each directory under `pants_workdir`, and reuse them on later runs (e.g. after
+            restarting `pantsd`) rather than evaluating BUILD files that are unchanged.
+
+            Cache entries are keyed by the content of the BUILD files, the BUILD files of their
+            parent directories, the BUILD file prelude files, the relevant options, the values of
+            any environment variables read via `env()`, the set of registered BUILD file symbols
+            and target fields, and the content of the modules which define them (e.g. in an
+            in-repo plugin).
+            """
+        ),
+        advanced=True,
+    )
 
     loop = BoolOption(default=False, help="Run goals continuously as file changes are detected.")
     loop_max = IntOption(
@@ -18,7 +18,7 @@ from pants.engine.fs import PathGlobs
 from pants.engine.intrinsics import path_globs_to_paths
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import Target
-from pants.option.option_types import StrListOption
+from pants.option.option_types import BoolOption, StrListOption
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
@@ -146,6 +146,22 @@ class SourceRootConfig(Subsystem):
         advanced=True,
         metavar="filename",
     )
+    root_index = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, find all marker files (see `marker_filenames`) with a single glob over the
+            repository, and answer every source root request from an in-memory index of the
+            resulting directories, rather than recursively checking each ancestor directory of the
+            requested paths for marker files.
+
+            This is faster when many source roots are requested in a repository with deep
+            directory trees, but requires a glob over the whole repository even when only a few
+            source roots are needed.
+            """
+        ),
+        advanced=True,
+    )
 
     @memoized_method
     def get_pattern_matcher(self) -> SourceRootPatternMatcher:
@@ -230,13 +246,84 @@ class OptionalSourceRootsResult:
     path_to_optional_root: FrozenDict[PurePath, OptionalSourceRoot]
 
 
+def _validate_marker_filenames(marker_filenames: Iterable[str]) -> None:
+    for marker_filename in marker_filenames:
+        if (
+            os.path.basename(marker_filename) != marker_filename
+            or "*" in marker_filename
+            or "!" in marker_filename
+        ):
+            raise InvalidMarkerFileError(f"Marker filename must be a base name: {marker_filename}")
+
+
+@dataclass(frozen=True)
+class SourceRootIndex:
+    """An index of the directories that contain a marker file, used to find source roots without
+    consulting the filesystem once per directory.
+
+    See `[source].root_index`.
+    """
+
+    pattern_matcher: SourceRootPatternMatcher
+    marker_dirs: frozenset[str]
+
+    def find_roots(self, paths: Iterable[PurePath]) -> dict[PurePath, OptionalSourceRoot]:
+        """Find the source root of each of the given paths.
+
+        The result for each directory visited while walking up from a path is memoized, so that
+        paths which share ancestors are resolved in time proportional to the number of distinct
+        directories involved.
+        """
+        memo: dict[PurePath, OptionalSourceRoot] = {}
+
+        def find_root(path: PurePath) -> OptionalSourceRoot:
+            unresolved = []
+            result = OptionalSourceRoot(None)
+            while True:
+                if path in memo:
+                    result = memo[path]
+                    break
+                unresolved.append(path)
+                if (
+                    self.pattern_matcher.matches_root_patterns(path)
+                    or str(path) in self.marker_dirs
+                ):
+                    result = OptionalSourceRoot(SourceRoot(str(path)))
+                    break
+                if str(path) == ".":
+                    break
+                path = path.parent
+            for p in unresolved:
+                memo[p] = result
+            return result
+
+        return {path: find_root(path) for path in paths}
+
+
+@rule(desc="Index source roots", level=LogLevel.DEBUG)
+async def index_source_roots(source_root_config: SourceRootConfig) -> SourceRootIndex:
+    marker_filenames = source_root_config.marker_filenames
+    _validate_marker_filenames(marker_filenames)
+    marker_dirs: frozenset[str] = frozenset()
+    if marker_filenames:
+        paths = await path_globs_to_paths(
+            PathGlobs([f"**/{marker_filename}" for marker_filename in marker_filenames])
+        )
+        marker_dirs = frozenset(str(PurePath(f).parent) for f in paths.files)
+    return SourceRootIndex(source_root_config.get_pattern_matcher(), marker_dirs)
+
+
 @rule
 async def get_optional_source_root(
     source_root_request: SourceRootRequest, source_root_config: SourceRootConfig
 ) -> OptionalSourceRoot:
     """Rule to request a SourceRoot that may not exist."""
-    pattern_matcher = source_root_config.get_pattern_matcher()
     path = source_root_request.path
+    if source_root_config.root_index:
+        index = await index_source_roots(source_root_config)
+        return index.find_roots([path])[path]
+
+    pattern_matcher = source_root_config.get_pattern_matcher()
 
     # Check if the requested path itself is a source root.
 
@@ -247,15 +334,7 @@ async def get_optional_source_root(
     # B) Does it contain a marker file?
     marker_filenames = source_root_config.marker_filenames
     if marker_filenames:
-        for marker_filename in marker_filenames:
-            if (
-                os.path.basename(marker_filename) != marker_filename
-                or "*" in marker_filename
-                or "!" in marker_filename
-            ):
-                raise InvalidMarkerFileError(
-                    f"Marker filename must be a base name: {marker_filename}"
-                )
+        _validate_marker_filenames(marker_filenames)
         paths = await path_globs_to_paths(PathGlobs([str(path / mf) for mf in marker_filenames]))
         if len(paths.files) > 0:
             return OptionalSourceRoot(SourceRoot(str(path)))
@@ -270,9 +349,24 @@ async def get_optional_source_root(
 
 @rule
 async def get_optional_source_roots(
-    source_roots_request: SourceRootsRequest,
+    source_roots_request: SourceRootsRequest, source_root_config: SourceRootConfig
 ) -> OptionalSourceRootsResult:
     """Rule to request source roots that may not exist."""
+    if source_root_config.root_index:
+        index = await index_source_roots(source_root_config)
+        # A file cannot be a source root, so find the root of its parent.
+        indexed_roots = index.find_roots(
+            {*source_roots_request.dirs, *(f.parent for f in source_roots_request.files)}
+        )
+        return OptionalSourceRootsResult(
+            path_to_optional_root=FrozenDict(
+                {
+                    **{d: indexed_roots[d] for d in source_roots_request.dirs},
+                    **{f: indexed_roots[f.parent] for f in source_roots_request.files},
+                }
+            )
+        )
+
     # A file cannot be a source root, so request for its parent.
     # In the typical case, where we have multiple files with the same parent, this can
     # dramatically cut down on the number of engine requests.
@@ -303,7 +397,7 @@ async def get_source_roots(source_roots_request: SourceRootsRequest) -> SourceRo
     That way callers don't have to unpack OptionalSourceRoots if they know they expect a SourceRoot
     to exist and are willing to error if it doesn't.
     """
-    osrr = await get_optional_source_roots(source_roots_request)
+    osrr = await get_optional_source_roots(source_roots_request, **implicitly())
     path_to_root = {}
     for path, osr in osrr.path_to_optional_root.items():
         if osr.source_root is None:
@@ -11,6 +11,7 @@ from pants.engine.fs import PathGlobs, Paths
 from pants.engine.rules import QueryRule
 from pants.source.source_root import (
     OptionalSourceRoot,
+    OptionalSourceRootsResult,
     SourceRoot,
     SourceRootConfig,
     SourceRootRequest,
@@ -18,6 +19,7 @@ from pants.source.source_root import (
     SourceRootsResult,
     all_roots,
     get_optional_source_root,
+    index_source_roots,
 )
 from pants.source.source_root import rules as source_root_rules
 from pants.testutil.option_util import create_subsystem
@@ -55,7 +57,25 @@ def _find_root(
             },
         )
 
-    source_root = _do_find_root(SourceRootRequest(PurePath(path))).source_root
+    def _mock_bulk_fs_check(pathglobs: PathGlobs) -> Paths:
+        marker_files = tuple(
+            f
+            for f in (existing_marker_files or [])
+            if f"**/{os.path.basename(f)}" in pathglobs.globs
+        )
+        return Paths(files=marker_files, dirs=())
+
+    request = SourceRootRequest(PurePath(path))
+    source_root = _do_find_root(request).source_root
+
+    # The index must agree with the recursive lookup.
+    index = run_rule_with_mocks(
+        index_source_roots,
+        rule_args=[source_root_config],
+        mock_calls={"pants.engine.intrinsics.path_globs_to_paths": _mock_bulk_fs_check},
+    )
+    assert index.find_roots([request.path])[request.path].source_root == source_root
+
     return None if source_root is None else source_root.path
 
 
@@ -290,6 +310,50 @@ def test_source_roots_request() -> None:
     } == dict(res.path_to_root)
 
 
+@pytest.mark.parametrize("root_index", [False, True])
+def test_source_roots_request_with_marker_files(root_index: bool) -> None:
+    rule_runner = RuleRunner(
+        rules=[
+            *source_root_rules(),
+            QueryRule(OptionalSourceRootsResult, (SourceRootsRequest,)),
+        ]
+    )
+    rule_runner.write_files(
+        {
+            "SOURCE_ROOT": "",
+            "project1/SOURCE_ROOT": "",
+            "project1/foo/bar.py": "",
+            "project1/src/python/foo/bar.py": "",
+            "project2/baz/qux.py": "",
+        }
+    )
+    rule_runner.set_options(
+        [
+            "--source-root-patterns=['src/python']",
+            "--source-marker-filenames=['SOURCE_ROOT']",
+            f"--source-root-index={root_index}",
+        ]
+    )
+    req = SourceRootsRequest(
+        files=(
+            PurePath("project1/foo/bar.py"),
+            PurePath("project1/src/python/foo/bar.py"),
+            PurePath("project2/baz/qux.py"),
+        ),
+        dirs=(PurePath("project1/foo"), PurePath("project3")),
+    )
+    res = rule_runner.request(OptionalSourceRootsResult, [req])
+    assert {
+        PurePath("project1/foo/bar.py"): OptionalSourceRoot(SourceRoot("project1")),
+        PurePath("project1/src/python/foo/bar.py"): OptionalSourceRoot(
+            SourceRoot("project1/src/python")
+        ),
+        PurePath("project2/baz/qux.py"): OptionalSourceRoot(SourceRoot(".")),
+        PurePath("project1/foo"): OptionalSourceRoot(SourceRoot("project1")),
+        PurePath("project3"): OptionalSourceRoot(SourceRoot(".")),
+    } == dict(res.path_to_optional_root)
+
+
 def test_root_to_paths() -> None:
     res = SourceRootsResult(
         FrozenDict(
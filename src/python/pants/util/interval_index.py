@@ -0,0 +1,84 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    """An immutable index of closed integer intervals, each associated with a value.
+
+    Finding the values of the intervals which overlap a query interval takes O(log n + k) time for
+    n indexed intervals and k results.
+
+    The intervals are sorted by their start, and the sorted array is treated as an implicit
+    balanced binary search tree: the root of the subtree spanning `[lo, hi)` is at the midpoint of
+    the span, and each root records the greatest end of any interval in its subtree, which allows
+    whole subtrees to be skipped.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[int, int, T]]) -> None:
+        entries = sorted(intervals, key=lambda interval: (interval[0], interval[1]))
+        self._starts = tuple(start for start, _, _ in entries)
+        self._ends = tuple(end for _, end, _ in entries)
+        self._values = tuple(value for _, _, value in entries)
+        max_ends = [0] * len(entries)
+        self._compute_max_ends(max_ends, 0, len(entries))
+        self._max_ends = tuple(max_ends)
+
+    def _compute_max_ends(self, max_ends: list[int], lo: int, hi: int) -> int | None:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        max_end = self._ends[mid]
+        for child_max_end in (
+            self._compute_max_ends(max_ends, lo, mid),
+            self._compute_max_ends(max_ends, mid + 1, hi),
+        ):
+            if child_max_end is not None and child_max_end > max_end:
+                max_end = child_max_end
+        max_ends[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: int, end: int) -> Iterator[T]:
+        """Yield the values of the intervals `[s, e]` where `s <= end` and `e >= start`."""
+        spans = [(0, len(self._starts))]
+        while spans:
+            lo, hi = spans.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_ends[mid] < start:
+                # No interval in this subtree ends late enough.
+                continue
+            spans.append((lo, mid))
+            if self._starts[mid] <= end:
+                if self._ends[mid] >= start:
+                    yield self._values[mid]
+                # Intervals to the right start no earlier, so may still overlap.
+                spans.append((mid + 1, hi))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int, T]]:
+        return iter(zip(self._starts, self._ends, self._values))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalIndex):
+            return NotImplemented
+        return (self._starts, self._ends, self._values) == (
+            other._starts,
+            other._ends,
+            other._values,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._starts, self._ends, self._values))
+
+    def __repr__(self) -> str:
+        return f"IntervalIndex({list(self)!r})"
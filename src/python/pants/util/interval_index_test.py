@@ -0,0 +1,45 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from random import Random
+
+from pants.util.interval_index import IntervalIndex
+
+
+def test_overlapping() -> None:
+    index = IntervalIndex([(1, 3, "a"), (5, 5, "b"), (2, 10, "c"), (12, 20, "d")])
+    assert set(index.overlapping(4, 4)) == {"c"}
+    assert set(index.overlapping(3, 5)) == {"a", "b", "c"}
+    # Intervals are closed, so touching endpoints overlap.
+    assert set(index.overlapping(10, 12)) == {"c", "d"}
+    assert set(index.overlapping(11, 11)) == set()
+    assert set(index.overlapping(21, 30)) == set()
+    assert set(index.overlapping(0, 100)) == {"a", "b", "c", "d"}
+
+
+def test_empty() -> None:
+    index: IntervalIndex[str] = IntervalIndex([])
+    assert len(index) == 0
+    assert list(index.overlapping(0, 100)) == []
+
+
+def test_equality() -> None:
+    intervals = [(1, 3, "a"), (2, 10, "c")]
+    assert IntervalIndex(intervals) == IntervalIndex(reversed(intervals))
+    assert hash(IntervalIndex(intervals)) == hash(IntervalIndex(reversed(intervals)))
+    assert IntervalIndex(intervals) != IntervalIndex(intervals[:1])
+
+
+def test_matches_linear_scan() -> None:
+    rng = Random(0)
+    for _ in range(100):
+        intervals = []
+        for i in range(rng.randrange(50)):
+            start = rng.randrange(100)
+            intervals.append((start, start + rng.randrange(10), i))
+        index = IntervalIndex(intervals)
+        for _ in range(20):
+            start = rng.randrange(110)
+            end = start + rng.randrange(5)
+            expected = sorted(v for s, e, v in intervals if s <= end and e >= start)
+            assert sorted(index.overlapping(start, end)) == expected
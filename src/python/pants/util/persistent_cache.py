@@ -0,0 +1,157 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, ClassVar
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint_strings(values: Iterable[str]) -> str:
+    """Return a stable hex fingerprint of the given strings, in the order given."""
+    hasher = hashlib.sha256()
+    for value in values:
+        encoded = value.encode()
+        hasher.update(len(encoded).to_bytes(8, "big"))
+        hasher.update(encoded)
+    return hasher.hexdigest()
+
+
+class PersistentCache:
+    """A small on-disk key/value store for caching derived data across Pants runs.
+
+    Entries are stored as individual files under `<root>/<name>/v<version>/`, named by the hex
+    digest of their key. Callers are responsible for choosing keys that capture all of the inputs
+    of the cached value (typically content digests), so entries are never invalidated; they are
+    only superseded. Bumping `version` supersedes all existing entries.
+
+    Reads and writes are best-effort: a missing, corrupt, or unreadable entry is reported as a
+    cache miss, and failures to write are logged and otherwise ignored, so that the cache can never
+    cause a run to fail.
+
+    Concurrent Pants processes (and threads) may share a cache. Each entry is written to a
+    temporary file and atomically renamed into place, so readers never observe a partial entry, and
+    concurrent writers of a key write the same value, so the last rename wins harmlessly.
+
+    Entries (of any version) which have not been read or written for `max_age` seconds are
+    deleted the first time that a process opens the cache. Pruning racing with another process at
+    worst deletes an entry which is in use, which is a cache miss.
+    """
+
+    DEFAULT_MAX_AGE: ClassVar[float] = 30 * 24 * 60 * 60
+
+    _pruned_dirs: ClassVar[set[Path]] = set()
+    _pruned_dirs_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        root: str | os.PathLike,
+        name: str,
+        *,
+        version: int,
+        max_age: float = DEFAULT_MAX_AGE,
+    ) -> None:
+        self._dir = Path(root) / name / f"v{version}"
+        with self._pruned_dirs_lock:
+            should_prune = self._dir not in self._pruned_dirs
+            self._pruned_dirs.add(self._dir)
+        if should_prune:
+            self.prune(max_age)
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self._dir / digest[:2] / digest
+
+    def prune(self, max_age: float) -> None:
+        """Delete the entries of this and other versions of the cache older than `max_age`
+        seconds."""
+        cutoff = time.time() - max_age
+        for version_dir in self._dir.parent.glob("v*"):
+            try:
+                shards = list(version_dir.iterdir())
+            except OSError:
+                continue
+            for shard in shards:
+                try:
+                    for path in shard.iterdir():
+                        if path.stat().st_mtime < cutoff:
+                            path.unlink()
+                except OSError as e:
+                    logger.debug(f"Failed to prune persistent cache entries in {shard}: {e}")
+
+    def load_bytes(self, key: str) -> bytes | None:
+        path = self._path_for(key)
+        try:
+            payload = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.debug(f"Failed to read persistent cache entry in {self._dir}: {e}")
+            return None
+        try:
+            # Mark the entry as recently used, so that it is not pruned.
+            os.utime(path)
+        except OSError:
+            pass
+        return payload
+
+    def store_bytes(self, key: str, payload: bytes) -> None:
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Failed to write persistent cache entry in {self._dir}: {e}")
+
+    def load_json(self, key: str) -> Any | None:
+        payload = self.load_bytes(key)
+        if payload is None:
+            return None
+        try:
+            return json.loads(payload)
+        except ValueError:
+            return None
+
+    def store_json(self, key: str, value: Any) -> None:
+        self.store_bytes(key, json.dumps(value, sort_keys=True).encode())
+
+    def load_pickle(self, key: str) -> Any | None:
+        payload = self.load_bytes(key)
+        if payload is None:
+            return None
+        try:
+            return pickle.loads(payload)
+        except Exception:
+            # An entry written by an incompatible version of a class is treated as a miss.
+            return None
+
+    def store_pickle(self, key: str, value: Any) -> None:
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            # E.g. a value which references a lambda. We simply don't cache it.
+            logger.debug(f"Not storing unpicklable persistent cache entry in {self._dir}: {e}")
+            return
+        self.store_bytes(key, payload)
@@ -0,0 +1,75 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+import os
+from pathlib import Path
+
+from pants.util.persistent_cache import PersistentCache, fingerprint_strings
+
+
+def test_fingerprint_strings() -> None:
+    assert fingerprint_strings(["a", "b"]) == fingerprint_strings(["a", "b"])
+    assert fingerprint_strings(["a", "b"]) != fingerprint_strings(["b", "a"])
+    # Length-prefixing means that concatenation boundaries matter.
+    assert fingerprint_strings(["ab", "c"]) != fingerprint_strings(["a", "bc"])
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    cache = PersistentCache(tmp_path, "test", version=1)
+    assert cache.load_json("k") is None
+    cache.store_json("k", {"a": [1, 2]})
+    assert cache.load_json("k") == {"a": [1, 2]}
+
+    cache.store_pickle("p", ("x", frozenset({1})))
+    assert cache.load_pickle("p") == ("x", frozenset({1}))
+
+    # A new instance sees the same entries.
+    assert PersistentCache(tmp_path, "test", version=1).load_json("k") == {"a": [1, 2]}
+
+
+def test_version_isolation(tmp_path: Path) -> None:
+    PersistentCache(tmp_path, "test", version=1).store_json("k", 1)
+    assert PersistentCache(tmp_path, "test", version=2).load_json("k") is None
+    assert PersistentCache(tmp_path, "other", version=1).load_json("k") is None
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path) -> None:
+    cache = PersistentCache(tmp_path, "test", version=1)
+    cache.store_bytes("k", b"{not json")
+    assert cache.load_json("k") is None
+    assert cache.load_pickle("k") is None
+
+
+def test_unpicklable_value_is_not_stored(tmp_path: Path) -> None:
+    cache = PersistentCache(tmp_path, "test", version=1)
+    cache.store_pickle("p", lambda: None)
+    assert cache.load_pickle("p") is None
+
+
+def test_prune(tmp_path: Path) -> None:
+    cache = PersistentCache(tmp_path, "test", version=2)
+    cache.store_json("old", 1)
+    cache.store_json("new", 2)
+
+    other_version = PersistentCache(tmp_path, "test", version=1)
+    other_version.store_json("k", 3)
+
+    cache.prune(max_age=60)
+    assert cache.load_json("old") == 1
+    assert other_version.load_json("k") == 3
+
+    os.utime(cache._path_for("old"), (0, 0))
+    os.utime(other_version._path_for("k"), (0, 0))
+    cache.prune(max_age=60)
+    assert cache.load_json("old") is None
+    assert cache.load_json("new") == 2
+    assert other_version.load_json("k") is None
+
+
+def test_reads_refresh_entries(tmp_path: Path) -> None:
+    cache = PersistentCache(tmp_path, "test", version=1)
+    cache.store_json("k", 1)
+    os.utime(cache._path_for("k"), (0, 0))
+    assert cache.load_json("k") == 1
+    cache.prune(max_age=60)
+    assert cache.load_json("k") == 1
@@ -142,6 +142,14 @@ class ChangedOptions:
         """Determines the files changed according to SCM/workspace and options."""
         return {cf.path for cf in self._changed_files(git_worktree)}
 
+    def added_files(self, git_worktree: GitWorktree) -> set[str]:
+        """Determines the files added according to SCM/workspace and options."""
+        return {
+            cf.path
+            for cf in self._changed_files(git_worktree)
+            if cf.change_type == ChangeType.ADDED
+        }
+
     def deleted_files(self, git_worktree: GitWorktree) -> set[str]:
         """Determines the files deleted according to SCM/workspace and options."""
         return {
@@ -210,5 +218,23 @@ async def get_deleted_files(changed: Changed) -> DeletedFiles:
     return DeletedFiles(deleted_files)
 
 
+@dataclass(frozen=True)
+class AddedFiles:
+    paths: tuple[str, ...]
+
+
+@rule
+async def get_added_files(changed: Changed) -> AddedFiles:
+    changed_options = ChangedOptions.from_options(changed.options)
+    if not changed_options.provided:
+        return AddedFiles(tuple())
+    maybe_git_worktree = await get_git_worktree(GitWorktreeRequest(), **implicitly())
+    if maybe_git_worktree.git_worktree:
+        added_files = tuple(sorted(changed_options.added_files(maybe_git_worktree.git_worktree)))
+    else:
+        added_files = tuple()
+    return AddedFiles(added_files)
+
+
 def rules():
     return [*collect_rules(), *dependents.rules()]
@@ -180,6 +180,27 @@ def test_unowned_file(repo: str) -> None:
     assert_count_loc(repo, expected_num_files=0)
 
 
+def test_tailor_ignore_modified_files(repo: str) -> None:
+    create_file("modified/old.sh", "")
+    _run_git(["add", "."])
+    _run_git(["commit", "-m", "Add an untargeted file."])
+    append_to_file("modified/old.sh", "# foo")
+    create_file("added/new.sh", "")
+
+    result = _run_pants_goal(repo, "tailor", extra_args=["--tailor-check"])
+    assert result.exit_code == 1
+    assert "Would create added/BUILD" in result.stdout
+    assert "Would create modified/BUILD" in result.stdout
+
+    # Only the directories of added (including untracked) or deleted files are considered.
+    result = _run_pants_goal(
+        repo, "tailor", extra_args=["--tailor-check", "--tailor-ignore-modified-files"]
+    )
+    assert result.exit_code == 1
+    assert "Would create added/BUILD" in result.stdout
+    assert "modified/BUILD" not in result.stdout
+
+
 def test_delete_generated_target(repo: str) -> None:
     """If a generated target is deleted, we claim the target generator was modified.
 
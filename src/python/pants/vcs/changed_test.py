@@ -0,0 +1,45 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pathlib import PurePath
+
+from pants.vcs.change import ChangedFile, ChangeType
+from pants.vcs.changed import ChangedOptions, DependentsOption
+from pants.vcs.git import GitBinary, GitWorktree
+
+
+class FakeGitWorktree(GitWorktree):
+    def __init__(self, changed_files: set[ChangedFile]) -> None:
+        super().__init__(binary=GitBinary(path="git"), worktree=PurePath("/fake"))
+        self._changed = changed_files
+
+    def changed_files(self, *args, **kwargs) -> set[ChangedFile]:
+        return self._changed
+
+    def changes_in(self, *args, **kwargs) -> set[ChangedFile]:
+        return self._changed
+
+
+def test_added_and_deleted_files() -> None:
+    git_worktree = FakeGitWorktree(
+        {
+            ChangedFile("added.py", ChangeType.ADDED),
+            ChangedFile("untracked.py", ChangeType.ADDED),
+            ChangedFile("modified.py", ChangeType.MODIFIED),
+            ChangedFile("deleted.py", ChangeType.DELETED),
+        }
+    )
+    for changed_options in (
+        ChangedOptions(since="HEAD", diffspec=None, dependents=DependentsOption.NONE),
+        ChangedOptions(since=None, diffspec="HEAD~1..HEAD", dependents=DependentsOption.NONE),
+    ):
+        assert changed_options.changed_files(git_worktree) == {
+            "added.py",
+            "untracked.py",
+            "modified.py",
+            "deleted.py",
+        }
+        assert changed_options.added_files(git_worktree) == {"added.py", "untracked.py"}
+        assert changed_options.deleted_files(git_worktree) == {"deleted.py"}